@@ -10,6 +10,12 @@ Creates high-quality pixel art sprites with smooth animations for:
 from PIL import Image, ImageDraw
 import os
 import math
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts"))
+from pose_rig import pose
+from sheet_compiler import mirror_frames
+from sprite_effects import OUTLINE, SHADOW, apply_effects
 
 # Output directory
 SPRITES_DIR = "assets/sprites/characters"
@@ -17,27 +23,33 @@ os.makedirs(SPRITES_DIR, exist_ok=True)
 
 # Sprite dimensions
 FRAME_SIZE = 32
-FRAMES_PER_DIRECTION = 4  # idle + 3 walk frames
+FRAMES_PER_DIRECTION = 4  # idle + 3 walk frames (any count works, see below)
+
+# Walk cycles as functions of the loop phase (see scripts/pose_rig.py);
+# frame 0 is the idle pose.
+PLAYER_WALK = {"bob": (-1, "bounce"), "leg_phase": (1, "swing"), "arm_swing": (2, "swing")}
+# Rows drawn as the mirror image of another direction's row
+MIRRORED_DIRECTIONS = {'right': 'left'}
 
+CHARLIE_WALK = {
+    "bob": (-2, "bounce"),
+    "leg_phase": (2, "swing"),
+    "tail_wag": (4, "bounce"),
+    "ear_flop": (1, "swing"),
+}
 
-def draw_outlined_ellipse(draw, bbox, fill, outline_color, outline_width=1):
-    """Draw an ellipse with outline."""
-    x1, y1, x2, y2 = bbox
-    # Draw outline first
-    draw.ellipse([x1-outline_width, y1-outline_width,
-                  x2+outline_width, y2+outline_width], fill=outline_color)
-    # Draw fill
-    draw.ellipse(bbox, fill=fill)
+# Ball bounce sheet: one row of squash/stretch frames
+BALL_SIZE = 16
+BALL_FRAMES = 8  # More frames for smoother animation
 
 
-def draw_outlined_rect(draw, bbox, fill, outline_color, outline_width=1):
-    """Draw a rectangle with outline."""
-    x1, y1, x2, y2 = bbox
-    # Draw outline first
-    draw.rectangle([x1-outline_width, y1-outline_width,
-                    x2+outline_width, y2+outline_width], fill=outline_color)
-    # Draw fill
-    draw.rectangle(bbox, fill=fill)
+def mirror_directions(sheet, directions):
+    """Fill every mirrored direction's row with its source row flipped frame by frame."""
+    width = sheet.size[0]
+    for target, source in MIRRORED_DIRECTIONS.items():
+        top = directions.index(source) * FRAME_SIZE
+        row = sheet.crop((0, top, width, top + FRAME_SIZE))
+        sheet.paste(mirror_frames(row, FRAME_SIZE), (0, directions.index(target) * FRAME_SIZE))
 
 
 def create_player_spritesheet():
@@ -62,41 +74,26 @@ def create_player_spritesheet():
     dress_highlight = (255, 160, 190, 255)
     eyes = (40, 80, 140, 255)
     eye_white = (255, 255, 255, 255)
-    outline = (60, 40, 35, 255)
     shoes = (140, 90, 60, 255)
 
     directions = ['down', 'left', 'right', 'up']
 
     for dir_idx, direction in enumerate(directions):
+        if direction in MIRRORED_DIRECTIONS:
+            continue  # Filled in by mirror_directions()
         for frame in range(FRAMES_PER_DIRECTION):
             img = Image.new('RGBA', (FRAME_SIZE, FRAME_SIZE), (0, 0, 0, 0))
             draw = ImageDraw.Draw(img)
 
             # Animation offsets
-            bob = 0
-            leg_phase = 0
-            arm_swing = 0
-
-            if frame > 0:  # Walking frames
-                if frame == 1:
-                    bob = -1
-                    leg_phase = 1
-                    arm_swing = 2
-                elif frame == 2:
-                    bob = 0
-                    leg_phase = 0
-                    arm_swing = 0
-                elif frame == 3:
-                    bob = -1
-                    leg_phase = -1
-                    arm_swing = -2
+            walk = pose(PLAYER_WALK, frame, FRAMES_PER_DIRECTION)
+            bob = walk["bob"]
+            leg_phase = walk["leg_phase"]
+            arm_swing = walk["arm_swing"]
 
             cx, cy = 16, 16
 
             if direction == 'down':
-                # Shadow
-                draw.ellipse([cx-7, cy+10, cx+7, cy+13], fill=(0, 0, 0, 40))
-
                 # Shoes/feet
                 draw.ellipse([cx-6+leg_phase, cy+8+bob, cx-2+leg_phase, cy+12+bob], fill=shoes)
                 draw.ellipse([cx+2-leg_phase, cy+8+bob, cx+6-leg_phase, cy+12+bob], fill=shoes)
@@ -148,9 +145,6 @@ def create_player_spritesheet():
                     draw.line([cx-1, cy-3+bob, cx+1, cy-3+bob], fill=(200, 100, 100, 255))
 
             elif direction == 'up':
-                # Shadow
-                draw.ellipse([cx-7, cy+10, cx+7, cy+13], fill=(0, 0, 0, 40))
-
                 # Shoes
                 draw.ellipse([cx-6+leg_phase, cy+8+bob, cx-2+leg_phase, cy+12+bob], fill=shoes)
                 draw.ellipse([cx+2-leg_phase, cy+8+bob, cx+6-leg_phase, cy+12+bob], fill=shoes)
@@ -178,9 +172,6 @@ def create_player_spritesheet():
                 draw.ellipse([cx-7, cy-8+bob, cx+7, cy+bob], fill=hair_shadow)
 
             elif direction == 'left':
-                # Shadow
-                draw.ellipse([cx-6, cy+10, cx+6, cy+13], fill=(0, 0, 0, 40))
-
                 # Back shoe
                 draw.ellipse([cx+1-leg_phase, cy+8+bob, cx+4-leg_phase, cy+12+bob], fill=shoes)
 
@@ -217,48 +208,10 @@ def create_player_spritesheet():
                 # Blush
                 draw.ellipse([cx-5, cy-5+bob, cx-2, cy-3+bob], fill=(255, 180, 180, 80))
 
-            elif direction == 'right':
-                # Shadow
-                draw.ellipse([cx-6, cy+10, cx+6, cy+13], fill=(0, 0, 0, 40))
-
-                # Back shoe
-                draw.ellipse([cx-4+leg_phase, cy+8+bob, cx-1+leg_phase, cy+12+bob], fill=shoes)
-
-                # Back leg
-                draw.rectangle([cx-4, cy+4+bob, cx-1, cy+9+bob-leg_phase], fill=skin_shadow)
-
-                # Dress
-                draw.ellipse([cx-5, cy-3+bob, cx+5, cy+7+bob], fill=dress)
-                draw.ellipse([cx-3, cy-1+bob, cx+3, cy+5+bob], fill=dress_highlight)
-
-                # Front shoe
-                draw.ellipse([cx+1-leg_phase, cy+8+bob, cx+4-leg_phase, cy+12+bob], fill=shoes)
-
-                # Front leg
-                draw.rectangle([cx+1, cy+4+bob, cx+4, cy+9+bob+leg_phase], fill=skin)
-
-                # Arm
-                draw.ellipse([cx-1, cy-1+bob, cx+3, cy+5+bob-arm_swing], fill=skin)
-
-                # Head
-                draw.ellipse([cx-4, cy-13+bob, cx+6, cy-2+bob], fill=skin)
-
-                # Hair
-                draw.ellipse([cx-5, cy-15+bob, cx+7, cy-7+bob], fill=hair)
-                draw.ellipse([cx+2, cy-14+bob, cx+6, cy-9+bob], fill=hair_highlight)
-                draw.ellipse([cx-6, cy-12+bob, cx-2, cy-3+bob], fill=hair)  # Back hair
-                draw.ellipse([cx-5, cy-10+bob, cx-3, cy-5+bob], fill=hair_shadow)
-
-                # Eye
-                draw.ellipse([cx+1, cy-9+bob, cx+4, cy-5+bob], fill=eye_white)
-                draw.ellipse([cx+2, cy-8+bob, cx+4, cy-5+bob], fill=eyes)
-                draw.point((cx+3, cy-7+bob), fill=(255, 255, 255, 255))
-
-                # Blush
-                draw.ellipse([cx+2, cy-5+bob, cx+5, cy-3+bob], fill=(255, 180, 180, 80))
-
             sheet.paste(img, (frame * FRAME_SIZE, dir_idx * FRAME_SIZE))
 
+    mirror_directions(sheet, directions)
+    sheet = apply_effects(sheet, FRAME_SIZE, outline=OUTLINE, shadow=SHADOW)
     sheet.save(os.path.join(SPRITES_DIR, "player_spritesheet.png"))
     print(f"Created player_spritesheet.png ({sheet_width}x{sheet_height})")
 
@@ -296,40 +249,23 @@ def create_charlie_spritesheet():
     directions = ['down', 'left', 'right', 'up']
 
     for dir_idx, direction in enumerate(directions):
+        if direction in MIRRORED_DIRECTIONS:
+            continue  # Filled in by mirror_directions()
         for frame in range(FRAMES_PER_DIRECTION):
             img = Image.new('RGBA', (FRAME_SIZE, FRAME_SIZE), (0, 0, 0, 0))
             draw = ImageDraw.Draw(img)
 
             # Animation - bouncy and adorable
-            bob = 0
-            leg_phase = 0
-            tail_wag = 0
-            ear_flop = 0
+            walk = pose(CHARLIE_WALK, frame, FRAMES_PER_DIRECTION)
+            bob = walk["bob"]
+            leg_phase = walk["leg_phase"]
+            tail_wag = walk["tail_wag"]
+            ear_flop = walk["ear_flop"]
             happy = frame > 0
 
-            if frame > 0:
-                if frame == 1:
-                    bob = -2
-                    leg_phase = 2
-                    tail_wag = 4
-                    ear_flop = 1
-                elif frame == 2:
-                    bob = 0
-                    leg_phase = 0
-                    tail_wag = 0
-                    ear_flop = 0
-                elif frame == 3:
-                    bob = -2
-                    leg_phase = -2
-                    tail_wag = 4
-                    ear_flop = -1
-
             cx, cy = 16, 17
 
             if direction == 'down':
-                # Shadow
-                draw.ellipse([cx-8, cy+6, cx+8, cy+10], fill=(0, 0, 0, 25))
-
                 # Fluffy tail wagging behind
                 tail_x = cx + 5 + tail_wag
                 draw.ellipse([tail_x-4, cy-6+bob, tail_x+4, cy+bob], fill=fur_cream)
@@ -393,9 +329,6 @@ def create_charlie_spritesheet():
                     draw.arc([cx-2, cy-2+bob, cx+2, cy+bob], 0, 180, fill=(60, 50, 50, 255), width=1)
 
             elif direction == 'up':
-                # Shadow
-                draw.ellipse([cx-8, cy+6, cx+8, cy+10], fill=(0, 0, 0, 25))
-
                 # Fluffy tail prominent from behind
                 tail_x = cx + tail_wag
                 draw.ellipse([tail_x-5, cy-12+bob, tail_x+5, cy-4+bob], fill=fur_cream)
@@ -424,9 +357,6 @@ def create_charlie_spritesheet():
                 draw.ellipse([cx-6, cy-15+bob, cx+6, cy-9+bob], fill=fur_fluff)
 
             elif direction == 'left':
-                # Shadow
-                draw.ellipse([cx-7, cy+6, cx+7, cy+10], fill=(0, 0, 0, 25))
-
                 # Fluffy tail wagging
                 tail_y = cy - 5 - tail_wag
                 draw.ellipse([cx+4, tail_y+bob, cx+13, tail_y+7+bob], fill=fur_cream)
@@ -478,63 +408,10 @@ def create_charlie_spritesheet():
                 if happy:
                     draw.ellipse([cx-12, cy-1+bob, cx-9, cy+2+bob], fill=tongue)
 
-            elif direction == 'right':
-                # Shadow
-                draw.ellipse([cx-7, cy+6, cx+7, cy+10], fill=(0, 0, 0, 25))
-
-                # Fluffy tail wagging
-                tail_y = cy - 5 - tail_wag
-                draw.ellipse([cx-13, tail_y+bob, cx-4, tail_y+7+bob], fill=fur_cream)
-                draw.ellipse([cx-12, tail_y+1+bob, cx-5, tail_y+5+bob], fill=fur_white)
-                draw.ellipse([cx-11, tail_y+2+bob, cx-6, tail_y+4+bob], fill=fur_fluff)
-
-                # Fluffy body
-                draw.ellipse([cx-7, cy-3+bob, cx+5, cy+6+bob], fill=fur_cream)
-                draw.ellipse([cx-5, cy-1+bob, cx+3, cy+4+bob], fill=fur_white)
-
-                # Tiny paws
-                draw.ellipse([cx+1, cy+4+bob, cx+5, cy+8+bob+leg_phase], fill=fur_light)
-                draw.ellipse([cx-5, cy+4+bob, cx-1, cy+8+bob-leg_phase], fill=fur_shadow)
-
-                # Big fluffy head looking right
-                draw.ellipse([cx-2, cy-14+bob, cx+13, cy-1+bob], fill=fur_cream)
-                draw.ellipse([cx, cy-12+bob, cx+11, cy-3+bob], fill=fur_white)
-
-                # Long ear
-                draw.ellipse([cx-5, cy-13+bob+ear_flop, cx+3, cy-2+bob+ear_flop], fill=fur_shadow)
-                draw.ellipse([cx-4, cy-12+bob+ear_flop, cx+2, cy-3+bob+ear_flop], fill=fur_cream)
-                draw.ellipse([cx-3, cy-11+bob+ear_flop, cx+1, cy-4+bob+ear_flop], fill=inner_ear)
-
-                # Top fluff
-                draw.ellipse([cx+3, cy-15+bob, cx+10, cy-10+bob], fill=fur_fluff)
-
-                # Face fluff
-                draw.ellipse([cx+4, cy-9+bob, cx+11, cy-1+bob], fill=fur_white)
-                draw.ellipse([cx+5, cy-8+bob, cx+10, cy-2+bob], fill=fur_fluff)
-
-                # Big eye
-                draw.ellipse([cx+4, cy-11+bob, cx+10, cy-5+bob], fill=eye_brown)
-                draw.ellipse([cx+5, cy-10+bob, cx+9, cy-6+bob], fill=eye_black)
-                draw.ellipse([cx+6, cy-10+bob, cx+8, cy-8+bob], fill=eye_shine)
-                draw.ellipse([cx+6, cy-7+bob, cx+7, cy-6+bob], fill=eye_shine2)
-
-                # Blush
-                draw.ellipse([cx+8, cy-5+bob, cx+12, cy-3+bob], fill=blush)
-
-                # Muzzle fluff
-                draw.ellipse([cx+7, cy-6+bob, cx+14, cy-1+bob], fill=fur_cream)
-                draw.ellipse([cx+8, cy-5+bob, cx+13, cy-2+bob], fill=fur_fluff)
-
-                # Nose
-                draw.ellipse([cx+10, cy-4+bob, cx+14, cy-1+bob], fill=nose_black)
-                draw.point((cx+13, cy-3+bob), fill=nose_shine)
-
-                # Tongue
-                if happy:
-                    draw.ellipse([cx+9, cy-1+bob, cx+12, cy+2+bob], fill=tongue)
-
             sheet.paste(img, (frame * FRAME_SIZE, dir_idx * FRAME_SIZE))
 
+    mirror_directions(sheet, directions)
+    sheet = apply_effects(sheet, FRAME_SIZE, outline=OUTLINE, shadow=SHADOW)
     sheet.save(os.path.join(SPRITES_DIR, "charlie_spritesheet.png"))
     print(f"Created charlie_spritesheet.png ({sheet_width}x{sheet_height})")
 
@@ -544,8 +421,8 @@ def create_ball_spritesheet():
 
     Layout: 8 frames showing squash/stretch cycle for bouncing.
     """
-    size = 16
-    frames = 8  # More frames for smoother animation
+    size = BALL_SIZE
+    frames = BALL_FRAMES
     sheet = Image.new('RGBA', (size * frames, size), (0, 0, 0, 0))
 
     # Colors - bright red ball with shine
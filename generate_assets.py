@@ -6,6 +6,16 @@ Generate pixel art assets for Charlie's Island Adventure
 from PIL import Image, ImageDraw
 import os
 import random
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts"))
+from accum_canvas import AccumCanvas
+from gradient import gradient_image
+from scaled_draw import render
+from scatter import scatter, stamp, ellipse, shell
+from shape_program import place
 
 # Ensure assets directories exist
 os.makedirs("assets/sprites/characters", exist_ok=True)
@@ -83,212 +93,208 @@ COLORS = {
     'transparent': (0, 0, 0, 0),
 }
 
+CHARLIE_PALETTE = {
+    'cream': COLORS['charlie_body'],
+    'shadow': COLORS['charlie_body_shadow'],
+    'pink': (255, 210, 200),
+    'eye': (30, 25, 25),
+    'iris': (50, 45, 45),
+    'shine': (255, 255, 255),
+    'glint': (200, 200, 200),
+}
 
-def create_charlie_sprite(size=32):
-    """Create Charlie the baby Shih Tzu sprite - cute and fluffy!"""
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-
-    # Scale factor
-    s = size // 32
-
+# Charlie's repeated parts (see scripts/shape_program.py). Ears are the left
+# ear anchored on the face's centre column (flip for the right one); eyes and
+# paws are anchored at their top-left corner.
+CHARLIE_EAR = (
+    ('ellipse', (-14, 8, -6, 20), 'shadow'),
+    ('ellipse', (-13, 9, -7, 18), 'cream'),
+    ('ellipse', (-12, 10, -8, 16), 'pink'),
+    # Ear fluff
+    *(('ellipse', (-14, fy, -11, fy + 3), 'cream') for fy in range(12, 19, 2)),
+)
+CHARLIE_EYE = (
+    ('ellipse', (0, 0, 6, 6), 'eye'),
+    ('ellipse', (1, 1, 5, 5), 'iris'),  # Slight gradient
+    ('ellipse', (2, 1, 4, 3), 'shine'),
+    ('point', (4, 4), 'glint'),  # Small secondary highlight
+)
+CHARLIE_PAW = (
+    ('ellipse', (0, 0, 4, 4), 'cream'),
+    ('ellipse', (1, 2, 3, 4), 'pink'),  # Paw pad
+)
+
+# The same parts on the 48x48 in-box grid
+BOX_CHARLIE_EAR = (
+    ('ellipse', (-18, 12, -8, 28), 'shadow'),
+    ('ellipse', (-17, 13, -9, 26), 'cream'),
+    ('ellipse', (-16, 14, -10, 22), 'pink'),
+)
+BOX_CHARLIE_EYE = (
+    ('ellipse', (0, 0, 8, 8), 'eye'),
+    ('ellipse', (1, 1, 7, 7), 'iris'),
+    ('ellipse', (2, 1, 5, 4), 'shine'),
+    ('point', (5, 5), 'glint'),
+)
+BOX_CHARLIE_PAW = (
+    ('ellipse', (0, 0, 8, 8), 'cream'),
+    ('ellipse', (2, 4, 6, 8), 'pink'),
+)
+
+
+def create_charlie_sprite(size=32, supersample=1):
+    """Create Charlie the baby Shih Tzu sprite - cute and fluffy!
+
+    Drawn on a 32x32 design grid and rasterized at any size.
+    """
+    return render(paint_charlie, 32, size, supersample)
+
+
+def paint_charlie(draw):
+    """Draw Charlie on the 32x32 design grid (draw is a ScaledDraw)."""
     # Colors for cuter appearance
     cream = COLORS['charlie_body']
     cream_shadow = COLORS['charlie_body_shadow']
     cream_highlight = (255, 250, 245)
-    pink_inner_ear = (255, 210, 200)
     nose_black = COLORS['charlie_nose']
-    eye_black = (30, 25, 25)
-    eye_shine = (255, 255, 255)
     tongue_pink = COLORS['charlie_tongue']
     outline = (180, 170, 160)
 
     # Fluffy body (solid base, then add texture)
-    draw.ellipse([9*s, 16*s, 23*s, 28*s], fill=cream)
-    draw.ellipse([10*s, 17*s, 22*s, 26*s], fill=cream_highlight)
-    draw.ellipse([9*s, 20*s, 23*s, 28*s], fill=cream_shadow)
+    draw.ellipse([9, 16, 23, 28], fill=cream)
+    draw.ellipse([10, 17, 22, 26], fill=cream_highlight)
+    draw.ellipse([9, 20, 23, 28], fill=cream_shadow)
 
     # Add fluffy texture to body edges
     for i in range(8):
         angle = i * 45
         import math
-        bx = int(16*s + 7*s * math.cos(math.radians(angle + 180)))
-        by = int(22*s + 5*s * math.sin(math.radians(angle + 180)))
-        if 0 <= bx < size and 0 <= by < size:
-            draw.ellipse([bx-1*s, by-1*s, bx+2*s, by+2*s], fill=cream)
+        bx = int(16 + 7 * math.cos(math.radians(angle + 180)))
+        by = int(22 + 5 * math.sin(math.radians(angle + 180)))
+        if 0 <= bx < 32 and 0 <= by < 32:
+            draw.ellipse([bx-1, by-1, bx+2, by+2], fill=cream)
 
     # Floppy ears (behind head) - characteristic Shih Tzu floppy ears
-    # Left ear
-    draw.ellipse([2*s, 8*s, 10*s, 20*s], fill=cream_shadow)
-    draw.ellipse([3*s, 9*s, 9*s, 18*s], fill=cream)
-    draw.ellipse([4*s, 10*s, 8*s, 16*s], fill=pink_inner_ear)
-    # Ear fluff
-    for fy in range(12*s, 19*s, 2*s):
-        draw.ellipse([2*s, fy, 5*s, fy+3*s], fill=cream)
-
-    # Right ear
-    draw.ellipse([22*s, 8*s, 30*s, 20*s], fill=cream_shadow)
-    draw.ellipse([23*s, 9*s, 29*s, 18*s], fill=cream)
-    draw.ellipse([24*s, 10*s, 28*s, 16*s], fill=pink_inner_ear)
-    # Ear fluff
-    for fy in range(12*s, 19*s, 2*s):
-        draw.ellipse([27*s, fy, 30*s, fy+3*s], fill=cream)
+    place(draw.image, draw, CHARLIE_EAR, 16, 0, CHARLIE_PALETTE)
+    place(draw.image, draw, CHARLIE_EAR, 16, 0, CHARLIE_PALETTE, flip=True)
 
     # Big fluffy head (Shih Tzus have round fluffy faces)
-    draw.ellipse([6*s, 4*s, 26*s, 20*s], fill=cream)
-    draw.ellipse([7*s, 5*s, 25*s, 18*s], fill=cream_highlight)
+    draw.ellipse([6, 4, 26, 20], fill=cream)
+    draw.ellipse([7, 5, 25, 18], fill=cream_highlight)
 
     # Forehead fluff (topknot - signature Shih Tzu feature)
-    draw.ellipse([10*s, 2*s, 22*s, 10*s], fill=cream)
-    draw.ellipse([12*s, 1*s, 20*s, 7*s], fill=cream_highlight)
+    draw.ellipse([10, 2, 22, 10], fill=cream)
+    draw.ellipse([12, 1, 20, 7], fill=cream_highlight)
     # Little fluff tufts on top
-    draw.ellipse([13*s, 0*s, 16*s, 4*s], fill=cream)
-    draw.ellipse([16*s, 0*s, 19*s, 4*s], fill=cream)
+    draw.ellipse([13, 0, 16, 4], fill=cream)
+    draw.ellipse([16, 0, 19, 4], fill=cream)
 
     # Cheek fluff
-    draw.ellipse([4*s, 10*s, 12*s, 18*s], fill=cream)
-    draw.ellipse([20*s, 10*s, 28*s, 18*s], fill=cream)
+    draw.ellipse([4, 10, 12, 18], fill=cream)
+    draw.ellipse([20, 10, 28, 18], fill=cream)
 
     # Snout area (lighter, slightly protruding)
-    draw.ellipse([11*s, 12*s, 21*s, 19*s], fill=cream_highlight)
+    draw.ellipse([11, 12, 21, 19], fill=cream_highlight)
 
     # BIG cute eyes (larger = cuter, Shih Tzus have big round eyes)
-    # Left eye
-    draw.ellipse([8*s, 8*s, 14*s, 14*s], fill=eye_black)
-    draw.ellipse([9*s, 9*s, 13*s, 13*s], fill=(50, 45, 45))  # Slight gradient
-    # Eye shine (multiple highlights for sparkle)
-    draw.ellipse([10*s, 9*s, 12*s, 11*s], fill=eye_shine)
-    draw.point((12*s, 12*s), fill=(200, 200, 200))  # Small secondary highlight
-
-    # Right eye
-    draw.ellipse([18*s, 8*s, 24*s, 14*s], fill=eye_black)
-    draw.ellipse([19*s, 9*s, 23*s, 13*s], fill=(50, 45, 45))
-    # Eye shine
-    draw.ellipse([20*s, 9*s, 22*s, 11*s], fill=eye_shine)
-    draw.point((22*s, 12*s), fill=(200, 200, 200))
+    place(draw.image, draw, CHARLIE_EYE, 8, 8, CHARLIE_PALETTE)
+    place(draw.image, draw, CHARLIE_EYE, 18, 8, CHARLIE_PALETTE)
 
     # Cute button nose (heart-shaped for extra cuteness)
-    draw.ellipse([14*s, 13*s, 18*s, 16*s], fill=nose_black)
+    draw.ellipse([14, 13, 18, 16], fill=nose_black)
     # Nose highlight
-    draw.ellipse([15*s, 13*s, 16*s, 14*s], fill=(80, 75, 75))
+    draw.ellipse([15, 13, 16, 14], fill=(80, 75, 75))
 
     # Happy little mouth with tongue
-    draw.arc([13*s, 15*s, 16*s, 18*s], 0, 180, fill=outline, width=s)
-    draw.arc([16*s, 15*s, 19*s, 18*s], 0, 180, fill=outline, width=s)
+    draw.arc([13, 15, 16, 18], 0, 180, fill=outline, width=1)
+    draw.arc([16, 15, 19, 18], 0, 180, fill=outline, width=1)
     # Little pink tongue poking out
-    draw.ellipse([15*s, 17*s, 17*s, 20*s], fill=tongue_pink)
-    draw.ellipse([15*s, 17*s, 17*s, 18*s], fill=(255, 180, 180))
+    draw.ellipse([15, 17, 17, 20], fill=tongue_pink)
+    draw.ellipse([15, 17, 17, 18], fill=(255, 180, 180))
 
     # Tiny paws peeking out
-    draw.ellipse([10*s, 25*s, 14*s, 29*s], fill=cream)
-    draw.ellipse([18*s, 25*s, 22*s, 29*s], fill=cream)
-    # Paw pads (tiny pink dots)
-    draw.ellipse([11*s, 27*s, 13*s, 29*s], fill=pink_inner_ear)
-    draw.ellipse([19*s, 27*s, 21*s, 29*s], fill=pink_inner_ear)
+    place(draw.image, draw, CHARLIE_PAW, 10, 25, CHARLIE_PALETTE)
+    place(draw.image, draw, CHARLIE_PAW, 18, 25, CHARLIE_PALETTE)
 
     # Fluffy tail (curled up - Shih Tzus have curled tails)
-    draw.ellipse([23*s, 18*s, 29*s, 24*s], fill=cream)
-    draw.ellipse([24*s, 17*s, 28*s, 21*s], fill=cream_highlight)
+    draw.ellipse([23, 18, 29, 24], fill=cream)
+    draw.ellipse([24, 17, 28, 21], fill=cream_highlight)
 
-    return img
 
+def create_charlie_in_box(size=48, supersample=1):
+    """Create Charlie peeking out of cardboard box - adorable version!
 
-def create_charlie_in_box(size=48):
-    """Create Charlie peeking out of cardboard box - adorable version!"""
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
+    Drawn on a 48x48 design grid and rasterized at any size.
+    """
+    return render(paint_charlie_in_box, 48, size, supersample)
 
-    s = size // 48
 
+def paint_charlie_in_box(draw):
+    """Draw Charlie in the box on the 48x48 design grid (draw is a ScaledDraw)."""
     # Colors
     cream = COLORS['charlie_body']
-    cream_shadow = COLORS['charlie_body_shadow']
     cream_highlight = (255, 250, 245)
-    pink_inner_ear = (255, 210, 200)
     nose_black = COLORS['charlie_nose']
-    eye_black = (30, 25, 25)
-    eye_shine = (255, 255, 255)
     tongue_pink = COLORS['charlie_tongue']
 
     # Box back
-    draw.rectangle([4*s, 24*s, 44*s, 46*s], fill=COLORS['cardboard_dark'])
+    draw.rectangle([4, 24, 44, 46], fill=COLORS['cardboard_dark'])
 
     # Box front
-    draw.rectangle([4*s, 30*s, 44*s, 46*s], fill=COLORS['cardboard'])
+    draw.rectangle([4, 30, 44, 46], fill=COLORS['cardboard'])
 
     # Box sides shading
-    draw.rectangle([4*s, 30*s, 8*s, 46*s], fill=COLORS['cardboard_dark'])
-    draw.rectangle([40*s, 30*s, 44*s, 46*s], fill=COLORS['cardboard_dark'])
+    draw.rectangle([4, 30, 8, 46], fill=COLORS['cardboard_dark'])
+    draw.rectangle([40, 30, 44, 46], fill=COLORS['cardboard_dark'])
 
     # Box flap left
-    points = [(4*s, 30*s), (8*s, 24*s), (16*s, 26*s), (12*s, 32*s)]
+    points = [(4, 30), (8, 24), (16, 26), (12, 32)]
     draw.polygon(points, fill=COLORS['cardboard_light'])
 
     # Box flap right
-    points = [(44*s, 30*s), (40*s, 24*s), (32*s, 26*s), (36*s, 32*s)]
+    points = [(44, 30), (40, 24), (32, 26), (36, 32)]
     draw.polygon(points, fill=COLORS['cardboard_light'])
 
-    # Floppy ears (behind head)
-    # Left ear - drooping down
-    draw.ellipse([6*s, 12*s, 16*s, 28*s], fill=cream_shadow)
-    draw.ellipse([7*s, 13*s, 15*s, 26*s], fill=cream)
-    draw.ellipse([8*s, 14*s, 14*s, 22*s], fill=pink_inner_ear)
-
-    # Right ear
-    draw.ellipse([32*s, 12*s, 42*s, 28*s], fill=cream_shadow)
-    draw.ellipse([33*s, 13*s, 41*s, 26*s], fill=cream)
-    draw.ellipse([34*s, 14*s, 40*s, 22*s], fill=pink_inner_ear)
+    # Floppy ears (behind head), drooping down
+    place(draw.image, draw, BOX_CHARLIE_EAR, 24, 0, CHARLIE_PALETTE)
+    place(draw.image, draw, BOX_CHARLIE_EAR, 24, 0, CHARLIE_PALETTE, flip=True)
 
     # Big fluffy head
-    draw.ellipse([12*s, 6*s, 36*s, 28*s], fill=cream)
-    draw.ellipse([14*s, 8*s, 34*s, 26*s], fill=cream_highlight)
+    draw.ellipse([12, 6, 36, 28], fill=cream)
+    draw.ellipse([14, 8, 34, 26], fill=cream_highlight)
 
     # Forehead fluff (topknot)
-    draw.ellipse([16*s, 2*s, 32*s, 14*s], fill=cream)
-    draw.ellipse([18*s, 1*s, 30*s, 10*s], fill=cream_highlight)
+    draw.ellipse([16, 2, 32, 14], fill=cream)
+    draw.ellipse([18, 1, 30, 10], fill=cream_highlight)
     # Tufts
-    draw.ellipse([19*s, 0*s, 24*s, 6*s], fill=cream)
-    draw.ellipse([24*s, 0*s, 29*s, 6*s], fill=cream)
+    draw.ellipse([19, 0, 24, 6], fill=cream)
+    draw.ellipse([24, 0, 29, 6], fill=cream)
 
     # Cheek fluff
-    draw.ellipse([10*s, 14*s, 20*s, 24*s], fill=cream)
-    draw.ellipse([28*s, 14*s, 38*s, 24*s], fill=cream)
+    draw.ellipse([10, 14, 20, 24], fill=cream)
+    draw.ellipse([28, 14, 38, 24], fill=cream)
 
     # Snout area
-    draw.ellipse([17*s, 16*s, 31*s, 26*s], fill=cream_highlight)
+    draw.ellipse([17, 16, 31, 26], fill=cream_highlight)
 
     # BIG cute eyes
-    # Left eye
-    draw.ellipse([14*s, 12*s, 22*s, 20*s], fill=eye_black)
-    draw.ellipse([15*s, 13*s, 21*s, 19*s], fill=(50, 45, 45))
-    draw.ellipse([16*s, 13*s, 19*s, 16*s], fill=eye_shine)
-    draw.point((19*s, 17*s), fill=(200, 200, 200))
-
-    # Right eye
-    draw.ellipse([26*s, 12*s, 34*s, 20*s], fill=eye_black)
-    draw.ellipse([27*s, 13*s, 33*s, 19*s], fill=(50, 45, 45))
-    draw.ellipse([28*s, 13*s, 31*s, 16*s], fill=eye_shine)
-    draw.point((31*s, 17*s), fill=(200, 200, 200))
+    place(draw.image, draw, BOX_CHARLIE_EYE, 14, 12, CHARLIE_PALETTE)
+    place(draw.image, draw, BOX_CHARLIE_EYE, 26, 12, CHARLIE_PALETTE)
 
     # Cute button nose
-    draw.ellipse([21*s, 18*s, 27*s, 23*s], fill=nose_black)
-    draw.ellipse([22*s, 18*s, 24*s, 20*s], fill=(80, 75, 75))
+    draw.ellipse([21, 18, 27, 23], fill=nose_black)
+    draw.ellipse([22, 18, 24, 20], fill=(80, 75, 75))
 
     # Happy mouth with tongue
-    draw.arc([19*s, 21*s, 23*s, 26*s], 0, 180, fill=(180, 170, 160), width=s)
-    draw.arc([25*s, 21*s, 29*s, 26*s], 0, 180, fill=(180, 170, 160), width=s)
+    draw.arc([19, 21, 23, 26], 0, 180, fill=(180, 170, 160), width=1)
+    draw.arc([25, 21, 29, 26], 0, 180, fill=(180, 170, 160), width=1)
     # Tongue
-    draw.ellipse([22*s, 24*s, 26*s, 29*s], fill=tongue_pink)
-    draw.ellipse([23*s, 24*s, 25*s, 26*s], fill=(255, 180, 180))
+    draw.ellipse([22, 24, 26, 29], fill=tongue_pink)
+    draw.ellipse([23, 24, 25, 26], fill=(255, 180, 180))
 
     # Cute paws resting on box edge
-    draw.ellipse([14*s, 28*s, 22*s, 36*s], fill=cream)
-    draw.ellipse([26*s, 28*s, 34*s, 36*s], fill=cream)
-    # Paw pads
-    draw.ellipse([16*s, 32*s, 20*s, 36*s], fill=pink_inner_ear)
-    draw.ellipse([28*s, 32*s, 32*s, 36*s], fill=pink_inner_ear)
-
-    return img
+    place(draw.image, draw, BOX_CHARLIE_PAW, 14, 28, CHARLIE_PALETTE)
+    place(draw.image, draw, BOX_CHARLIE_PAW, 26, 28, CHARLIE_PALETTE)
 
 
 def create_raft(size=64):
@@ -322,16 +328,9 @@ def create_raft(size=64):
 
 def create_storm_sky(width=426, height=160):
     """Create stormy sky with dark clouds"""
-    img = Image.new('RGBA', (width, height), COLORS['storm_sky_dark'])
-    draw = ImageDraw.Draw(img)
-
     # Gradient sky
-    for y in range(height):
-        ratio = y / height
-        r = int(COLORS['storm_sky_dark'][0] * (1-ratio) + COLORS['storm_sky_mid'][0] * ratio)
-        g = int(COLORS['storm_sky_dark'][1] * (1-ratio) + COLORS['storm_sky_mid'][1] * ratio)
-        b = int(COLORS['storm_sky_dark'][2] * (1-ratio) + COLORS['storm_sky_mid'][2] * ratio)
-        draw.line([(0, y), (width, y)], fill=(r, g, b))
+    img = gradient_image((width, height), [(0, COLORS['storm_sky_dark']), (1, COLORS['storm_sky_mid'])])
+    draw = ImageDraw.Draw(img)
 
     # Storm clouds - multiple layers
     random.seed(42)  # Reproducible
@@ -351,17 +350,10 @@ def create_storm_sky(width=426, height=160):
 
 def create_storm_ocean(width=426, height=120):
     """Create stormy ocean with waves"""
-    img = Image.new('RGBA', (width, height), COLORS['ocean_storm_dark'])
+    # Base gradient - only goes halfway towards the mid colour
+    img = gradient_image((width, height), [(0, COLORS['ocean_storm_dark']), (2, COLORS['ocean_storm_mid'])])
     draw = ImageDraw.Draw(img)
 
-    # Base gradient
-    for y in range(height):
-        ratio = y / height
-        r = int(COLORS['ocean_storm_dark'][0] * (1-ratio*0.5) + COLORS['ocean_storm_mid'][0] * ratio*0.5)
-        g = int(COLORS['ocean_storm_dark'][1] * (1-ratio*0.5) + COLORS['ocean_storm_mid'][1] * ratio*0.5)
-        b = int(COLORS['ocean_storm_dark'][2] * (1-ratio*0.5) + COLORS['ocean_storm_mid'][2] * ratio*0.5)
-        draw.line([(0, y), (width, y)], fill=(r, g, b))
-
     # Waves
     random.seed(123)
     for wave_y in range(0, height, 12):
@@ -435,128 +427,98 @@ def create_wind_line(width=64, height=8):
 
 def create_beach_sand(width=426, height=120):
     """Create sandy beach texture"""
-    img = Image.new('RGBA', (width, height), COLORS['sand_mid'])
-    draw = ImageDraw.Draw(img)
+    # Base gradient (wet sand near the water line at the top)
+    img = gradient_image((width, height), [(0, COLORS['sand_wet']), (0.3, COLORS['sand_mid'])])
 
-    # Base gradient (wet near water)
-    for y in range(height):
-        ratio = y / height
-        if ratio < 0.3:
-            # Wet sand near top (water line)
-            r = int(COLORS['sand_wet'][0] + (COLORS['sand_mid'][0] - COLORS['sand_wet'][0]) * (ratio / 0.3))
-            g = int(COLORS['sand_wet'][1] + (COLORS['sand_mid'][1] - COLORS['sand_wet'][1]) * (ratio / 0.3))
-            b = int(COLORS['sand_wet'][2] + (COLORS['sand_mid'][2] - COLORS['sand_wet'][2]) * (ratio / 0.3))
-        else:
-            r, g, b = COLORS['sand_mid']
-        draw.line([(0, y), (width, y)], fill=(r, g, b))
-
-    # Sand texture - random dots
-    random.seed(456)
-    for _ in range(800):
-        x = random.randint(0, width-1)
-        y = random.randint(0, height-1)
-        color = random.choice([COLORS['sand_light'], COLORS['sand_dark'], COLORS['sand_mid']])
-        size = random.randint(1, 3)
-        draw.ellipse([x, y, x+size, y+size], fill=color)
+    # Sand texture - random dots of size 1-3
+    rng = np.random.default_rng(456)
+    count = 800
+    dot_colors = np.array([COLORS['sand_light'], COLORS['sand_dark'], COLORS['sand_mid']])
+    scatter(img, rng.integers(0, width, count), rng.integers(0, height, count),
+            dot_colors[rng.integers(0, 3, count)],
+            [stamp(ellipse, size, size) for size in (1, 2, 3)], rng.integers(0, 3, count))
 
     # Scattered shells
-    for _ in range(12):
-        x = random.randint(10, width-20)
-        y = random.randint(30, height-20)
-        color = random.choice([COLORS['shell_pink'], COLORS['shell_white']])
-        # Simple shell shape
-        draw.ellipse([x, y, x+6, y+4], fill=color)
-        draw.arc([x, y, x+6, y+4], 0, 180, fill=COLORS['sand_dark'])
+    count = 12
+    shell_colors = np.array([COLORS['shell_pink'], COLORS['shell_white']])
+    scatter(img, rng.integers(10, width-19, count), rng.integers(30, height-19, count),
+            shell_colors[rng.integers(0, 2, count)], [stamp(shell, 6, 4)],
+            accents=COLORS['sand_dark'])
 
     # Small pebbles
-    for _ in range(20):
-        x = random.randint(0, width-1)
-        y = random.randint(0, height-1)
-        draw.ellipse([x, y, x+2, y+2], fill=COLORS['driftwood'])
+    count = 20
+    scatter(img, rng.integers(0, width, count), rng.integers(0, height, count),
+            COLORS['driftwood'], [stamp(ellipse, 2, 2)])
 
     return img
 
 
 def create_beach_ocean(width=426, height=80):
     """Create calm beach ocean with waves"""
-    img = Image.new('RGBA', (width, height), COLORS['ocean_deep'])
-    draw = ImageDraw.Draw(img)
-
     # Gradient from deep to shallow
-    for y in range(height):
-        ratio = y / height
-        if ratio < 0.5:
-            r = int(COLORS['ocean_deep'][0] + (COLORS['ocean_mid'][0] - COLORS['ocean_deep'][0]) * (ratio * 2))
-            g = int(COLORS['ocean_deep'][1] + (COLORS['ocean_mid'][1] - COLORS['ocean_deep'][1]) * (ratio * 2))
-            b = int(COLORS['ocean_deep'][2] + (COLORS['ocean_mid'][2] - COLORS['ocean_deep'][2]) * (ratio * 2))
-        else:
-            r = int(COLORS['ocean_mid'][0] + (COLORS['ocean_shallow'][0] - COLORS['ocean_mid'][0]) * ((ratio - 0.5) * 2))
-            g = int(COLORS['ocean_mid'][1] + (COLORS['ocean_shallow'][1] - COLORS['ocean_mid'][1]) * ((ratio - 0.5) * 2))
-            b = int(COLORS['ocean_mid'][2] + (COLORS['ocean_shallow'][2] - COLORS['ocean_mid'][2]) * ((ratio - 0.5) * 2))
-        draw.line([(0, y), (width, y)], fill=(r, g, b))
-
-    # Gentle waves
-    import math
-    for wave_y in range(10, height, 15):
-        for x in range(0, width):
-            offset = int(math.sin(x * 0.03) * 3)
-            y = wave_y + offset
-            if 0 <= y < height:
-                draw.point((x, y), fill=(*COLORS['ocean_shallow'], 180))
+    img = gradient_image((width, height), [(0, COLORS['ocean_deep']), (0.5, COLORS['ocean_mid']),
+                                           (1, COLORS['ocean_shallow'])])
+    canvas = AccumCanvas(img)
+    x = np.arange(width)
 
-    # Foam at shore (bottom)
-    for x in range(width):
-        import math
-        foam_height = 8 + int(math.sin(x * 0.05) * 4)
-        for y in range(height - foam_height, height):
-            alpha = int(255 * (y - (height - foam_height)) / foam_height)
-            draw.point((x, y), fill=(*COLORS['ocean_foam'], alpha))
+    # Gentle waves, blended over the water
+    offset = (np.sin(x * 0.03) * 3).astype(int)
+    wave_ys = np.arange(10, height, 15)[:, None] + offset
+    canvas.points(np.broadcast_to(x, wave_ys.shape).ravel(), wave_ys.ravel(),
+                  (*COLORS['ocean_shallow'], 180))
 
-    return img
+    # Foam at shore (bottom), fading in towards the bottom edge
+    foam_height = 8 + (np.sin(x * 0.05) * 4).astype(int)
+    rise = np.arange(height)[:, None] - (height - foam_height)
+    coverage = np.where(rise >= 0, (255 * rise / foam_height).astype(int), 0) / 255.0
+    canvas.composite(coverage, COLORS['ocean_foam'])
 
+    return canvas.image()
 
-def create_player_sprite(size=32):
-    """Create player character (blonde girl) sprite"""
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
 
-    s = size // 32
+def create_player_sprite(size=32, supersample=1):
+    """Create player character (blonde girl) sprite
 
+    Drawn on a 32x32 design grid and rasterized at any size.
+    """
+    return render(paint_player, 32, size, supersample)
+
+
+def paint_player(draw):
+    """Draw the player on the 32x32 design grid (draw is a ScaledDraw)."""
     # Hair back (behind head)
-    draw.ellipse([8*s, 2*s, 24*s, 14*s], fill=COLORS['player_hair'])
+    draw.ellipse([8, 2, 24, 14], fill=COLORS['player_hair'])
 
     # Body/dress
-    draw.rectangle([10*s, 14*s, 22*s, 26*s], fill=COLORS['player_dress'])
-    draw.rectangle([10*s, 20*s, 22*s, 26*s], fill=COLORS['player_dress_shadow'])
+    draw.rectangle([10, 14, 22, 26], fill=COLORS['player_dress'])
+    draw.rectangle([10, 20, 22, 26], fill=COLORS['player_dress_shadow'])
 
     # Head
-    draw.ellipse([10*s, 4*s, 22*s, 16*s], fill=COLORS['player_skin'])
+    draw.ellipse([10, 4, 22, 16], fill=COLORS['player_skin'])
 
     # Hair front
-    draw.arc([8*s, 2*s, 24*s, 14*s], 180, 360, fill=COLORS['player_hair'], width=3*s)
+    draw.arc([8, 2, 24, 14], 180, 360, fill=COLORS['player_hair'], width=3)
     # Side hair
-    draw.ellipse([6*s, 6*s, 10*s, 18*s], fill=COLORS['player_hair'])
-    draw.ellipse([22*s, 6*s, 26*s, 18*s], fill=COLORS['player_hair'])
+    draw.ellipse([6, 6, 10, 18], fill=COLORS['player_hair'])
+    draw.ellipse([22, 6, 26, 18], fill=COLORS['player_hair'])
 
     # Eyes
-    draw.ellipse([12*s, 8*s, 14*s, 11*s], fill=COLORS['player_eye'])
-    draw.ellipse([18*s, 8*s, 20*s, 11*s], fill=COLORS['player_eye'])
+    draw.ellipse([12, 8, 14, 11], fill=COLORS['player_eye'])
+    draw.ellipse([18, 8, 20, 11], fill=COLORS['player_eye'])
     # Eye highlights
-    draw.point((12*s, 8*s), fill=(255, 255, 255))
-    draw.point((18*s, 8*s), fill=(255, 255, 255))
+    draw.point((12, 8), fill=(255, 255, 255))
+    draw.point((18, 8), fill=(255, 255, 255))
 
     # Mouth (small smile)
-    draw.arc([14*s, 10*s, 18*s, 14*s], 0, 180, fill=COLORS['player_skin_shadow'], width=s)
+    draw.arc([14, 10, 18, 14], 0, 180, fill=COLORS['player_skin_shadow'], width=1)
 
     # Arms
-    draw.rectangle([6*s, 14*s, 10*s, 22*s], fill=COLORS['player_skin'])
-    draw.rectangle([22*s, 14*s, 26*s, 22*s], fill=COLORS['player_skin'])
+    draw.rectangle([6, 14, 10, 22], fill=COLORS['player_skin'])
+    draw.rectangle([22, 14, 26, 22], fill=COLORS['player_skin'])
 
     # Legs
-    draw.rectangle([12*s, 26*s, 15*s, 30*s], fill=COLORS['player_skin'])
-    draw.rectangle([17*s, 26*s, 20*s, 30*s], fill=COLORS['player_skin'])
-
-    return img
+    draw.rectangle([12, 26, 15, 30], fill=COLORS['player_skin'])
+    draw.rectangle([17, 26, 20, 30], fill=COLORS['player_skin'])
 
 
 def create_driftwood(width=48, height=16):
@@ -633,6 +595,8 @@ def create_spray_particle(size=8):
 print("Generating pixel art assets...")
 
 # Characters
+# The *_large variants are 1.5x, which pixel_upscale's integer factors can't
+# reach; they are the same painters rendered on a bigger grid.
 print("  Creating Charlie sprite...")
 create_charlie_sprite(32).save("assets/sprites/characters/charlie.png")
 create_charlie_sprite(48).save("assets/sprites/characters/charlie_large.png")
@@ -4,14 +4,27 @@ Generate enhanced pixel art assets for Charlie's Island Adventure
 Epic storm effects and detailed beach textures
 """
 
-from PIL import Image, ImageDraw, ImageFilter
+from PIL import Image, ImageDraw
+import argparse
 import os
 import random
 import math
+import sys
 
-# Ensure assets directories exist
-os.makedirs("assets/sprites/environment", exist_ok=True)
-os.makedirs("assets/sprites/effects", exist_ok=True)
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts"))
+from accum_canvas import AccumCanvas
+from gradient import gradient_image
+import np_draw
+from parallax import flatten, periodic, wrap_offsets, write_layers
+from scatter import scatter, stamp, point, ellipse, pebble, shell
+
+# Parallax layers: (motion_scale, autoscroll px/s) per layer, back to front
+STORM_SKY_PARALLAX = {"sky": (0.0, 0), "far_clouds": (0.1, -2), "mid_clouds": (0.25, -5),
+                      "near_clouds": (0.5, -10)}
+STORM_OCEAN_PARALLAX = {"water": (0.0, 0), "swell": (0.6, 0), "crests": (0.6, 0),
+                        "foam": (0.8, -20)}
 
 # Enhanced color palettes
 COLORS = {
@@ -74,158 +87,162 @@ COLORS = {
 }
 
 
-def create_epic_storm_sky(width=426, height=160):
-    """Create dramatic stormy sky with layered clouds"""
-    img = Image.new('RGBA', (width, height), COLORS['storm_sky_top'])
-    draw = ImageDraw.Draw(img)
-
-    # Multi-layer gradient sky
-    for y in range(height):
-        ratio = y / height
-        if ratio < 0.4:
-            # Top section - very dark
-            t = ratio / 0.4
-            r = int(COLORS['storm_sky_top'][0] * (1-t) + COLORS['storm_sky_mid'][0] * t)
-            g = int(COLORS['storm_sky_top'][1] * (1-t) + COLORS['storm_sky_mid'][1] * t)
-            b = int(COLORS['storm_sky_top'][2] * (1-t) + COLORS['storm_sky_mid'][2] * t)
-        else:
-            # Lower section - slightly lighter
-            t = (ratio - 0.4) / 0.6
-            r = int(COLORS['storm_sky_mid'][0] * (1-t) + COLORS['storm_sky_low'][0] * t)
-            g = int(COLORS['storm_sky_mid'][1] * (1-t) + COLORS['storm_sky_low'][1] * t)
-            b = int(COLORS['storm_sky_mid'][2] * (1-t) + COLORS['storm_sky_low'][2] * t)
-        draw.line([(0, y), (width, y)], fill=(r, g, b))
+def draw_cloud_layer(size, color, clusters, margin, y_range, puffs, spread, puff_size, wrap=False):
+    """One layer of cloud clusters, each a handful of overlapping puffs."""
+    width, height = size
+    layer = Image.new('RGBA', size, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(layer)
+    for _ in range(clusters):
+        cx = random.randint(-margin, width + margin)
+        cy = random.randint(*y_range)
+        for _ in range(puffs):
+            rx = cx + random.randint(-spread[0], spread[0])
+            ry = cy + random.randint(-spread[1], spread[1])
+            rw = random.randint(*puff_size[0])
+            rh = random.randint(*puff_size[1])
+            for dx in wrap_offsets(width, wrap):
+                draw.ellipse([rx+dx, ry, rx+rw+dx, ry+rh], fill=color)
+    return layer
+
+
+def storm_sky_layers(width=426, height=160, wrap=False):
+    """The storm sky as [(name, image)], back to front.
+
+    Sky gradient, then far, mid and near clouds (the near layer carries the
+    lightning-lit highlights). With wrap every layer tiles horizontally.
+    """
+    # Multi-layer gradient sky: very dark top, slightly lighter lower section
+    sky = gradient_image((width, height), [(0, COLORS['storm_sky_top']), (0.4, COLORS['storm_sky_mid']),
+                                           (1, COLORS['storm_sky_low'])])
 
     # Storm clouds - multiple layers for depth
     random.seed(42)
+    size = (width, height)
 
     # Background cloud layer (distant, lighter)
-    for _ in range(12):
-        cx = random.randint(-50, width + 50)
-        cy = random.randint(5, height // 3)
-        for _ in range(8):
-            rx = cx + random.randint(-60, 60)
-            ry = cy + random.randint(-20, 20)
-            rw = random.randint(50, 120)
-            rh = random.randint(25, 50)
-            draw.ellipse([rx, ry, rx+rw, ry+rh], fill=COLORS['storm_cloud_light'])
+    far = draw_cloud_layer(size, COLORS['storm_cloud_light'], 12, 50, (5, height // 3),
+                           8, (60, 20), ((50, 120), (25, 50)), wrap)
 
     # Mid cloud layer
-    for _ in range(15):
-        cx = random.randint(-30, width + 30)
-        cy = random.randint(10, height // 2)
-        for _ in range(6):
-            rx = cx + random.randint(-50, 50)
-            ry = cy + random.randint(-15, 15)
-            rw = random.randint(40, 90)
-            rh = random.randint(20, 40)
-            draw.ellipse([rx, ry, rx+rw, ry+rh], fill=COLORS['storm_cloud_mid'])
+    mid = draw_cloud_layer(size, COLORS['storm_cloud_mid'], 15, 30, (10, height // 2),
+                           6, (50, 15), ((40, 90), (20, 40)), wrap)
 
     # Foreground clouds (closest, darkest)
-    for _ in range(10):
-        cx = random.randint(0, width)
-        cy = random.randint(20, height * 2 // 3)
-        for _ in range(5):
-            rx = cx + random.randint(-40, 40)
-            ry = cy + random.randint(-12, 12)
-            rw = random.randint(35, 70)
-            rh = random.randint(15, 35)
-            draw.ellipse([rx, ry, rx+rw, ry+rh], fill=COLORS['storm_cloud_dark'])
-
-    # Cloud highlights (lightning-lit edges)
+    near = draw_cloud_layer(size, COLORS['storm_cloud_dark'], 10, 0, (20, height * 2 // 3),
+                            5, (40, 12), ((35, 70), (15, 35)), wrap)
+
+    # Cloud highlights (lightning-lit edges), blended over the clouds. Each
+    # ring is one batch, so the rings stack into a soft edge.
+    highlights = []
     for _ in range(8):
         cx = random.randint(0, width)
         cy = random.randint(30, height // 2)
         rw = random.randint(20, 40)
         rh = random.randint(10, 20)
-        # Subtle highlight
-        for i in range(3):
-            alpha = 30 - i * 10
-            draw.ellipse([cx-i, cy-i, cx+rw+i, cy+rh+i],
-                        fill=(*COLORS['storm_cloud_highlight'], alpha))
+        highlights.append((cx, cy, rw, rh))
 
-    return img
+    canvas = AccumCanvas(near)
+    for i in range(3):
+        alpha = 30 - i * 10
+        with canvas.batch((*COLORS['storm_cloud_highlight'], alpha)) as draw:
+            for cx, cy, rw, rh in highlights:
+                for dx in wrap_offsets(width, wrap):
+                    draw.ellipse([cx-i+dx, cy-i, cx+rw+i+dx, cy+rh+i], fill=255)
 
+    return [("sky", sky), ("far_clouds", far), ("mid_clouds", mid), ("near_clouds", canvas.image())]
 
-def create_epic_storm_ocean(width=426, height=120):
-    """Create turbulent stormy ocean with large waves"""
-    img = Image.new('RGBA', (width, height), COLORS['ocean_storm_deep'])
-    draw = ImageDraw.Draw(img)
 
-    random.seed(789)
+def create_epic_storm_sky(width=426, height=160):
+    """Create dramatic stormy sky with layered clouds"""
+    return flatten(storm_sky_layers(width, height))
+
 
-    # Base gradient - darker at top (horizon)
-    for y in range(height):
-        ratio = y / height
-        r = int(COLORS['ocean_storm_deep'][0] + (COLORS['ocean_storm_mid'][0] - COLORS['ocean_storm_deep'][0]) * ratio * 0.6)
-        g = int(COLORS['ocean_storm_deep'][1] + (COLORS['ocean_storm_mid'][1] - COLORS['ocean_storm_deep'][1]) * ratio * 0.6)
-        b = int(COLORS['ocean_storm_deep'][2] + (COLORS['ocean_storm_mid'][2] - COLORS['ocean_storm_deep'][2]) * ratio * 0.6)
-        draw.line([(0, y), (width, y)], fill=(r, g, b))
+def storm_ocean_layers(width=426, height=120, wrap=False):
+    """The storm ocean as [(name, image)], back to front.
+
+    Water gradient, the rolling swell, foam along the wave crests, and
+    drifting spray and foam patches. With wrap every layer tiles
+    horizontally (wave frequencies are rounded to whole cycles).
+    """
+    # Base gradient - darker at top (horizon), 60% of the way to mid at the bottom
+    water = gradient_image((width, height), [(0, COLORS['ocean_storm_deep']), (1 / 0.6, COLORS['ocean_storm_mid'])])
+    swell = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+    crests = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+    foam = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+    swell_draw = np_draw.Draw(swell)
+    crest_draw = np_draw.Draw(crests)
+
+    random.seed(789)
 
     # Large rolling waves
     for wave_idx, wave_y in enumerate([8, 28, 50, 75, 100]):
         wave_height = 6 + wave_idx * 2
         wave_freq = 0.02 + wave_idx * 0.005
+        wave_freq2 = wave_freq * 2.3
+        if wrap:
+            wave_freq, wave_freq2 = periodic(wave_freq, width), periodic(wave_freq2, width)
         phase = wave_idx * 1.5
 
-        for x in range(0, width):
-            # Main wave shape
-            offset = int(math.sin(x * wave_freq + phase) * wave_height)
-            offset2 = int(math.sin(x * wave_freq * 2.3 + phase) * (wave_height // 2))
-            total_offset = offset + offset2
-            y = wave_y + total_offset
+        # Main wave shape
+        x = np.arange(width)
+        offset = (np.sin(x * wave_freq + phase) * wave_height).astype(int)
+        offset2 = (np.sin(x * wave_freq2 + phase) * (wave_height // 2)).astype(int)
+        y = wave_y + offset + offset2
+        inside = (y >= 0) & (y < height)
+        x, y = x[inside], y[inside]
+
+        # Wave body (1px wide columns), all waves in one colour
+        swell_draw.rectangle(np.column_stack([x, y, x, np.minimum(y + 4 + wave_idx, height)]),
+                             fill=COLORS['ocean_storm_light'])
+
+        # Wave crest (white foam), with spray above about half of it; a
+        # wave's foam and spray never share a pixel
+        x, y = x[y > 0], y[y > 0]
+        foam_alpha = int(200 - wave_idx * 30)
+        spray = np.array([random.random() > 0.5 for _ in x], dtype=bool)
+        crest_draw.point(np.column_stack([x, y - 1]), fill=(*COLORS['ocean_foam'], foam_alpha))
+        crest_draw.point(np.column_stack([x[spray], y[spray] - 2]),
+                         fill=(*COLORS['ocean_spray'], foam_alpha // 2))
+    swell_draw.flush()
+    crest_draw.flush()
+
+    rng = np.random.default_rng(789)
+
+    # Spray and foam patches (sizes 2-5, half as tall as wide); with wrap,
+    # patches are repeated one width to the left to come back in on the left
+    count = 50
+    xs, ys = rng.integers(0, width, count), rng.integers(0, height, count)
+    sizes = rng.integers(2, 6, count)
+    alphas = rng.integers(50, 151, count)
+    colors = np.column_stack([np.tile(COLORS['ocean_foam'], (count, 1)), alphas])
+    if wrap:
+        xs, ys, sizes, colors = (np.concatenate([xs, xs - width]), np.tile(ys, 2),
+                                 np.tile(sizes, 2), np.tile(colors, (2, 1)))
+    scatter(foam, xs, ys, colors, [stamp(ellipse, size, size // 2) for size in range(2, 6)], sizes - 2)
+
+    # Wind-driven spray streaks, fading out along their length
+    count = 20
+    xs, ys = rng.integers(0, width-29, count), rng.integers(0, height//2 + 1, count)
+    lengths = rng.integers(15, 41, count)
+    streak = np.repeat(np.arange(count), lengths)
+    i = np.arange(len(streak)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    alphas = (100 * (1 - i / lengths[streak])).astype(int)
+    colors = np.column_stack([np.tile(COLORS['ocean_spray'], (len(streak), 1)), alphas])
+    streak_xs = xs[streak] + i
+    if wrap:
+        streak_xs %= width
+    scatter(foam, streak_xs, ys[streak] + rng.integers(-1, 2, len(streak)), colors, [stamp(point)])
+
+    return [("water", water), ("swell", swell), ("crests", crests), ("foam", foam)]
 
-            if 0 <= y < height:
-                # Wave body
-                draw.line([(x, y), (x, min(y + 4 + wave_idx, height))],
-                         fill=COLORS['ocean_storm_light'])
-
-                # Wave crest (white foam)
-                if y > 0:
-                    # Foam at crest
-                    foam_alpha = int(200 - wave_idx * 30)
-                    draw.point((x, y-1), fill=(*COLORS['ocean_foam'], foam_alpha))
-                    if random.random() > 0.5:
-                        draw.point((x, y-2), fill=(*COLORS['ocean_spray'], foam_alpha // 2))
-
-    # Spray and foam patches
-    for _ in range(50):
-        x = random.randint(0, width-1)
-        y = random.randint(0, height-1)
-        size = random.randint(2, 5)
-        alpha = random.randint(50, 150)
-        draw.ellipse([x, y, x+size, y+size//2], fill=(*COLORS['ocean_foam'], alpha))
-
-    # Wind-driven spray streaks
-    for _ in range(20):
-        x = random.randint(0, width-30)
-        y = random.randint(0, height//2)
-        length = random.randint(15, 40)
-        for i in range(length):
-            alpha = int(100 * (1 - i / length))
-            draw.point((x + i, y + random.randint(-1, 1)), fill=(*COLORS['ocean_spray'], alpha))
 
-    return img
+def create_epic_storm_ocean(width=426, height=120):
+    """Create turbulent stormy ocean with large waves"""
+    return flatten(storm_ocean_layers(width, height))
 
 
 def create_lightning_bolt(width=80, height=160):
     """Create dramatic forked lightning bolt"""
-    img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-
-    def draw_bolt(start, end, thickness=3, glow=True):
-        """Draw a lightning segment with glow"""
-        if glow:
-            # Outer glow
-            for offset in range(6, 0, -2):
-                alpha = 30 + (6 - offset) * 20
-                draw.line([start, end], fill=(*COLORS['lightning_outer'], alpha), width=thickness + offset)
-            # Mid glow
-            draw.line([start, end], fill=COLORS['lightning_glow'], width=thickness + 2)
-        # Core
-        draw.line([start, end], fill=COLORS['lightning_bright'], width=thickness)
-        draw.line([start, end], fill=COLORS['lightning_core'], width=max(1, thickness - 1))
-
     # Main bolt path with jagged segments
     random.seed(999)
     points = [(width // 2, 0)]
@@ -236,10 +253,8 @@ def create_lightning_bolt(width=80, height=160):
         x = max(10, min(width - 10, points[-1][0] + x_offset))
         points.append((x, min(y, height)))
 
-    # Draw main bolt
-    for i in range(len(points) - 1):
-        thickness = max(1, 4 - i // 3)
-        draw_bolt(points[i], points[i+1], thickness)
+    # Segments as (start, end, thickness, glow)
+    segments = [(points[i], points[i+1], max(1, 4 - i // 3), True) for i in range(len(points) - 1)]
 
     # Fork branches
     for branch_start_idx in [1, 3, 5]:
@@ -255,19 +270,32 @@ def create_lightning_bolt(width=80, height=160):
                 branch_points.append((new_x, new_y))
 
             for i in range(len(branch_points) - 1):
-                draw_bolt(branch_points[i], branch_points[i+1], max(1, 2 - i), glow=(i < 2))
-
-    return img
+                segments.append((branch_points[i], branch_points[i+1], max(1, 2 - i), i < 2))
+
+    # One batch per glow layer across every segment, outermost first, so a
+    # later segment's glow never covers an earlier segment's core. The outer
+    # glow adds up as light; the inner layers are painted over it.
+    layers = [((*COLORS['lightning_outer'], 30 + (6 - offset) * 20), offset, "add", True)
+              for offset in range(6, 0, -2)]
+    layers += [(COLORS['lightning_glow'], 2, "over", True),      # Mid glow
+               (COLORS['lightning_bright'], 0, "over", False),   # Core
+               (COLORS['lightning_core'], -1, "over", False)]
+    canvas = AccumCanvas((0, 0, 0, 0), (width, height))
+    for color, extra_width, mode, glow_only in layers:
+        with canvas.batch(color, mode) as draw:
+            for start, end, thickness, glow in segments:
+                if glow or not glow_only:
+                    draw.line([start, end], fill=255, width=max(1, thickness + extra_width))
+
+    return canvas.image()
 
 
 def create_rain_sheet(width=64, height=64):
     """Create rain particle sheet with angled heavy rain"""
-    img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-
     random.seed(111)
 
-    # Dense rain streaks at an angle (wind-driven)
+    # Dense rain streaks at an angle (wind-driven), blended where they cross
+    xs, ys, colors = [], [], []
     for _ in range(40):
         x = random.randint(0, width)
         y = random.randint(0, height // 2)
@@ -282,13 +310,13 @@ def create_rain_sheet(width=64, height=64):
         # Gradient fade
         for i in range(length):
             t = i / length
-            px = int(x + (end_x - x) * t)
-            py = int(y + (end_y - y) * t)
-            point_alpha = int(alpha * (1 - t * 0.5))
-            if 0 <= px < width and 0 <= py < height:
-                draw.point((px, py), fill=(*color, point_alpha))
+            xs.append(int(x + (end_x - x) * t))
+            ys.append(int(y + (end_y - y) * t))
+            colors.append((*color, int(alpha * (1 - t * 0.5))))
 
-    return img
+    canvas = AccumCanvas((0, 0, 0, 0), (width, height))
+    canvas.points(xs, ys, colors)
+    return canvas.image()
 
 
 def create_wind_streaks(width=100, height=16):
@@ -326,20 +354,21 @@ def create_ocean_spray(size=16):
     img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
 
-    random.seed(222)
+    rng = np.random.default_rng(222)
 
     # Central burst
     center = size // 2
-    for _ in range(15):
-        angle = random.uniform(0, 2 * math.pi)
-        dist = random.uniform(2, size // 2 - 1)
-        x = int(center + math.cos(angle) * dist)
-        y = int(center + math.sin(angle) * dist)
-        particle_size = random.randint(1, 3)
-        alpha = random.randint(100, 200)
-        if 0 <= x < size and 0 <= y < size:
-            draw.ellipse([x, y, x + particle_size, y + particle_size],
-                        fill=(*COLORS['ocean_spray'], alpha))
+    count = 15
+    angles = rng.uniform(0, 2 * math.pi, count)
+    dists = rng.uniform(2, size // 2 - 1, count)
+    xs = (center + np.cos(angles) * dists).astype(int)
+    ys = (center + np.sin(angles) * dists).astype(int)
+    particle_sizes = rng.integers(1, 4, count)
+    alphas = rng.integers(100, 201, count)
+    inside = (xs >= 0) & (xs < size) & (ys >= 0) & (ys < size)
+    colors = np.column_stack([np.tile(COLORS['ocean_spray'], (count, 1)), alphas])
+    scatter(img, xs[inside], ys[inside], colors[inside],
+            [stamp(ellipse, s, s) for s in (1, 2, 3)], particle_sizes[inside] - 1)
 
     # Central bright spot
     draw.ellipse([center-2, center-2, center+2, center+2],
@@ -350,72 +379,41 @@ def create_ocean_spray(size=16):
 
 def create_detailed_beach_sand(width=426, height=140):
     """Create detailed sandy beach texture"""
-    img = Image.new('RGBA', (width, height), COLORS['sand_mid'])
+    # Base gradient - very wet sand near the water (top), damp, then dry sand
+    img = gradient_image((width, height), [(0, COLORS['sand_wet']), (0.15, COLORS['sand_dark']),
+                                           (0.35, COLORS['sand_mid']), (1, COLORS['sand_light'])])
     draw = ImageDraw.Draw(img)
 
     random.seed(333)
 
-    # Base gradient - wet near water (top)
-    for y in range(height):
-        ratio = y / height
-        if ratio < 0.15:
-            # Very wet sand
-            t = ratio / 0.15
-            r = int(COLORS['sand_wet'][0] * (1-t) + COLORS['sand_dark'][0] * t)
-            g = int(COLORS['sand_wet'][1] * (1-t) + COLORS['sand_dark'][1] * t)
-            b = int(COLORS['sand_wet'][2] * (1-t) + COLORS['sand_dark'][2] * t)
-        elif ratio < 0.35:
-            # Damp sand
-            t = (ratio - 0.15) / 0.2
-            r = int(COLORS['sand_dark'][0] * (1-t) + COLORS['sand_mid'][0] * t)
-            g = int(COLORS['sand_dark'][1] * (1-t) + COLORS['sand_mid'][1] * t)
-            b = int(COLORS['sand_dark'][2] * (1-t) + COLORS['sand_mid'][2] * t)
-        else:
-            # Dry sand
-            t = (ratio - 0.35) / 0.65
-            r = int(COLORS['sand_mid'][0] * (1-t) + COLORS['sand_light'][0] * t)
-            g = int(COLORS['sand_mid'][1] * (1-t) + COLORS['sand_light'][1] * t)
-            b = int(COLORS['sand_mid'][2] * (1-t) + COLORS['sand_light'][2] * t)
-        draw.line([(0, y), (width, y)], fill=(r, g, b))
-
-    # Sand grain texture - many small dots
-    for _ in range(2500):
-        x = random.randint(0, width-1)
-        y = random.randint(0, height-1)
-        color = random.choice([
-            COLORS['sand_grain_light'],
-            COLORS['sand_grain_dark'],
-            COLORS['sand_mid'],
-            COLORS['sand_light'],
-        ])
-        size = random.choice([1, 1, 1, 2])
-        if size == 1:
-            draw.point((x, y), fill=color)
-        else:
-            draw.ellipse([x, y, x+size, y+size], fill=color)
-
-    # Small pebbles scattered
-    for _ in range(60):
-        x = random.randint(0, width-5)
-        y = random.randint(int(height * 0.3), height-5)
-        size = random.randint(2, 4)
-        color = COLORS['sand_pebble']
-        draw.ellipse([x, y, x+size, y+size-1], fill=color)
-        # Highlight
-        draw.point((x+1, y), fill=COLORS['sand_light'])
-
-    # Scattered shells
-    shell_colors = [COLORS['shell_white'], COLORS['shell_pink'], COLORS['shell_tan']]
-    for _ in range(20):
-        x = random.randint(10, width-15)
-        y = random.randint(int(height * 0.25), height-10)
-        color = random.choice(shell_colors)
-        size = random.randint(4, 8)
-        # Shell shape
-        draw.ellipse([x, y, x+size, y+size//2+1], fill=color)
-        # Shell ridges
-        if size > 5:
-            draw.arc([x+1, y, x+size-1, y+size//2], 30, 150, fill=COLORS['sand_dark'])
+    rng = np.random.default_rng(333)
+
+    # Sand grain texture - many small dots, mostly single pixels
+    count = 2500
+    grain_colors = np.array([
+        COLORS['sand_grain_light'],
+        COLORS['sand_grain_dark'],
+        COLORS['sand_mid'],
+        COLORS['sand_light'],
+    ])
+    scatter(img, rng.integers(0, width, count), rng.integers(0, height, count),
+            grain_colors[rng.integers(0, 4, count)],
+            [stamp(point), stamp(ellipse, 2, 2)], rng.choice([0, 0, 0, 1], count))
+
+    # Small pebbles scattered, with a highlight on top
+    count = 60
+    scatter(img, rng.integers(0, width-4, count), rng.integers(int(height * 0.3), height-4, count),
+            COLORS['sand_pebble'], [stamp(pebble, size) for size in (2, 3, 4)],
+            rng.integers(0, 3, count), accents=COLORS['sand_light'])
+
+    # Scattered shells (sizes 4-8); the larger ones get ridges
+    count = 20
+    shell_colors = np.array([COLORS['shell_white'], COLORS['shell_pink'], COLORS['shell_tan']])
+    shells = [stamp(shell, size, size//2+1, 30, 150, 1) if size > 5 else stamp(ellipse, size, size//2+1)
+              for size in range(4, 9)]
+    scatter(img, rng.integers(10, width-14, count), rng.integers(int(height * 0.25), height-9, count),
+            shell_colors[rng.integers(0, 3, count)], shells, rng.integers(0, 5, count),
+            accents=COLORS['sand_dark'])
 
     # Driftwood pieces
     for _ in range(3):
@@ -433,17 +431,14 @@ def create_detailed_beach_sand(width=426, height=140):
         draw.line([(x, y-1), (end_x, end_y-1)], fill=COLORS['wood_light'], width=thickness//2)
         draw.line([(x, y+thickness//2), (end_x, end_y+thickness//2)], fill=COLORS['wood_dark'], width=2)
 
-    # Seaweed/debris at water line
-    for _ in range(15):
-        x = random.randint(0, width)
-        y = random.randint(5, int(height * 0.15))
-        length = random.randint(8, 20)
-        # Dark seaweed
-        for i in range(length):
-            px = x + random.randint(-2, 2)
-            py = y + i // 3
-            if 0 <= px < width and 0 <= py < height:
-                draw.point((px, py), fill=(50, 70, 45, 200))
+    # Seaweed/debris at water line: dark strands wandering downwards
+    count = 15
+    xs, ys = rng.integers(0, width + 1, count), rng.integers(5, int(height * 0.15) + 1, count)
+    lengths = rng.integers(8, 21, count)
+    strand = np.repeat(np.arange(count), lengths)
+    i = np.arange(len(strand)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    scatter(img, xs[strand] + rng.integers(-2, 3, len(strand)), ys[strand] + i // 3,
+            (50, 70, 45, 200), [stamp(point)])
 
     return img
 
@@ -492,31 +487,50 @@ def create_large_raft(size=96):
     return img
 
 
-# Generate all enhanced assets
-print("Generating enhanced pixel art assets...")
+def main():
+    parser = argparse.ArgumentParser(description="Generate enhanced pixel art assets.")
+    parser.add_argument("--parallax", action="store_true",
+                        help="also write the storm sky and ocean as tileable parallax layers")
+    args = parser.parse_args()
+
+    # Ensure assets directories exist
+    os.makedirs("assets/sprites/environment", exist_ok=True)
+    os.makedirs("assets/sprites/effects", exist_ok=True)
+
+    # Generate all enhanced assets
+    print("Generating enhanced pixel art assets...")
+
+    print("  Creating epic storm sky...")
+    create_epic_storm_sky(426, 160).save("assets/sprites/environment/storm_sky.png")
+
+    print("  Creating epic storm ocean...")
+    create_epic_storm_ocean(426, 120).save("assets/sprites/environment/storm_ocean.png")
+
+    print("  Creating lightning bolt...")
+    create_lightning_bolt(80, 160).save("assets/sprites/effects/lightning.png")
 
-print("  Creating epic storm sky...")
-create_epic_storm_sky(426, 160).save("assets/sprites/environment/storm_sky.png")
+    print("  Creating rain sheet...")
+    create_rain_sheet(64, 64).save("assets/sprites/effects/rain.png")
 
-print("  Creating epic storm ocean...")
-create_epic_storm_ocean(426, 120).save("assets/sprites/environment/storm_ocean.png")
+    print("  Creating wind streaks...")
+    create_wind_streaks(100, 16).save("assets/sprites/effects/wind_line.png")
 
-print("  Creating lightning bolt...")
-create_lightning_bolt(80, 160).save("assets/sprites/effects/lightning.png")
+    print("  Creating ocean spray...")
+    create_ocean_spray(16).save("assets/sprites/effects/spray.png")
 
-print("  Creating rain sheet...")
-create_rain_sheet(64, 64).save("assets/sprites/effects/rain.png")
+    print("  Creating detailed beach sand...")
+    create_detailed_beach_sand(426, 140).save("assets/sprites/environment/beach_sand.png")
 
-print("  Creating wind streaks...")
-create_wind_streaks(100, 16).save("assets/sprites/effects/wind_line.png")
+    print("  Creating large raft...")
+    create_large_raft(96).save("assets/sprites/environment/raft_large.png")
 
-print("  Creating ocean spray...")
-create_ocean_spray(16).save("assets/sprites/effects/spray.png")
+    if args.parallax:
+        print("  Creating storm parallax layers...")
+        print(f"    {write_layers('storm_sky', storm_sky_layers(426, 160, wrap=True), STORM_SKY_PARALLAX)}")
+        print(f"    {write_layers('storm_ocean', storm_ocean_layers(426, 120, wrap=True), STORM_OCEAN_PARALLAX)}")
 
-print("  Creating detailed beach sand...")
-create_detailed_beach_sand(426, 140).save("assets/sprites/environment/beach_sand.png")
+    print("\nEnhanced assets generated successfully!")
 
-print("  Creating large raft...")
-create_large_raft(96).save("assets/sprites/environment/raft_large.png")
 
-print("\nEnhanced assets generated successfully!")
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,28 @@
 #!/usr/bin/env python3
 """
 Generate pixel-art style Charlie (Shih Tzu) spritesheet.
-Draws at 32x32 resolution matching Link to the Past style, then scales up.
+Draws at 32x32 resolution matching Link to the Past style; the 2x sheet and
+the UI portrait are upscaled from it (see scripts/pixel_upscale.py).
 """
 
 from PIL import Image, ImageDraw
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts"))
+from godot_import import write_texture_import
+from palette_swap import write_variants
+from pixel_upscale import upscale, upscale_sheet
+from pose_rig import pose
+from shape_program import place
+from sheet_compiler import compile_sheet, mirror_frames
+from sprite_effects import OUTLINE, apply_effects
 
 # Configuration
-BASE_SIZE = 32  # Draw at this size
-SCALE = 4       # Scale up by this factor (resulting in 128x128 sprites)
+BASE_SIZE = 32      # Frame size the sheet is drawn at
+HIDPI_SCALE = 2     # charlie_spritesheet_2x.png, for HiDPI / zoomed-in scenes
+PORTRAIT_SCALE = 4  # charlie_portrait.png, the idle-down frame for UI
+UPSCALE_METHOD = "xbr"
 OUTPUT_DIR = "assets/sprites/characters"
 
 # Colors (Zelda ALttP inspired palette)
@@ -27,19 +40,115 @@ BALL_RED    = (230, 60, 60, 255)
 BONE_WHITE  = (240, 240, 235, 255)
 MEAT_BROWN  = (200, 120, 60, 255)
 
-OUTLINE     = (0, 0, 0, 0) # Transparent for now, or colored outline
+PALETTE = {
+    "light": CREAM_LIGHT, "mid": CREAM_MID, "dark": CREAM_DARK, "shadow": SHADOW,
+    "ear": PINK_EAR, "tongue": PINK_TONGUE, "nose": NOSE, "eyes": EYES,
+    "ball": BALL_RED, "shine": (255, 200, 200, 255), "bone": BONE_WHITE, "meat": MEAT_BROWN,
+    "outline": OUTLINE,
+}
+
+# Seasonal coats, swapped at runtime through the palette texture
+# (see scripts/palette_swap.py); the base sheet keeps the cream coat.
+COAT_VARIANTS = {
+    "summer": {"light": (255, 245, 215, 255), "mid": (245, 220, 170, 255),
+               "dark": (225, 190, 135, 255), "shadow": (195, 160, 110, 255)},
+    "autumn": {"light": (240, 200, 150, 255), "mid": (215, 165, 110, 255),
+               "dark": (180, 125, 80, 255), "shadow": (145, 95, 60, 255)},
+    "winter": {"light": (250, 252, 255, 255), "mid": (230, 235, 245, 255),
+               "dark": (200, 205, 220, 255), "shadow": (165, 170, 190, 255)},
+}
+
+# Shape parts (see scripts/shape_program.py), anchored at the head centre
+# (hx, hy) unless noted. Side-view parts face left (the right-facing rows
+# are the left rows mirrored, see mirror_row).
+HEAD = (
+    ("rectangle", (-6, -5, 6, 5), "mid"),
+    ("rectangle", (-5, -4, 5, 4), "light"),  # Face
+)
+EAR_FRONT = (  # Left ear, facing down
+    ("rectangle", (-8, -2, -6, 4), "dark"),
+    ("rectangle", (-7, 2, -6, 4), "ear"),   # Tip
+)
+EAR_BACK = (  # Left ear, facing up
+    ("rectangle", (-7, -2, -5, 3), "dark"),
+)
+TOPKNOT = (
+    ("rectangle", (-1, -7, 1, -5), "light"),
+    ("point", (0, -5), "ear"),  # Bow
+)
+EYES_FRONT = {
+    "happy": (("point", (-2, -1), "eyes"), ("point", (2, -1), "eyes")),
+    "bored": (("rectangle", (-3, -1, -1, 0), "eyes"), ("rectangle", (1, -1, 3, 0), "eyes")),  # Flat
+    "confused": (("point", (-2, -2), "eyes"), ("point", (2, 0), "eyes")),  # High left
+}
+NOSE_FRONT = (("rectangle", (-1, 1, 1, 2), "nose"),)
+# Held in the mouth, anchored at (hx, mouth_y)
+MOUTH_ITEMS = {
+    "ball": (
+        ("rectangle", (-2, -2, 2, 2), "ball"),
+        ("point", (-1, -1), "shine"),
+    ),
+    "bone": (
+        ("rectangle", (-4, -1, 4, 1), "bone"),
+        ("point", (-4, -2), "bone"),
+        ("point", (4, -2), "bone"),
+    ),
+    "drumstick": (
+        ("rectangle", (-2, -2, 2, 2), "meat"),
+        ("rectangle", (2, -1, 4, 0), "bone"),
+    ),
+}
+TONGUE = (("rectangle", (-1, 0, 1, 2), "tongue"),)  # Anchored at (hx, mouth_y)
+FACE_SIDE = (
+    ("point", (-3, -1), "eyes"),
+    ("point", (-5, 1), "nose"),
+)
+SIDE_ITEMS = {
+    "ball": (("rectangle", (-6, 2, -2, 5), "ball"),),
+    "bone": (("rectangle", (-7, 3, -2, 4), "bone"),),
+    "drumstick": (("rectangle", (-6, 2, -2, 5), "meat"),),
+}
+# Anchored at the body centre (cx, by)
+BODY_FRONT = (
+    ("rectangle", (-5, -4, 5, 5), "mid"),
+    ("rectangle", (-4, -3, 4, 4), "light"),
+)
+BODY_BACK = (("rectangle", (-5, -4, 5, 5), "mid"),)
+TAIL_UP = (("rectangle", (-2, -6, 2, -2), "light"),)
+BODY_SIDE = (
+    # Longer body for side view (12 pixels wide)
+    ("rectangle", (-6, -4, 6, 4), "mid"),
+    ("rectangle", (-5, -3, 5, 3), "light"),
+    # Tail at the back of the longer body
+    ("rectangle", (5, -5, 8, -2), "light"),
+)
+
+# Walk cycle offsets (see scripts/pose_rig.py)
+WALK = {
+    "bob": (-1, "bounce"),         # Bob up on every step
+    "left_foot": (-2, "forward"),  # Front/back view: lift the left foot...
+    "right_foot": (-2, "back"),    # ...then the right one
+    "step": (2, "bounce"),         # Side view leg stride and back-view tail wag
+}
 
-def draw_charlie(draw, x, y, direction, frame_idx, emotion="happy", item=None):
+
+def draw_charlie(image, x, y, direction, frame_idx, emotion="happy", item=None, frames=4):
     """
-    Draw Charlie at pixel coords x,y.
-    direction: 0=down, 1=up, 2=left, 3=right
-    frame_idx: 0=stand, 1=walk1, 2=walk2, 3=walk3
+    Draw Charlie onto image at pixel coords x,y.
+    direction: 0=down, 1=up, 2=left, 3=right (the left drawing mirrored)
+    frame_idx: 0=stand, 1..frames-1 = walk cycle
     """
-    
+    if direction == 3:
+        frame = Image.new('RGBA', (BASE_SIZE, BASE_SIZE), (0, 0, 0, 0))
+        draw_charlie(frame, 0, 0, 2, frame_idx, emotion, item, frames)
+        image.alpha_composite(mirror_frames(frame, BASE_SIZE), (x, y))
+        return
+    draw = ImageDraw.Draw(image)
+
     # Offsets for animation
-    bob_y = 0
-    if frame_idx % 2 == 1:
-        bob_y = -1 # Bob up
+    walk = pose(WALK, frame_idx, frames)
+    bob_y = walk["bob"]
+    step = walk["step"]
         
     # Base positions
     cx, cy = x + 16, y + 24 # Feet center
@@ -49,10 +158,8 @@ def draw_charlie(draw, x, y, direction, frame_idx, emotion="happy", item=None):
     if direction in [0, 1]:
         foot_sep = 3
         # Walk cycle foot offsets
-        l_off = 0
-        r_off = 0
-        if frame_idx == 1: l_off = -2
-        if frame_idx == 3: r_off = -2
+        l_off = walk["left_foot"]
+        r_off = walk["right_foot"]
         
         # Feet
         draw.rectangle([cx - foot_sep - 2, cy - 2 + l_off, cx - foot_sep + 1, cy + l_off], fill=CREAM_DARK)
@@ -60,220 +167,147 @@ def draw_charlie(draw, x, y, direction, frame_idx, emotion="happy", item=None):
         
     # Left (front legs toward head on left, back legs toward tail on right)
     elif direction == 2:
-        draw.rectangle([cx + 2 + (frame_idx%2)*2, cy - 2, cx + 5 + (frame_idx%2)*2, cy], fill=CREAM_DARK) # Back legs
-        draw.rectangle([cx - 6 - (frame_idx%2)*2, cy - 2, cx - 3 - (frame_idx%2)*2, cy], fill=CREAM_DARK) # Front legs
-
-    # Right (front legs toward head on right, back legs toward tail on left)
-    elif direction == 3:
-        draw.rectangle([cx - 5 + (frame_idx%2)*2, cy - 2, cx - 2 + (frame_idx%2)*2, cy], fill=CREAM_DARK) # Back legs
-        draw.rectangle([cx + 3 - (frame_idx%2)*2, cy - 2, cx + 6 - (frame_idx%2)*2, cy], fill=CREAM_DARK) # Front legs
+        draw.rectangle([cx + 2 + step, cy - 2, cx + 5 + step, cy], fill=CREAM_DARK) # Back legs
+        draw.rectangle([cx - 6 - step, cy - 2, cx - 3 - step, cy], fill=CREAM_DARK) # Front legs
 
     # --- BODY ---
     by = y + 16 + bob_y
     if direction == 0: # Down
-        draw.rectangle([cx - 5, by - 4, cx + 5, by + 5], fill=CREAM_MID)
-        draw.rectangle([cx - 4, by - 3, cx + 4, by + 4], fill=CREAM_LIGHT)
+        place(image, draw, BODY_FRONT, cx, by, PALETTE)
     elif direction == 1: # Up
-        draw.rectangle([cx - 5, by - 4, cx + 5, by + 5], fill=CREAM_MID)
-        # Tail
-        tail_off = (frame_idx % 2) * 2 - 1
-        draw.rectangle([cx - 2 + tail_off, by - 6, cx + 2 + tail_off, by - 2], fill=CREAM_LIGHT)
-    elif direction == 2: # Left
-        # Longer body for side view (12 pixels wide)
-        draw.rectangle([cx - 6, by - 4, cx + 6, by + 4], fill=CREAM_MID)
-        draw.rectangle([cx - 5, by - 3, cx + 5, by + 3], fill=CREAM_LIGHT)
-        # Tail Left (positioned at back of longer body)
-        draw.rectangle([cx + 5, by - 5, cx + 8, by - 2], fill=CREAM_LIGHT)
-    elif direction == 3: # Right
-        # Longer body for side view (12 pixels wide)
-        draw.rectangle([cx - 6, by - 4, cx + 6, by + 4], fill=CREAM_MID)
-        draw.rectangle([cx - 5, by - 3, cx + 5, by + 3], fill=CREAM_LIGHT)
-        # Tail Right (positioned at back of longer body)
-        draw.rectangle([cx - 8, by - 5, cx - 5, by - 2], fill=CREAM_LIGHT)
+        place(image, draw, BODY_BACK, cx, by, PALETTE)
+        tail_off = step - 1
+        place(image, draw, TAIL_UP, cx + tail_off, by, PALETTE)
+    else: # Left
+        place(image, draw, BODY_SIDE, cx, by, PALETTE)
 
     # --- HEAD ---
     hy = by - 8
     hx = cx
     if direction == 2: hx -= 2
-    if direction == 3: hx += 2
     
-    # Head Shape
-    draw.rectangle([hx - 6, hy - 5, hx + 6, hy + 5], fill=CREAM_MID)
-    draw.rectangle([hx - 5, hy - 4, hx + 5, hy + 4], fill=CREAM_LIGHT) # Face face
+    place(image, draw, HEAD, hx, hy, PALETTE)
     
-    # Ears
-    if direction == 0:
-        draw.rectangle([hx - 8, hy - 2, hx - 6, hy + 4], fill=CREAM_DARK) # L
-        draw.rectangle([hx + 6, hy - 2, hx + 8, hy + 4], fill=CREAM_DARK) # R
-        draw.rectangle([hx - 7, hy + 2, hx - 6, hy + 4], fill=PINK_EAR) # L tip
-        draw.rectangle([hx + 6, hy + 2, hx + 7, hy + 4], fill=PINK_EAR) # R tip
-    elif direction == 1:
-        draw.rectangle([hx - 7, hy - 2, hx - 5, hy + 3], fill=CREAM_DARK)
-        draw.rectangle([hx + 5, hy - 2, hx + 7, hy + 3], fill=CREAM_DARK)
+    # Ears (the right ear is the left one mirrored)
+    if direction in [0, 1]:
+        ear = EAR_FRONT if direction == 0 else EAR_BACK
+        place(image, draw, ear, hx, hy, PALETTE)
+        place(image, draw, ear, hx, hy, PALETTE, flip=True)
 
     # Face Details (Front)
     if direction == 0:
-        # Eyes
-        if emotion == "bored":
-             draw.rectangle([hx - 3, hy - 1, hx - 1, hy], fill=EYES) # Flat
-             draw.rectangle([hx + 1, hy - 1, hx + 3, hy], fill=EYES)
-        elif emotion == "confused":
-             draw.point((hx - 2, hy - 2), fill=EYES) # High Left
-             draw.point((hx + 2, hy), fill=EYES)     # Normal Right
-        else: # Happy
-            draw.point((hx - 2, hy - 1), fill=EYES)
-            draw.point((hx + 2, hy - 1), fill=EYES)
-            
-        # Nose
-        draw.rectangle([hx - 1, hy + 1, hx + 1, hy + 2], fill=NOSE)
+        place(image, draw, EYES_FRONT.get(emotion, EYES_FRONT["happy"]), hx, hy, PALETTE)
+        place(image, draw, NOSE_FRONT, hx, hy, PALETTE)
         
         # Mouth / Tongue
         mouth_y = hy + 4
         if item:
-            if item == "ball":
-                draw.rectangle([hx - 2, mouth_y - 2, hx + 2, mouth_y + 2], fill=BALL_RED)
-                draw.point((hx - 1, mouth_y - 1), fill=(255, 200, 200, 255)) # Shine
-            elif item == "bone":
-                draw.rectangle([hx - 4, mouth_y - 1, hx + 4, mouth_y + 1], fill=BONE_WHITE)
-                draw.point((hx - 4, mouth_y - 2), fill=BONE_WHITE)
-                draw.point((hx + 4, mouth_y - 2), fill=BONE_WHITE)
-            elif item == "drumstick":
-                draw.rectangle([hx - 2, mouth_y - 2, hx + 2, mouth_y + 2], fill=MEAT_BROWN)
-                draw.rectangle([hx + 2, mouth_y - 1, hx + 4, mouth_y], fill=BONE_WHITE)
-                
-        elif emotion == "happy" and frame_idx % 2 == 1: # Panting
-             draw.rectangle([hx - 1, mouth_y, hx + 1, mouth_y + 2], fill=PINK_TONGUE)
+            if item in MOUTH_ITEMS:
+                place(image, draw, MOUTH_ITEMS[item], hx, mouth_y, PALETTE)
+        elif emotion == "happy" and step > 0: # Panting
+            place(image, draw, TONGUE, hx, mouth_y, PALETTE)
 
     # Face (Side)
     elif direction == 2: # Left
-        draw.point((hx - 3, hy - 1), fill=EYES)
-        draw.point((hx - 5, hy + 1), fill=NOSE)
-        if item == "ball":
-             draw.rectangle([hx - 6, hy + 2, hx - 2, hy + 5], fill=BALL_RED)
-        elif item == "bone":
-             draw.rectangle([hx - 7, hy + 3, hx - 2, hy + 4], fill=BONE_WHITE)
-        elif item == "drumstick":
-             draw.rectangle([hx - 6, hy + 2, hx - 2, hy + 5], fill=MEAT_BROWN)
-    
-    elif direction == 3: # Right
-        draw.point((hx + 3, hy - 1), fill=EYES)
-        draw.point((hx + 5, hy + 1), fill=NOSE)
-        if item == "ball":
-             draw.rectangle([hx + 2, hy + 2, hx + 6, hy + 5], fill=BALL_RED)
-        elif item == "bone":
-             draw.rectangle([hx + 2, hy + 3, hx + 7, hy + 4], fill=BONE_WHITE)
-        elif item == "drumstick":
-             draw.rectangle([hx + 2, hy + 2, hx + 6, hy + 5], fill=MEAT_BROWN)
-
-    # Topknot
-    draw.rectangle([hx - 1, hy - 7, hx + 1, hy - 5], fill=CREAM_LIGHT)
-    draw.point((hx, hy - 5), fill=PINK_EAR) # Bow
+        place(image, draw, FACE_SIDE, hx, hy, PALETTE)
+        if item in SIDE_ITEMS:
+            place(image, draw, SIDE_ITEMS[item], hx, hy, PALETTE)
+
+    place(image, draw, TOPKNOT, hx, hy, PALETTE)
+
+
+# Layout matching Overworld.tscn expectations:
+# Row 0: Down (Idle, Walk1, Walk2, Walk3)
+# Row 1: Left (Idle, Walk1, Walk2, Walk3)
+# Row 2: Right (Idle, Walk1, Walk2, Walk3)
+# Row 3: Up (Idle, Walk1, Walk2, Walk3)
+# followed by extra animations
+#
+# Format: (direction, emotion, item)
+# Every row has 4 frames: Frame 0 is Idle, Frames 1-3 are Walk cycle.
+SHEET_ROWS = [
+    ("down", "happy", None),  # Row 0
+    ("left", "happy", None),  # Row 1
+    ("right", "happy", None), # Row 2
+    ("up", "happy", None),    # Row 3
+
+    # Extras - Just using walk cycle format for now (0=Idle/Stand, 1-3=Walk)
+    # Bored/Confused (Down only for now)
+    ("down", "bored", None),     # Row 4
+    ("down", "confused", None),  # Row 5
+
+    # With Ball
+    ("down", "happy", "ball"),   # Row 6
+    ("left", "happy", "ball"),   # Row 7
+    ("right", "happy", "ball"),  # Row 8
+    ("up", "happy", "ball"),     # Row 9
+
+    # With Bone
+    ("down", "happy", "bone"),   # Row 10
+    ("left", "happy", "bone"),   # Row 11
+    ("right", "happy", "bone"),  # Row 12
+    ("up", "happy", "bone"),     # Row 13
+
+    # With Drumstick
+    ("down", "happy", "drumstick"),   # Row 14
+    ("left", "happy", "drumstick"),   # Row 15
+    ("right", "happy", "drumstick"),  # Row 16
+    ("up", "happy", "drumstick"),     # Row 17
+]
+
+# Any count works (e.g. 6 or 8 for smoother walks): the walk is sampled from
+# the WALK rig, but the Godot SpriteFrames expect 4.
+FRAMES_PER_ROW = 4
+
+DIR_MAP = {"down": 0, "up": 1, "left": 2, "right": 3}
+
+
+def draw_sheet_row(image, spec):
+    """Draw one sheet row (Col 0: Idle/Stand, Col 1-3: Walk) at y=0."""
+    dirname, emotion, item = spec
+    for col in range(FRAMES_PER_ROW):
+        # In draw_charlie, frame_idx 0=stand, 1..FRAMES_PER_ROW-1 = walk cycle
+        draw_charlie(image, col * BASE_SIZE, 0, DIR_MAP[dirname], col, emotion, item,
+                     FRAMES_PER_ROW)
 
-# Configuration
-BASE_SIZE = 32  # Draw at this size
-SCALE = 1       # Keep 1x scale (32x32) for compatibility with existing Godot setup
-OUTPUT_DIR = "assets/sprites/characters"
 
-# ... (Colors remain the same) ...
+def mirror_row(spec):
+    """Right-facing rows are the matching left rows flipped frame by frame."""
+    dirname, emotion, item = spec
+    return ("left", emotion, item) if dirname == "right" else None
+
+
+def add_outline(sheet):
+    """Outline every frame of the finished sheet in one pass."""
+    return apply_effects(sheet, BASE_SIZE, outline=OUTLINE)
 
-# ... (draw_charlie remains the same) ...
 
 def generate_sheet():
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-    
-    # Layout matching Overworld.tscn expectations:
-    # Row 0: Down (Idle, Walk1, Walk2, Walk3)
-    # Row 1: Left (Idle, Walk1, Walk2, Walk3)
-    # Row 2: Right (Idle, Walk1, Walk2, Walk3)
-    # Row 3: Up (Idle, Walk1, Walk2, Walk3)
-    # followed by extra animations
-    
-    # Format: (anim_type, direction, emotion, item)
-    # We will generate 4 frames per row.
-    # For standard rows: Frame 0 is Idle, Frames 1-3 are Walk cycle.
-    
-    standard_rows = [
-        ("down", "happy", None),  # Row 0
-        ("left", "happy", None),  # Row 1
-        ("right", "happy", None), # Row 2
-        ("up", "happy", None),    # Row 3
-    ]
-    
-    extra_rows = [
-        # Extras - Just using walk cycle format for now (0=Idle/Stand, 1-3=Walk)
-        # Bored/Confused (Down only for now)
-        ("down", "bored", None),     # Row 4
-        ("down", "confused", None),  # Row 5
-        
-        # With Ball
-        ("down", "happy", "ball"),   # Row 6
-        ("left", "happy", "ball"),   # Row 7
-        ("right", "happy", "ball"),  # Row 8
-        ("up", "happy", "ball"),     # Row 9
-        
-        # With Bone
-        ("down", "happy", "bone"),   # Row 10
-        ("left", "happy", "bone"),   # Row 11
-        ("right", "happy", "bone"),  # Row 12
-        ("up", "happy", "bone"),     # Row 13
-        
-        # With Drumstick
-        ("down", "happy", "drumstick"),   # Row 14
-        ("left", "happy", "drumstick"),   # Row 15
-        ("right", "happy", "drumstick"),  # Row 16
-        ("up", "happy", "drumstick"),     # Row 17
-    ]
-    
-    sheet_w = 4 * BASE_SIZE * SCALE
-    sheet_h = (len(standard_rows) + len(extra_rows)) * BASE_SIZE * SCALE
-    
-    img = Image.new('RGBA', (sheet_w, sheet_h), (0,0,0,0))
-    draw = ImageDraw.Draw(img)
-    
-    dir_map = {"down": 0, "up": 1, "left": 2, "right": 3}
-    
-    current_row = 0
-    
-    # 1. Standard Rows (Hybrid Idle/Walk)
-    for dirname, emotion, item in standard_rows:
-        y = current_row * BASE_SIZE * SCALE
-        d = dir_map[dirname]
-        
-        # Col 0: Idle
-        draw_charlie(draw, 0, y, d, 0, emotion, item)
-        
-        # Col 1-3: Walk
-        for col in range(1, 4):
-            x = col * BASE_SIZE * SCALE
-            # frame_idx mapping: 1->1, 2->2, 3->3 (walk frames) + offset if needed
-            # In draw_charlie, frame_idx 0=stand, 1=walk1, 2=walk2, 3=walk3
-            draw_charlie(draw, x, y, d, col, emotion, item)
-            
-        current_row += 1
-
-    # 2. Extra Rows
-    for dirname, emotion, item in extra_rows:
-        y = current_row * BASE_SIZE * SCALE
-        d = dir_map[dirname]
-        
-        # Col 0: Idle/Stand
-        draw_charlie(draw, 0, y, d, 0, emotion, item)
-        
-        # Col 1-3: Walk
-        for col in range(1, 4):
-            x = col * BASE_SIZE * SCALE
-            draw_charlie(draw, x, y, d, col, emotion, item)
-            
-        current_row += 1
-
-    # Scale up? No, SCALE is applied during drawing coords if we wanted global scale
-    # But draw_charlie uses raw coords. 
-    # If SCALE > 1, we should draw small then resize. 
-    # But here we want output to be 32x32.
-    
+    # Rows are cached in .sheet_cache keyed by their spec and the drawing code,
+    # so only rows whose spec or draw_charlie changed are redrawn.
     outfile = os.path.join(OUTPUT_DIR, "charlie_spritesheet.png")
-    img.save(outfile)
-    print(f"Generated {outfile} ({sheet_w}x{sheet_h})")
+    result = compile_sheet(outfile, SHEET_ROWS, draw_sheet_row, BASE_SIZE, FRAMES_PER_ROW,
+                           mirror=mirror_row, post=add_outline)
+
+    sheet_w, sheet_h = result["sheet"].size
+    print(f"Generated {outfile} ({sheet_w}x{sheet_h}): "
+          f"{len(result['rendered'])} rows rendered, "
+          f"{len(result['restored'])} restored from cache, "
+          f"{len(result['kept'])} unchanged")
+    print(f"Saved {write_variants(outfile, PALETTE, COAT_VARIANTS)} ({len(COAT_VARIANTS)} coat variants)")
+
+    # Larger variants are scaled from the finished sheet, never redrawn
+    sheet = result["sheet"]
+    variants = [
+        (f"charlie_spritesheet_{HIDPI_SCALE}x.png", upscale_sheet(sheet, BASE_SIZE, HIDPI_SCALE, UPSCALE_METHOD)),
+        ("charlie_portrait.png", upscale(sheet.crop((0, 0, BASE_SIZE, BASE_SIZE)), PORTRAIT_SCALE, UPSCALE_METHOD)),
+    ]
+    for name, img in variants:
+        path = os.path.join(OUTPUT_DIR, name)
+        img.save(path)
+        write_texture_import(path)
+        print(f"Generated {path} ({img.size[0]}x{img.size[1]})")
+
 
 if __name__ == "__main__":
     generate_sheet()
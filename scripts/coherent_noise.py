@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Periodic coherent noise for seamless, tileable textures.
+
+Value noise interpolates random values on a lattice; gradient (Perlin-style)
+noise interpolates random gradients, which looks less blocky. Both wrap the
+lattice around after `period` cells in each direction, and the image always
+spans a whole number of cells, so the result tiles seamlessly at any size:
+
+    clouds = fbm((128, 64), period=(4, 2), octaves=4, seed=7)
+
+Everything is computed for the whole image at once with NumPy; values are
+in 0..1.
+"""
+
+import numpy as np
+
+KINDS = ("value", "gradient")
+
+
+def _periods(period):
+    return (period, period) if isinstance(period, int) else tuple(period)
+
+
+def _fade(t):
+    """Quintic smoothstep: zero first and second derivatives at cell edges."""
+    return t * t * t * (t * (t * 6 - 15) + 10)
+
+
+def _lattice(size, period):
+    """Cell coordinates of every pixel: (x0, x1, fx) and (y0, y1, fy)."""
+    width, height = size
+    period_x, period_y = _periods(period)
+    u = np.arange(width) * (period_x / width)
+    v = np.arange(height) * (period_y / height)
+    x0 = np.floor(u).astype(np.int64)
+    y0 = np.floor(v).astype(np.int64)
+    return ((x0 % period_x, (x0 + 1) % period_x, u - x0),
+            (y0 % period_y, (y0 + 1) % period_y, v - y0))
+
+
+def value_noise(size, period=4, seed=None):
+    """(H, W) periodic value noise in 0..1 with period (px, py) lattice cells."""
+    period_x, period_y = _periods(period)
+    values = np.random.default_rng(seed).random((period_y, period_x))
+    (x0, x1, fx), (y0, y1, fy) = _lattice(size, period)
+    sx = _fade(fx)[None, :]
+    sy = _fade(fy)[:, None]
+    top = values[y0[:, None], x0[None, :]] * (1 - sx) + values[y0[:, None], x1[None, :]] * sx
+    bottom = values[y1[:, None], x0[None, :]] * (1 - sx) + values[y1[:, None], x1[None, :]] * sx
+    return top * (1 - sy) + bottom * sy
+
+
+def gradient_noise(size, period=4, seed=None):
+    """(H, W) periodic gradient noise in 0..1 with period (px, py) lattice cells."""
+    period_x, period_y = _periods(period)
+    angles = np.random.default_rng(seed).uniform(0, 2 * np.pi, (period_y, period_x))
+    gx, gy = np.cos(angles), np.sin(angles)
+    (x0, x1, fx), (y0, y1, fy) = _lattice(size, period)
+    fx = fx[None, :]
+    fy = fy[:, None]
+
+    def corner(ix, iy, dx, dy):
+        return gx[iy[:, None], ix[None, :]] * dx + gy[iy[:, None], ix[None, :]] * dy
+
+    sx = _fade(fx)
+    sy = _fade(fy)
+    top = corner(x0, y0, fx, fy) * (1 - sx) + corner(x1, y0, fx - 1, fy) * sx
+    bottom = corner(x0, y1, fx, fy - 1) * (1 - sx) + corner(x1, y1, fx - 1, fy - 1) * sx
+    # 2D gradient noise stays within +-sqrt(2)/2
+    return np.clip((top * (1 - sy) + bottom * sy) / np.sqrt(2) + 0.5, 0.0, 1.0)
+
+
+def fbm(size, period=4, octaves=4, persistence=0.5, lacunarity=2, kind="gradient", seed=None):
+    """Fractal sum of noise octaves, normalized to 0..1.
+
+    Each octave multiplies the lattice period by lacunarity (an integer, so
+    every octave, and therefore the sum, still tiles) and its amplitude by
+    persistence.
+    """
+    if kind not in KINDS:
+        raise ValueError(f"Unknown noise kind {kind!r}, expected one of {KINDS}")
+    noise = value_noise if kind == "value" else gradient_noise
+    period_x, period_y = _periods(period)
+    rng = np.random.default_rng(seed)
+
+    total = np.zeros((size[1], size[0]))
+    amplitude = 1.0
+    weight = 0.0
+    for octave in range(octaves):
+        scale = lacunarity ** octave
+        total += amplitude * noise(size, (period_x * scale, period_y * scale), rng.integers(1 << 31))
+        weight += amplitude
+        amplitude *= persistence
+    total /= weight
+
+    low, high = total.min(), total.max()
+    return (total - low) / (high - low) if high > low else np.zeros_like(total)
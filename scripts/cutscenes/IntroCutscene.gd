@@ -4,6 +4,7 @@ extends Control
 @onready var scene_content: Node2D = $SceneContent
 @onready var sky: ColorRect = $SceneContent/Sky
 @onready var lightning_flash: ColorRect = $SceneContent/LightningFlash
+@onready var lightning_bolt: Sprite2D = $SceneContent/LightningBolt
 @onready var cloud_layer: Node2D = $SceneContent/CloudLayer
 @onready var cloud_layer2: Node2D = $SceneContent/CloudLayer2
 @onready var ocean: Node2D = $SceneContent/Ocean
@@ -166,6 +167,7 @@ func _on_lightning_timer_timeout() -> void:
 
 func _do_lightning() -> void:
 	lightning_flash.visible = true
+	_show_lightning_bolt()
 
 	# Flash sequence
 	var tween = create_tween()
@@ -173,7 +175,19 @@ func _do_lightning() -> void:
 	tween.tween_property(lightning_flash, "modulate:a", 0.3, 0.1)
 	tween.tween_property(lightning_flash, "modulate:a", 0.8, 0.05)
 	tween.tween_property(lightning_flash, "modulate:a", 0.0, 0.2)
-	tween.tween_callback(func(): lightning_flash.visible = false)
+	tween.tween_callback(_end_lightning)
+
+func _show_lightning_bolt() -> void:
+	# Random pre-rendered bolt from the atlas (scripts/generate_lightning_atlas.py)
+	lightning_bolt.frame = randi() % (lightning_bolt.hframes * lightning_bolt.vframes)
+	lightning_bolt.flip_h = randf() < 0.5
+	var frame_width = lightning_bolt.texture.get_width() / lightning_bolt.hframes
+	lightning_bolt.position.x = randf_range(0, get_viewport_rect().size.x - frame_width)
+	lightning_bolt.visible = true
+
+func _end_lightning() -> void:
+	lightning_flash.visible = false
+	lightning_bolt.visible = false
 
 func _on_wave_timer_timeout() -> void:
 	# Animate wave positions
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Dither threshold maps shared by the texture generators.
+
+Every map holds values in [0, 1); a pixel is "on" at density d where its
+threshold is below d. Bayer maps give a regular ordered pattern, blue noise
+an even but irregular scatter without clumps.
+"""
+
+import functools
+
+import numpy as np
+
+
+def bayer_matrix(n):
+    """Return the n x n Bayer index matrix (n a power of two), values 0..n*n-1."""
+    matrix = np.zeros((1, 1), dtype=np.int64)
+    while matrix.shape[0] < n:
+        matrix = np.block([[4 * matrix, 4 * matrix + 2],
+                           [4 * matrix + 3, 4 * matrix + 1]])
+    return matrix
+
+
+def bayer_thresholds(size, n=4):
+    """Tile Bayer thresholds in [0, 1) over an image of size (width, height)."""
+    width, height = size
+    matrix = (bayer_matrix(n) + 0.5) / (n * n)
+    reps = (-(-height // n), -(-width // n))
+    return np.tile(matrix, reps)[:height, :width]
+
+
+@functools.lru_cache(maxsize=None)
+def blue_noise(n=64, seed=0):
+    """Return an n x n tileable blue-noise threshold map in [0, 1).
+
+    White noise is high-pass filtered in the frequency domain (which keeps it
+    periodic) and rank-ordered so every threshold value appears once.
+    """
+    rng = np.random.default_rng(seed)
+    spectrum = np.fft.fft2(rng.random((n, n)))
+    fy = np.fft.fftfreq(n)[:, None]
+    fx = np.fft.fftfreq(n)[None, :]
+    spectrum *= np.hypot(fx, fy) > 0.25
+    filtered = np.real(np.fft.ifft2(spectrum))
+    ranks = np.empty(n * n)
+    ranks[np.argsort(filtered, axis=None)] = np.arange(n * n)
+    return ((ranks + 0.5) / (n * n)).reshape(n, n)
+
+
+def blue_noise_thresholds(size, n=64, seed=0):
+    """Tile blue-noise thresholds in [0, 1) over an image of size (width, height)."""
+    width, height = size
+    reps = (-(-height // n), -(-width // n))
+    return np.tile(blue_noise(n, seed), reps)[:height, :width]
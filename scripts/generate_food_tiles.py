@@ -1,7 +1,12 @@
 #!/usr/bin/env python3
 """
-Generate food tile spritesheet for the feeding minigame.
-Creates a 196x28 atlas (7 tiles, each 28x28) in retro pixel art style.
+Generate food tile spritesheets for the feeding minigame.
+Each food is painted once on a 28x28 design grid and rendered as a 7x1 strip
+at every size the game uses, in retro pixel art style:
+
+  food_tiles.png    - 196x28, match-3 board
+  food_tiles_16.png - 112x16, HUD legend
+  food_tiles_56.png - 392x56, results screen
 
 Tile order (left to right):
   0: Kibble Brown  - round brown kibble nugget
@@ -14,14 +19,19 @@ Tile order (left to right):
 """
 
 from PIL import Image, ImageDraw
+import argparse
 import os
-import random
+
+from godot_import import write_texture_import
+from noise_masks import NoiseField
+from scaled_draw import ScaledDraw
 
 OUTPUT_DIR = "assets/sprites/ui"
-os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 TILE = 28
 COLS = 7
+# Board, HUD and results screen; the board size keeps the original file name
+FOOD_SIZES = (TILE, 16, 56)
 
 # Palettes (R, G, B, A)
 # Brown kibble
@@ -84,226 +94,253 @@ def draw_ellipse_filled(draw, cx, cy, rx, ry, color):
     draw.ellipse([cx - rx, cy - ry, cx + rx, cy + ry], fill=color)
 
 
-def add_pixel_noise(img, x0, y0, w, h, colors, density=0.12):
-    """Scatter random pixels for dithering texture."""
-    for y in range(y0, y0 + h):
-        for x in range(x0, x0 + w):
-            if random.random() < density:
-                cur = img.getpixel((x, y))
-                if cur[3] > 0:  # only on non-transparent
-                    img.putpixel((x, y), random.choice(colors))
+# Dithering texture for every tile, applied in one pass by main()
+NOISE = NoiseField(seed=42)
+
+
+def add_pixel_noise(draw, x0, y0, w, h, colors, density=0.12):
+    """Scatter random pixels for dithering texture (non-transparent pixels only).
 
+    The region is in design units and lands on the pixels draw maps it to.
+    """
+    left, top, right, bottom = draw.box([x0, y0, x0 + w - 1, y0 + h - 1])
+    NOISE.add((left, top, right - left + 1, bottom - top + 1), colors, density)
 
-def draw_brown_kibble(img, draw, ox, oy):
+
+def paint_brown_kibble(draw):
     """Round kibble nugget with a cross-hatch score mark."""
-    cx, cy = ox + 14, oy + 14
+    cx, cy = 14, 14
 
     # Rounded square body
-    draw.rounded_rectangle([ox + 4, oy + 5, ox + 24, oy + 23], radius=5, fill=BROWN_BASE)
+    draw.rounded_rectangle([4, 5, 24, 23], radius=5, fill=BROWN_BASE)
     # Highlight top-left
-    draw.rounded_rectangle([ox + 5, oy + 6, ox + 16, oy + 14], radius=3, fill=BROWN_LIGHT)
+    draw.rounded_rectangle([5, 6, 16, 14], radius=3, fill=BROWN_LIGHT)
     # Shadow bottom-right
-    draw.line([(ox + 8, oy + 22), (ox + 23, oy + 22)], fill=BROWN_DARK, width=1)
-    draw.line([(ox + 23, oy + 8), (ox + 23, oy + 22)], fill=BROWN_DARK, width=1)
+    draw.line([(8, 22), (23, 22)], fill=BROWN_DARK, width=1)
+    draw.line([(23, 8), (23, 22)], fill=BROWN_DARK, width=1)
     # Shine dot
-    img.putpixel((ox + 8, oy + 8), BROWN_SHINE)
-    img.putpixel((ox + 9, oy + 8), BROWN_SHINE)
-    img.putpixel((ox + 8, oy + 9), BROWN_SHINE)
+    draw.point((8, 8), fill=BROWN_SHINE)
+    draw.point((9, 8), fill=BROWN_SHINE)
+    draw.point((8, 9), fill=BROWN_SHINE)
     # Cross score mark
-    draw.line([(ox + 10, oy + 11), (ox + 18, oy + 19)], fill=BROWN_DARK, width=1)
-    draw.line([(ox + 18, oy + 11), (ox + 10, oy + 19)], fill=BROWN_DARK, width=1)
+    draw.line([(10, 11), (18, 19)], fill=BROWN_DARK, width=1)
+    draw.line([(18, 11), (10, 19)], fill=BROWN_DARK, width=1)
 
-    add_pixel_noise(img, ox + 4, oy + 5, 20, 18, [BROWN_LIGHT, BROWN_DARK], 0.08)
+    add_pixel_noise(draw, 4, 5, 20, 18, [BROWN_LIGHT, BROWN_DARK], 0.08)
 
 
-def draw_salmon_kibble(img, draw, ox, oy):
+def paint_salmon_kibble(draw):
     """Fish-shaped kibble piece."""
     # Fish body (oval)
-    draw.ellipse([ox + 3, oy + 8, ox + 21, oy + 22], fill=SALMON_BASE)
+    draw.ellipse([3, 8, 21, 22], fill=SALMON_BASE)
     # Highlight
-    draw.ellipse([ox + 5, oy + 9, ox + 15, oy + 16], fill=SALMON_LIGHT)
+    draw.ellipse([5, 9, 15, 16], fill=SALMON_LIGHT)
     # Tail (triangle)
-    draw.polygon([(ox + 20, oy + 12), (ox + 20, oy + 20), (ox + 27, oy + 16)], fill=SALMON_BASE)
-    draw.polygon([(ox + 21, oy + 13), (ox + 21, oy + 17), (ox + 25, oy + 15)], fill=SALMON_LIGHT)
+    draw.polygon([(20, 12), (20, 20), (27, 16)], fill=SALMON_BASE)
+    draw.polygon([(21, 13), (21, 17), (25, 15)], fill=SALMON_LIGHT)
     # Eye
-    img.putpixel((ox + 7, oy + 13), SALMON_EYE)
-    img.putpixel((ox + 8, oy + 13), SALMON_EYE)
-    img.putpixel((ox + 7, oy + 14), SALMON_EYE)
+    draw.point((7, 13), fill=SALMON_EYE)
+    draw.point((8, 13), fill=SALMON_EYE)
+    draw.point((7, 14), fill=SALMON_EYE)
     # Shine on eye
-    img.putpixel((ox + 7, oy + 13), (255, 255, 255, 255))
+    draw.point((7, 13), fill=(255, 255, 255, 255))
     # Mouth line
-    draw.line([(ox + 4, oy + 16), (ox + 8, oy + 16)], fill=SALMON_DARK, width=1)
+    draw.line([(4, 16), (8, 16)], fill=SALMON_DARK, width=1)
     # Shadow bottom
-    draw.arc([ox + 3, oy + 8, ox + 21, oy + 23], 20, 160, fill=SALMON_DARK)
+    draw.arc([3, 8, 21, 23], 20, 160, fill=SALMON_DARK)
     # Fin on top
-    draw.polygon([(ox + 11, oy + 8), (ox + 14, oy + 4), (ox + 17, oy + 8)], fill=SALMON_DARK)
+    draw.polygon([(11, 8), (14, 4), (17, 8)], fill=SALMON_DARK)
 
-    add_pixel_noise(img, ox + 3, oy + 8, 18, 14, [SALMON_LIGHT, SALMON_DARK], 0.06)
+    add_pixel_noise(draw, 3, 8, 18, 14, [SALMON_LIGHT, SALMON_DARK], 0.06)
 
 
-def draw_green_kibble(img, draw, ox, oy):
+def paint_green_kibble(draw):
     """Broccoli / pea cluster piece."""
     # Main cluster of circles (broccoli florets)
     for (dx, dy, r) in [(12, 10, 5), (8, 14, 5), (16, 14, 5), (12, 17, 4), (18, 10, 3)]:
-        draw_ellipse_filled(draw, ox + dx, oy + dy, r, r, GREEN_BASE)
+        draw_ellipse_filled(draw, dx, dy, r, r, GREEN_BASE)
     # Lighter tops
     for (dx, dy, r) in [(11, 9, 3), (7, 13, 3), (15, 12, 3)]:
-        draw_ellipse_filled(draw, ox + dx, oy + dy, r, r, GREEN_LIGHT)
+        draw_ellipse_filled(draw, dx, dy, r, r, GREEN_LIGHT)
     # Stem
-    draw.rectangle([ox + 11, oy + 19, ox + 14, oy + 25], fill=GREEN_DARK)
-    draw.rectangle([ox + 12, oy + 19, ox + 13, oy + 24], fill=(80, 140, 55, 255))
+    draw.rectangle([11, 19, 14, 25], fill=GREEN_DARK)
+    draw.rectangle([12, 19, 13, 24], fill=(80, 140, 55, 255))
     # Shine dots
-    img.putpixel((ox + 10, oy + 8), GREEN_SHINE)
-    img.putpixel((ox + 6, oy + 12), GREEN_SHINE)
-    img.putpixel((ox + 16, oy + 10), GREEN_SHINE)
+    draw.point((10, 8), fill=GREEN_SHINE)
+    draw.point((6, 12), fill=GREEN_SHINE)
+    draw.point((16, 10), fill=GREEN_SHINE)
     # Texture bumps
     for (dx, dy) in [(13, 12), (9, 16), (15, 16), (11, 14)]:
-        img.putpixel((ox + dx, oy + dy), GREEN_DARK)
+        draw.point((dx, dy), fill=GREEN_DARK)
 
-    add_pixel_noise(img, ox + 4, oy + 6, 18, 16, [GREEN_LIGHT, GREEN_DARK], 0.06)
+    add_pixel_noise(draw, 4, 6, 18, 16, [GREEN_LIGHT, GREEN_DARK], 0.06)
 
 
-def draw_orange_kibble(img, draw, ox, oy):
+def paint_orange_kibble(draw):
     """Carrot chunk."""
     # Carrot body (tapered triangle-ish with rounded top)
     # Draw as a polygon that's wide at top, narrow at bottom
     draw.polygon([
-        (ox + 8, oy + 6),
-        (ox + 20, oy + 6),
-        (ox + 17, oy + 24),
-        (ox + 11, oy + 24),
+        (8, 6),
+        (20, 6),
+        (17, 24),
+        (11, 24),
     ], fill=ORANGE_BASE)
     # Round the top
-    draw.ellipse([ox + 8, oy + 4, ox + 20, oy + 10], fill=ORANGE_BASE)
+    draw.ellipse([8, 4, 20, 10], fill=ORANGE_BASE)
     # Highlight stripe
-    draw.line([(ox + 12, oy + 7), (ox + 12, oy + 22)], fill=ORANGE_LIGHT, width=1)
-    draw.line([(ox + 13, oy + 7), (ox + 13, oy + 20)], fill=ORANGE_LIGHT, width=1)
+    draw.line([(12, 7), (12, 22)], fill=ORANGE_LIGHT, width=1)
+    draw.line([(13, 7), (13, 20)], fill=ORANGE_LIGHT, width=1)
     # Shadow stripe
-    draw.line([(ox + 17, oy + 8), (ox + 16, oy + 22)], fill=ORANGE_DARK, width=1)
+    draw.line([(17, 8), (16, 22)], fill=ORANGE_DARK, width=1)
     # Score lines (horizontal dashes)
     for y in [11, 15, 19]:
-        draw.line([(ox + 10, oy + y), (ox + 18, oy + y)], fill=ORANGE_DARK, width=1)
+        draw.line([(10, y), (18, y)], fill=ORANGE_DARK, width=1)
     # Leaf top
-    draw.polygon([(ox + 12, oy + 5), (ox + 10, oy + 1), (ox + 14, oy + 3)], fill=ORANGE_LEAF)
-    draw.polygon([(ox + 15, oy + 5), (ox + 18, oy + 1), (ox + 14, oy + 3)], fill=ORANGE_LEAF)
+    draw.polygon([(12, 5), (10, 1), (14, 3)], fill=ORANGE_LEAF)
+    draw.polygon([(15, 5), (18, 1), (14, 3)], fill=ORANGE_LEAF)
     # Shine
-    img.putpixel((ox + 11, oy + 8), ORANGE_SHINE)
-    img.putpixel((ox + 12, oy + 8), ORANGE_SHINE)
+    draw.point((11, 8), fill=ORANGE_SHINE)
+    draw.point((12, 8), fill=ORANGE_SHINE)
 
-    add_pixel_noise(img, ox + 8, oy + 6, 12, 18, [ORANGE_LIGHT, ORANGE_DARK], 0.06)
+    add_pixel_noise(draw, 8, 6, 12, 18, [ORANGE_LIGHT, ORANGE_DARK], 0.06)
 
 
-def draw_blue_kibble(img, draw, ox, oy):
+def paint_blue_kibble(draw):
     """Blueberry piece."""
-    cx, cy = ox + 14, oy + 15
+    cx, cy = 14, 15
     # Main berry body
-    draw.ellipse([ox + 5, oy + 6, ox + 23, oy + 24], fill=BLUE_BASE)
+    draw.ellipse([5, 6, 23, 24], fill=BLUE_BASE)
     # Highlight (upper left)
-    draw.ellipse([ox + 7, oy + 8, ox + 16, oy + 16], fill=BLUE_LIGHT)
+    draw.ellipse([7, 8, 16, 16], fill=BLUE_LIGHT)
     # Shadow (lower right)
-    draw.arc([ox + 5, oy + 6, ox + 23, oy + 24], 10, 170, fill=BLUE_DARK, width=2)
+    draw.arc([5, 6, 23, 24], 10, 170, fill=BLUE_DARK, width=2)
     # Crown (star pattern on top of berry)
     for dx in [-2, 0, 2]:
-        img.putpixel((cx + dx, oy + 7), BLUE_DARK)
+        draw.point((cx + dx, 7), fill=BLUE_DARK)
     for dx in [-3, -1, 1, 3]:
-        img.putpixel((cx + dx, oy + 8), BLUE_DARK)
+        draw.point((cx + dx, 8), fill=BLUE_DARK)
     # Shine dots
-    img.putpixel((ox + 9, oy + 10), BLUE_SHINE)
-    img.putpixel((ox + 10, oy + 10), BLUE_SHINE)
-    img.putpixel((ox + 10, oy + 11), BLUE_SHINE)
+    draw.point((9, 10), fill=BLUE_SHINE)
+    draw.point((10, 10), fill=BLUE_SHINE)
+    draw.point((10, 11), fill=BLUE_SHINE)
     # Tiny stem
-    draw.line([(cx, oy + 5), (cx, oy + 7)], fill=BLUE_STEM, width=1)
-    img.putpixel((cx - 1, oy + 5), BLUE_STEM)
+    draw.line([(cx, 5), (cx, 7)], fill=BLUE_STEM, width=1)
+    draw.point((cx - 1, 5), fill=BLUE_STEM)
 
-    add_pixel_noise(img, ox + 6, oy + 7, 16, 16, [BLUE_LIGHT, BLUE_DARK], 0.06)
+    add_pixel_noise(draw, 6, 7, 16, 16, [BLUE_LIGHT, BLUE_DARK], 0.06)
 
 
-def draw_chicken(img, draw, ox, oy):
+def paint_chicken(draw):
     """Chicken drumstick - the allergen! Drawn with warning coloring."""
     # Drumstick meat (big round part)
-    draw.ellipse([ox + 2, oy + 4, ox + 18, oy + 22], fill=CHICK_BASE)
+    draw.ellipse([2, 4, 18, 22], fill=CHICK_BASE)
     # Highlight
-    draw.ellipse([ox + 4, oy + 6, ox + 13, oy + 15], fill=CHICK_LIGHT)
+    draw.ellipse([4, 6, 13, 15], fill=CHICK_LIGHT)
     # Shadow
-    draw.arc([ox + 2, oy + 4, ox + 18, oy + 22], 20, 160, fill=CHICK_DARK, width=1)
+    draw.arc([2, 4, 18, 22], 20, 160, fill=CHICK_DARK, width=1)
 
     # Bone sticking out
-    draw.rectangle([ox + 17, oy + 10, ox + 24, oy + 14], fill=CHICK_BONE)
-    draw.rectangle([ox + 17, oy + 11, ox + 24, oy + 13], fill=CHICK_BONE)
+    draw.rectangle([17, 10, 24, 14], fill=CHICK_BONE)
+    draw.rectangle([17, 11, 24, 13], fill=CHICK_BONE)
     # Bone knob at end
-    draw.ellipse([ox + 22, oy + 8, ox + 27, oy + 16], fill=CHICK_BONE)
-    draw.ellipse([ox + 23, oy + 9, ox + 26, oy + 15], fill=CHICK_BONE_D)
+    draw.ellipse([22, 8, 27, 16], fill=CHICK_BONE)
+    draw.ellipse([23, 9, 26, 15], fill=CHICK_BONE_D)
     # Bone shadow
-    draw.line([(ox + 17, oy + 14), (ox + 23, oy + 14)], fill=CHICK_BONE_D, width=1)
+    draw.line([(17, 14), (23, 14)], fill=CHICK_BONE_D, width=1)
 
     # Red warning "X" marks
-    draw.line([(ox + 3, oy + 2), (ox + 6, oy + 5)], fill=CHICK_WARN, width=1)
-    draw.line([(ox + 6, oy + 2), (ox + 3, oy + 5)], fill=CHICK_WARN, width=1)
+    draw.line([(3, 2), (6, 5)], fill=CHICK_WARN, width=1)
+    draw.line([(6, 2), (3, 5)], fill=CHICK_WARN, width=1)
 
     # Outline for extra visibility
     # Top arc
-    draw.arc([ox + 1, oy + 3, ox + 19, oy + 23], 200, 360, fill=CHICK_OUTLINE, width=1)
+    draw.arc([1, 3, 19, 23], 200, 360, fill=CHICK_OUTLINE, width=1)
 
-    add_pixel_noise(img, ox + 3, oy + 5, 15, 16, [CHICK_LIGHT, CHICK_DARK], 0.06)
+    add_pixel_noise(draw, 3, 5, 15, 16, [CHICK_LIGHT, CHICK_DARK], 0.06)
 
 
-def draw_mushroom(img, draw, ox, oy):
+def paint_mushroom(draw):
     """Toadstool mushroom - allergen! Red cap with white spots."""
     # Stem
-    draw.rectangle([ox + 10, oy + 14, ox + 17, oy + 25], fill=MUSH_STEM)
-    draw.rectangle([ox + 11, oy + 15, ox + 16, oy + 24], fill=MUSH_STEM)
+    draw.rectangle([10, 14, 17, 25], fill=MUSH_STEM)
+    draw.rectangle([11, 15, 16, 24], fill=MUSH_STEM)
     # Stem shadow
-    draw.line([(ox + 16, oy + 15), (ox + 16, oy + 24)], fill=MUSH_STEM_DK, width=1)
-    draw.line([(ox + 10, oy + 24), (ox + 17, oy + 24)], fill=MUSH_STEM_DK, width=1)
+    draw.line([(16, 15), (16, 24)], fill=MUSH_STEM_DK, width=1)
+    draw.line([(10, 24), (17, 24)], fill=MUSH_STEM_DK, width=1)
     # Stem ring (skirt)
-    draw.line([(ox + 9, oy + 16), (ox + 18, oy + 16)], fill=MUSH_STEM, width=1)
-    draw.line([(ox + 8, oy + 17), (ox + 19, oy + 17)], fill=MUSH_STEM_DK, width=1)
+    draw.line([(9, 16), (18, 16)], fill=MUSH_STEM, width=1)
+    draw.line([(8, 17), (19, 17)], fill=MUSH_STEM_DK, width=1)
 
     # Cap (dome shape)
-    draw.ellipse([ox + 3, oy + 2, ox + 25, oy + 17], fill=MUSH_CAP)
+    draw.ellipse([3, 2, 25, 17], fill=MUSH_CAP)
     # Cap highlight
-    draw.ellipse([ox + 5, oy + 3, ox + 17, oy + 12], fill=MUSH_CAP_LT)
+    draw.ellipse([5, 3, 17, 12], fill=MUSH_CAP_LT)
     # Cap shadow at bottom
-    draw.arc([ox + 3, oy + 2, ox + 25, oy + 17], 10, 170, fill=MUSH_CAP_DK, width=2)
+    draw.arc([3, 2, 25, 17], 10, 170, fill=MUSH_CAP_DK, width=2)
 
     # White spots on cap
     for (dx, dy, r) in [(9, 6, 2), (16, 8, 2), (12, 10, 1), (20, 6, 1), (7, 11, 1)]:
-        draw_ellipse_filled(draw, ox + dx, oy + dy, r, r, MUSH_SPOTS)
+        draw_ellipse_filled(draw, dx, dy, r, r, MUSH_SPOTS)
 
     # Red warning "X" mark (top-right)
-    draw.line([(ox + 21, oy + 1), (ox + 24, oy + 4)], fill=MUSH_WARN, width=1)
-    draw.line([(ox + 24, oy + 1), (ox + 21, oy + 4)], fill=MUSH_WARN, width=1)
+    draw.line([(21, 1), (24, 4)], fill=MUSH_WARN, width=1)
+    draw.line([(24, 1), (21, 4)], fill=MUSH_WARN, width=1)
 
     # Shine dot
-    img.putpixel((ox + 8, oy + 5), (255, 200, 200, 255))
-    img.putpixel((ox + 9, oy + 5), (255, 200, 200, 255))
+    draw.point((8, 5), fill=(255, 200, 200, 255))
+    draw.point((9, 5), fill=(255, 200, 200, 255))
 
-    add_pixel_noise(img, ox + 4, oy + 3, 20, 13, [MUSH_CAP_LT, MUSH_CAP_DK], 0.06)
+    add_pixel_noise(draw, 4, 3, 20, 13, [MUSH_CAP_LT, MUSH_CAP_DK], 0.06)
 
 
-def main():
-    random.seed(42)  # Reproducible output
+FOODS = [
+    paint_brown_kibble,
+    paint_salmon_kibble,
+    paint_green_kibble,
+    paint_orange_kibble,
+    paint_blue_kibble,
+    paint_chicken,
+    paint_mushroom,
+]
+
 
-    img = Image.new("RGBA", (COLS * TILE, TILE), TRANSPARENT)
+def paint_background(draw):
+    """Slightly rounded dark square behind every food."""
+    draw.rounded_rectangle([1, 1, TILE - 2, TILE - 2], radius=3, fill=BG_TILE)
+
+
+def create_food_strip(size=TILE):
+    """All foods side by side as a COLS x 1 strip of size x size tiles."""
+    NOISE.clear()
+    img = Image.new("RGBA", (COLS * size, size), TRANSPARENT)
     draw = ImageDraw.Draw(img)
+    for i, paint in enumerate(FOODS):
+        tile = ScaledDraw(draw, size / TILE, origin=(i * size, 0))
+        paint_background(tile)
+        paint(tile)
+    NOISE.apply(img)
+    return img
+
 
-    # Draw tile backgrounds (slightly rounded dark squares)
-    for i in range(COLS):
-        ox = i * TILE
-        draw.rounded_rectangle([ox + 1, 1, ox + TILE - 2, TILE - 2], radius=3, fill=BG_TILE)
-
-    # Draw each food type
-    draw_brown_kibble(img, draw, 0 * TILE, 0)
-    draw_salmon_kibble(img, draw, 1 * TILE, 0)
-    draw_green_kibble(img, draw, 2 * TILE, 0)
-    draw_orange_kibble(img, draw, 3 * TILE, 0)
-    draw_blue_kibble(img, draw, 4 * TILE, 0)
-    draw_chicken(img, draw, 5 * TILE, 0)
-    draw_mushroom(img, draw, 6 * TILE, 0)
-
-    output_path = os.path.join(OUTPUT_DIR, "food_tiles.png")
-    img.save(output_path)
-    print(f"Generated {output_path} ({img.size[0]}x{img.size[1]})")
+def strip_path(size):
+    name = "food_tiles.png" if size == TILE else f"food_tiles_{size}.png"
+    return os.path.join(OUTPUT_DIR, name)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the food tile strips.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(FOOD_SIZES),
+                        help="tile sizes in pixels to render")
+    args = parser.parse_args()
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    for size in args.sizes:
+        img = create_food_strip(size)
+        output_path = strip_path(size)
+        img.save(output_path)
+        write_texture_import(output_path)
+        print(f"Generated {output_path} ({img.size[0]}x{img.size[1]})")
 
 
 if __name__ == "__main__":
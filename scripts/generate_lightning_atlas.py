@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Generate an atlas of distinct lightning bolts for the intro storm.
+
+Every bolt is a main channel from the top of its cell down towards the
+horizon, built by midpoint displacement (each pass splits every segment
+and pushes the new midpoint sideways by a random amount that shrinks each
+pass), plus forks that branch off it and, one level down, off the forks.
+The geometry for all bolts is built at once as arrays, one displacement
+pass per level, and every glow layer is drawn for the whole atlas in a
+single AccumCanvas batch.
+
+  lightning_atlas.png  - count bolts in a columns-wide grid of frames
+  lightning_atlas.json - frame size, grid, and per-variant region and strike
+                         point (where the main channel ends, in the frame)
+
+The grid also maps straight onto a Sprite2D's hframes/vframes, so the
+cutscene just picks a random frame. The generator writes the grid into the
+LightningBolt node of Cutscene_Intro.tscn, so --count and --columns never
+leave the scene out of step with the atlas.
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+
+import numpy as np
+
+from accum_canvas import AccumCanvas
+from godot_import import write_texture_import
+
+OUTPUT_DIR = "assets/sprites/effects"
+SCENE_PATH = "scenes/Cutscene_Intro.tscn"
+SCENE_NODE = "LightningBolt"
+
+FRAME_SIZE = (64, 128)
+COUNT = 8
+COLUMNS = 4
+
+# Colours (match generate_enhanced_assets.py)
+LIGHTNING_CORE = (255, 255, 255)
+LIGHTNING_BRIGHT = (255, 255, 230)
+LIGHTNING_GLOW = (180, 190, 255)
+LIGHTNING_OUTER = (120, 140, 200)
+
+# Per depth (main channel, forks, forks of forks): displacement passes,
+# forks spawned per channel, and core thickness. Glow only below GLOW_DEPTH.
+LEVELS = (4, 3, 2)
+FORKS = (2, 1, 0)
+THICKNESS = (2, 1, 1)
+GLOW_DEPTH = 2
+
+# Sideways displacement of the first pass as a fraction of segment length,
+# and how much of it each further pass keeps (over 0.5 stays jagged at the
+# small scale, like real bolts)
+ROUGHNESS = 0.2
+DECAY = 0.6
+
+# Keep bolts (and their glow) this far inside their frame
+MARGIN = 5
+
+
+def midpoint_displace(starts, ends, levels, rng, roughness=ROUGHNESS, decay=DECAY):
+    """Jagged polylines from starts to ends, (n, 2) each.
+
+    Returns (n, 2**levels + 1, 2) points. Every pass inserts a midpoint in
+    each segment, pushed along the segment's normal by up to the current
+    spread, which shrinks by decay each pass.
+    """
+    points = np.stack([starts, ends], axis=1).astype(np.float64)
+    spread = np.linalg.norm(ends - starts, axis=1) * roughness
+    for _ in range(levels):
+        delta = points[:, 1:] - points[:, :-1]
+        length = np.maximum(np.linalg.norm(delta, axis=-1, keepdims=True), 1e-9)
+        normal = np.stack([-delta[..., 1], delta[..., 0]], axis=-1) / length
+        offset = rng.uniform(-1, 1, delta.shape[:2]) * spread[:, None]
+        mids = (points[:, 1:] + points[:, :-1]) / 2 + normal * offset[..., None]
+
+        split = np.empty((len(points), points.shape[1] * 2 - 1, 2))
+        split[:, ::2] = points
+        split[:, 1::2] = mids
+        points = split
+        spread = spread * decay
+    return points
+
+
+def grow_forks(channels, depth, rng, frame_size=FRAME_SIZE):
+    """Fork start/end points branching off channels (n, k, 2) at depth."""
+    n, k = channels.shape[:2]
+    forks = FORKS[depth]
+    # Branch from the first two thirds, heading down and out at 20-60 degrees
+    # from straight down
+    idx = rng.integers(1, max(2, k * 2 // 3), (n, forks))
+    starts = channels[np.arange(n)[:, None], idx]
+    angle = math.pi / 2 + rng.choice([-1, 1], (n, forks)) * np.radians(rng.uniform(20, 60, (n, forks)))
+    remaining = np.linalg.norm(channels[:, -1:] - starts, axis=-1)
+    length = remaining * rng.uniform(0.3, 0.6, (n, forks))
+    ends = starts + np.stack([np.cos(angle), np.sin(angle)], axis=-1) * length[..., None]
+    ends[..., 0] = np.clip(ends[..., 0], MARGIN, frame_size[0] - MARGIN)
+    return starts.reshape(-1, 2), ends.reshape(-1, 2)
+
+
+def generate_bolts(count, frame_size=FRAME_SIZE, seed=999):
+    """Polylines for count bolts in frame coordinates.
+
+    Returns (channels, strikes): channels is a list of (depth, (n, k, 2)
+    points, (n,) bolt index) and strikes the (count, 2) main channel ends.
+    """
+    rng = np.random.default_rng(seed)
+    width, height = frame_size
+    starts = np.column_stack([width / 2 + rng.uniform(-width / 6, width / 6, count),
+                              np.zeros(count)])
+    ends = np.column_stack([rng.uniform(MARGIN, width - MARGIN, count),
+                            rng.uniform(height * 0.8, height - MARGIN, count)])
+    owner = np.arange(count)
+
+    channels = []
+    for depth, levels in enumerate(LEVELS):
+        points = midpoint_displace(starts, ends, levels, rng)
+        points[..., 0] = np.clip(points[..., 0], MARGIN, width - MARGIN)
+        points[..., 1] = np.clip(points[..., 1], 0, height - MARGIN)
+        channels.append((depth, points, owner))
+        if not FORKS[depth]:
+            break
+        starts, ends = grow_forks(points, depth, rng, frame_size)
+        owner = np.repeat(owner, FORKS[depth])
+    return channels, channels[0][1][:, -1]
+
+
+def create_lightning_atlas(count=COUNT, columns=COLUMNS, frame_size=FRAME_SIZE, seed=999):
+    """Draw count bolts into one atlas. Returns (image, metadata)."""
+    if count % columns:
+        # The cutscene picks any of hframes * vframes, so no cell may be empty
+        raise ValueError(f"count ({count}) must be a multiple of columns ({columns})")
+    width, height = frame_size
+    rows = math.ceil(count / columns)
+    channels, strikes = generate_bolts(count, frame_size, seed)
+    cells = np.column_stack([np.arange(count) % columns * width, np.arange(count) // columns * height])
+
+    # Same layering as generate_enhanced_assets.create_lightning_bolt:
+    # (colour, extra width, blend mode, glow layer)
+    layers = [((*LIGHTNING_OUTER, 30 + (6 - offset) * 20), offset, "add", True)
+              for offset in range(6, 0, -2)]
+    layers += [(LIGHTNING_GLOW, 2, "over", True),
+               (LIGHTNING_BRIGHT, 0, "over", False),
+               (LIGHTNING_CORE, -1, "over", False)]
+
+    canvas = AccumCanvas((0, 0, 0, 0), (width * columns, height * rows))
+    for color, extra_width, mode, glow_layer in layers:
+        with canvas.batch(color, mode) as draw:
+            for depth, points, owner in channels:
+                if glow_layer and depth >= GLOW_DEPTH:
+                    continue
+                line_width = max(1, THICKNESS[depth] + extra_width)
+                for polyline in np.rint(points + cells[owner][:, None]).astype(int):
+                    draw.line([tuple(p) for p in polyline], fill=255, width=line_width)
+
+    metadata = {
+        "frame_size": [width, height],
+        "columns": columns,
+        "rows": rows,
+        "variants": [{"region": [int(x), int(y), width, height],
+                      "strike": [int(round(sx)), int(round(sy))]}
+                     for (x, y), (sx, sy) in zip(cells, strikes)],
+    }
+    return canvas.image(), metadata
+
+
+def write_scene_grid(columns, rows, scene_path=SCENE_PATH, node=SCENE_NODE):
+    """Set hframes/vframes of the atlas sprite node in scene_path."""
+    with open(scene_path) as f:
+        scene = f.read()
+    header = f'[node name="{node}" '
+    start = scene.index(header)
+    end = scene.find("\n[", start + 1)
+    end = len(scene) if end < 0 else end
+    section = scene[start:end]
+    for key, value in (("hframes", columns), ("vframes", rows)):
+        section, found = re.subn(rf"^{key} = \d+$", f"{key} = {value}", section, flags=re.M)
+        if not found:
+            raise ValueError(f"{scene_path}: {node} has no {key} to update")
+    with open(scene_path, "w") as f:
+        f.write(scene[:start] + section + scene[end:])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the lightning bolt variant atlas.")
+    parser.add_argument("--count", type=int, default=COUNT, help="number of distinct bolts")
+    parser.add_argument("--columns", type=int, default=COLUMNS, help="frames per atlas row")
+    parser.add_argument("--seed", type=int, default=999)
+    args = parser.parse_args()
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    img, metadata = create_lightning_atlas(args.count, args.columns, seed=args.seed)
+    path = os.path.join(OUTPUT_DIR, "lightning_atlas.png")
+    img.save(path)
+    write_texture_import(path)
+    with open(os.path.join(OUTPUT_DIR, "lightning_atlas.json"), "w") as f:
+        json.dump(metadata, f, indent=2)
+        f.write("\n")
+    write_scene_grid(metadata["columns"], metadata["rows"])
+    print(f"Generated {path} ({img.size[0]}x{img.size[1]}, {args.count} bolts), "
+          f"{SCENE_PATH} {metadata['columns']}x{metadata['rows']} frames")
+
+
+if __name__ == "__main__":
+    main()
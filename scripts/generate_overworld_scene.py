@@ -6,6 +6,9 @@ Creates a 6x4 grid of screens with different biomes.
 
 import os
 import random
+import re
+
+from generate_tileset import TILESET_PATH, WATER_FRAMES, animated_tile_index
 
 # World dimensions
 SCREEN_WIDTH = 426
@@ -31,17 +34,31 @@ TILE_DIRT_LEFT = 19
 TILE_DIRT_RIGHT = 20
 TILE_SAND = 32
 TILE_SAND_TOP = 33
-TILE_WATER = 48
-TILE_WATER_DEEP = 52
-TILE_WATER_TOP = 56
-TILE_WATER_BOTTOM = 57
-TILE_WATER_LEFT = 58
-TILE_WATER_RIGHT = 59
 TILE_CLIFF = 80
 TILE_CLIFF_TOP = 81
 TILE_BRIDGE_H = 96
 TILE_BRIDGE_V = 97
 
+
+def water_frame_count(path=TILESET_PATH):
+    """Frames per water loop in the TileSet generate_tileset.py last wrote."""
+    try:
+        with open(path) as f:
+            match = re.search(r"/animation_columns = (\d+)", f.read())
+    except FileNotFoundError:
+        match = None
+    return int(match.group(1)) if match else WATER_FRAMES
+
+
+# Animated water (first frame), in generate_tileset.py's animated tile order
+_water_frames = water_frame_count()
+TILE_WATER = animated_tile_index(0, _water_frames)
+TILE_WATER_DEEP = animated_tile_index(1, _water_frames)
+TILE_WATER_TOP = animated_tile_index(2, _water_frames)
+TILE_WATER_BOTTOM = animated_tile_index(3, _water_frames)
+TILE_WATER_LEFT = animated_tile_index(4, _water_frames)
+TILE_WATER_RIGHT = animated_tile_index(5, _water_frames)
+
 # Biome definitions (row, col) -> biome type
 # [Beach ] [Meadow] [Meadow] [Forest] [Forest] [Mountain]
 # [Beach ] [Home  ] [Meadow] [Forest] [Lake  ] [Mountain]
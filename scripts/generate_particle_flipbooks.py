@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Generate pre-rendered particle flipbooks for the storm: rain, spray and wind.
+
+The static rain, spray and wind_line textures from generate_enhanced_assets.py
+only move as whole particles, so the storm needs hundreds of them. Here the
+motion inside each particle is simulated offline instead: every drop, droplet
+and gust is advanced over all frames at once as (frames, count) arrays and
+drawn into one sheet, frames left to right.
+
+  rain_flipbook.png  - 64x64 tile of slanted drops falling through it; each
+                       drop moves whole tiles per loop, so it wraps seamlessly
+  spray_flipbook.png - 16x16 burst of droplets flying out, falling and fading;
+                       plays once over a particle's lifetime
+  wind_flipbook.png  - 100x16 wind lines with ripples running along them
+  particle_flipbooks.json - frame size, frame count, loop and fps per sheet
+
+Each sheet also gets a CanvasItemMaterial in resources/materials/ with
+particles_animation on and the sheet's frame count, for a CPUParticles2D
+using the sheet as its texture. Looping sheets play at fps with
+anim_speed = lifetime * fps / frames; spray runs once per lifetime with
+anim_speed 1.
+"""
+
+from PIL import Image
+import argparse
+import json
+import math
+import os
+
+import numpy as np
+
+from accum_canvas import AccumCanvas
+from godot_import import res_path, write_texture_import
+from scatter import scatter, stamp, ellipse
+
+OUTPUT_DIR = "assets/sprites/effects"
+MATERIAL_DIR = "resources/materials"
+
+FRAMES = 8
+RAIN_FRAMES = 16  # Heavy drops need the extra frames, see RAIN_TRAVEL
+FPS = 12
+
+RAIN_SIZE = (64, 64)
+SPRAY_SIZE = (16, 16)
+WIND_SIZE = (100, 16)
+
+# Colours (match generate_enhanced_assets.py)
+RAIN_HEAVY = (150, 170, 210)
+RAIN_LIGHT = (180, 200, 230)
+OCEAN_SPRAY = (220, 235, 250)
+WIND_LIGHT = (150, 170, 200)
+WIND_DARK = (100, 120, 160)
+
+# Tiles a light drop travels per loop (across, down); heavy drops go twice
+# as far. The 1:3 slant matches the wind-driven streaks of the static rain
+# sheet. Whole tiles keep the loop seamless, but a drop must also move less
+# than half a tile per frame, or the wrap reads as it moving backwards.
+RAIN_TRAVEL = (1, 3)
+SPRAY_GRAVITY = 0.4
+
+
+def create_rain_flipbook(frames=RAIN_FRAMES, size=RAIN_SIZE, seed=111):
+    """Slanted drops falling through a wrapping tile, fading along their length."""
+    fastest = 2 * max(RAIN_TRAVEL)
+    if frames <= 2 * fastest:
+        raise ValueError(f"Rain needs more than {2 * fastest} frames, or heavy drops appear to rise")
+    width, height = size
+    rng = np.random.default_rng(seed)
+    count = 40
+    xs, ys = rng.integers(0, width, count), rng.integers(0, height, count)
+    lengths = rng.integers(10, 26, count)
+    alphas = rng.integers(100, 201, count)
+    heavy = rng.random(count) > 0.4
+    colors = np.where(heavy[:, None], RAIN_HEAVY, RAIN_LIGHT)
+    # Heavier drops fall twice as fast
+    speeds = np.where(heavy, 2, 1)
+
+    # (frames, count) head positions, then every pixel of every streak
+    t = np.arange(frames)[:, None] / frames
+    head_x = xs + speeds * RAIN_TRAVEL[0] * width * t
+    head_y = ys + speeds * RAIN_TRAVEL[1] * height * t
+    streak = np.repeat(np.arange(count), lengths)
+    i = np.arange(len(streak)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    along = i / lengths[streak]
+    px = (head_x[:, streak] + along * lengths[streak] / 3).astype(int) % width
+    py = (head_y[:, streak] + along * lengths[streak]).astype(int) % height
+    px += np.arange(frames)[:, None] * width
+
+    rgba = np.column_stack([colors[streak], (alphas[streak] * (1 - along * 0.5)).astype(int)])
+    canvas = AccumCanvas((0, 0, 0, 0), (width * frames, height))
+    canvas.points(px.ravel(), py.ravel(), np.tile(rgba, (frames, 1)))
+    return canvas.image()
+
+
+def create_spray_flipbook(frames=FRAMES, size=SPRAY_SIZE, seed=222):
+    """Droplets bursting from the centre, arcing down and fading out."""
+    width, height = size
+    rng = np.random.default_rng(seed)
+    count = 15
+    angles = rng.uniform(0, 2 * math.pi, count)
+    # Pixels per frame, so the fastest droplets just reach the edge
+    speeds = rng.uniform(0.2, 1.0, count) * (min(width, height) / 2 - 2) / frames * 1.5
+    sizes = rng.integers(1, 4, count)
+    alphas = rng.integers(100, 201, count)
+
+    t = np.arange(frames)[:, None]
+    fade = 1 - t / frames
+    px = (width / 2 + np.cos(angles) * speeds * t).astype(int)
+    py = (height / 2 + np.sin(angles) * speeds * t + SPRAY_GRAVITY * t * t / 2).astype(int)
+    # Droplets shrink as they go; drop any that would spill into the next frame
+    kinds = np.maximum(sizes - (t * 3 // frames), 1) - 1
+    inside = (px >= 0) & (px + kinds < width) & (py >= 0) & (py + kinds < height)
+    frame = np.broadcast_to(t, px.shape)
+
+    colors = np.zeros(px.shape + (4,), dtype=np.int64)
+    colors[..., :3] = OCEAN_SPRAY
+    colors[..., 3] = alphas * fade
+    xs, ys, colors, kinds = (px + frame * width)[inside], py[inside], colors[inside], kinds[inside]
+
+    # Central bright spot over the droplets, shrinking away over the first half
+    spots = np.arange(frames // 2)
+    radius = 2 - spots * 4 // frames
+    spot_colors = np.zeros((len(spots), 4), dtype=np.int64)
+    spot_colors[:, :3] = OCEAN_SPRAY
+    spot_colors[:, 3] = 180 * (1 - 2 * spots / frames)
+
+    img = Image.new('RGBA', (width * frames, height), (0, 0, 0, 0))
+    scatter(img, np.r_[xs, spots * width + width // 2 - radius], np.r_[ys, height // 2 - radius],
+            np.r_[colors, spot_colors], [stamp(ellipse, s, s) for s in (1, 2, 3, 4)],
+            np.r_[kinds, radius * 2 - 1])
+    return img
+
+
+def create_wind_flipbook(frames=FRAMES, size=WIND_SIZE):
+    """Three S-curved wind lines, faded at the ends, with ripples running along."""
+    width, height = size
+    x = np.arange(width)
+    t = np.arange(frames)[:, None, None]
+    y_off = np.array([3, 7, 11])[None, :, None]
+    # The ripple moves one whole period per loop, so the last frame meets the first
+    wave = np.sin(x * 0.08 - 2 * math.pi * t / frames) * 2
+    y = (y_off + wave).astype(int)
+    fade = np.clip(np.minimum(x / 15, (width - x) / 15), 0, 1)
+    alpha = np.broadcast_to((180 * fade).astype(int), y.shape)
+    px = np.broadcast_to(x + t * width, y.shape)
+
+    canvas = AccumCanvas((0, 0, 0, 0), (width * frames, height))
+    canvas.points(px.ravel(), y.ravel(), np.column_stack([np.tile(WIND_LIGHT, (alpha.size, 1)), alpha.ravel()]))
+    below = y + 1 < height
+    canvas.points(px[below], (y + 1)[below],
+                  np.column_stack([np.tile(WIND_DARK, (below.sum(), 1)), alpha[below] // 2]))
+    return canvas.image()
+
+
+def write_material(path, frames, loop):
+    """CanvasItemMaterial that plays a frames-long horizontal flipbook on particles."""
+    with open(path, "w") as f:
+        f.write(f"""[gd_resource type="CanvasItemMaterial" format=3]
+
+[resource]
+particles_animation = true
+particles_anim_h_frames = {frames}
+particles_anim_v_frames = 1
+particles_anim_loop = {str(loop).lower()}
+""")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate particle flipbooks for the storm.")
+    parser.add_argument("--frames", type=int, default=None,
+                        help=f"frames per flipbook (default {RAIN_FRAMES} for rain, {FRAMES} otherwise)")
+    parser.add_argument("--fps", type=int, default=FPS, help="playback rate of the looping flipbooks")
+    args = parser.parse_args()
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    os.makedirs(MATERIAL_DIR, exist_ok=True)
+    flipbooks = [
+        ("rain", create_rain_flipbook, RAIN_SIZE, RAIN_FRAMES, True),
+        ("spray", create_spray_flipbook, SPRAY_SIZE, FRAMES, False),
+        ("wind", create_wind_flipbook, WIND_SIZE, FRAMES, True),
+    ]
+    metadata = {}
+    for name, create, (width, height), frames, loop in flipbooks:
+        frames = args.frames or frames
+        img = create(frames)
+        path = os.path.join(OUTPUT_DIR, f"{name}_flipbook.png")
+        img.save(path)
+        write_texture_import(path)
+        material = os.path.join(MATERIAL_DIR, f"{name}_flipbook.tres")
+        write_material(material, frames, loop)
+        metadata[name] = {"texture": res_path(path), "material": res_path(material),
+                          "frame_size": [width, height], "h_frames": frames, "v_frames": 1,
+                          "loop": loop, "fps": args.fps if loop else None}
+        print(f"Generated {path} ({img.size[0]}x{img.size[1]}, {frames} frames)")
+
+    with open(os.path.join(OUTPUT_DIR, "particle_flipbooks.json"), "w") as f:
+        json.dump(metadata, f, indent=2)
+        f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,15 +3,27 @@
 Generate extended Player spritesheet for Charlie's Island Adventure.
 """
 
-from PIL import Image, ImageDraw
+from PIL import Image
 import os
 import math
 
+from godot_import import write_texture_import
+from layer_cache import LAYERS, composite, paint_layer, part_layer
+from palette_swap import write_variants
+from pixel_upscale import upscale, upscale_sheet
+from pose_rig import pose
+from sheet_compiler import compile_sheet, mirror_frames
+from sprite_effects import OUTLINE, SHADOW, apply_effects
+
 # Output directory (matching existing structure)
 SPRITES_DIR = "assets/sprites/characters"
 os.makedirs(SPRITES_DIR, exist_ok=True)
 
 FRAME_SIZE = 32
+FRAME_CENTER = (16, 16)  # Anchor of every layer (the old cx, cy)
+HIDPI_SCALE = 2     # player_spritesheet_2x.png (see scripts/pixel_upscale.py)
+PORTRAIT_SCALE = 4  # player_portrait.png, the idle-down frame for UI
+UPSCALE_METHOD = "xbr"
 
 # Colors
 SKIN = (255, 220, 186, 255)
@@ -25,39 +37,168 @@ DRESS_HIGHLIGHT = (255, 160, 190, 255)
 EYES = (40, 80, 140, 255)
 EYE_WHITE = (255, 255, 255, 255)
 SHOES = (140, 90, 60, 255)
-SHADOW_COLOR = (0, 0, 0, 40)
 
 # Charlie Colors (for holding)
 FUR_CREAM = (255, 248, 235, 255)
 FUR_WHITE = (255, 253, 250, 255)
 FUR_SHADOW = (240, 225, 205, 255)
 
+PALETTE = {
+    "skin": SKIN, "skin_shadow": SKIN_SHADOW,
+    "hair": HAIR, "hair_shadow": HAIR_SHADOW, "hair_highlight": HAIR_HIGHLIGHT,
+    "dress": DRESS, "dress_shadow": DRESS_SHADOW, "dress_highlight": DRESS_HIGHLIGHT,
+    "eyes": EYES, "eye_white": EYE_WHITE, "shoes": SHOES,
+    "mouth": (200, 100, 100, 255), "tongue": (255, 100, 100, 255), "blush": (255, 180, 180, 100),
+    "fur_cream": FUR_CREAM, "fur_white": FUR_WHITE, "fur_shadow": FUR_SHADOW,
+    "charlie_eye": (20, 20, 20, 255), "charlie_nose": (40, 30, 30, 255),
+    "outline": OUTLINE,
+}
+
+# Dress colour variants, swapped at runtime through the palette texture
+# (see palette_swap.py); the base sheet keeps the pink dress.
+DRESS_VARIANTS = {
+    "blue": {"dress": (100, 150, 235, 255), "dress_shadow": (70, 115, 200, 255),
+             "dress_highlight": (150, 190, 250, 255)},
+    "green": {"dress": (110, 200, 120, 255), "dress_shadow": (80, 165, 95, 255),
+              "dress_highlight": (160, 230, 160, 255)},
+    "yellow": {"dress": (250, 205, 90, 255), "dress_shadow": (220, 170, 60, 255),
+               "dress_highlight": (255, 230, 150, 255)},
+}
 
-def draw_charlie_held(draw, cx, cy, bob):
-    """Draw Charlie being held in arms."""
-    # Simple fluffy ball representation
+# Shape parts (see shape_program.py). Side-view parts face left; the
+# right-facing rows are the left rows mirrored (see mirror_row).
+
+# Simple fluffy ball representation of Charlie, anchored at (cx, cy)
+CHARLIE_HELD = (
     # Body
-    draw.ellipse([cx-6, cy-6+bob, cx+6, cy+4+bob], fill=FUR_CREAM)
-    draw.ellipse([cx-4, cy-4+bob, cx+4, cy+2+bob], fill=FUR_WHITE)
-    
+    ("ellipse", (-6, -6, 6, 4), "fur_cream"),
+    ("ellipse", (-4, -4, 4, 2), "fur_white"),
     # Head/Ears
-    draw.ellipse([cx-6, cy-8+bob, cx-2, cy-2+bob], fill=FUR_SHADOW) # L Ear
-    draw.ellipse([cx+2, cy-8+bob, cx+6, cy-2+bob], fill=FUR_SHADOW) # R Ear
-    
+    ("ellipse", (-6, -8, -2, -2), "fur_shadow"),  # L Ear
+    ("ellipse", (2, -8, 6, -2), "fur_shadow"),    # R Ear
     # Face
-    draw.ellipse([cx-3, cy-5+bob, cx-1, cy-3+bob], fill=(20, 20, 20, 255)) # Eye
-    draw.ellipse([cx+1, cy-5+bob, cx+3, cy-3+bob], fill=(20, 20, 20, 255)) # Eye
-    draw.ellipse([cx-1, cy-3+bob, cx+1, cy-1+bob], fill=(40, 30, 30, 255)) # Nose
+    ("ellipse", (-3, -5, -1, -3), "charlie_eye"),
+    ("ellipse", (1, -5, 3, -3), "charlie_eye"),
+    ("ellipse", (-1, -3, 1, -1), "charlie_nose"),
+)
+
+# Anchored at (cx, dress_y)
+DRESS_FRONT = (
+    ("ellipse", (-8, -3, 8, 7), "dress"),
+    ("ellipse", (-6, -1, 6, 5), "dress_highlight"),
+)
+DRESS_BACK = (("ellipse", (-8, -3, 8, 7), "dress"),)
+DRESS_SIDE = (
+    ("ellipse", (-5, -3, 5, 7), "dress"),
+    ("ellipse", (-3, -1, 3, 5), "dress_highlight"),
+)
+
+# Anchored at (cx, head_y)
+HEAD_FRONT = (
+    ("ellipse", (-7, 0, 7, 11), "skin"),  # Face
+    # Hair Base
+    ("ellipse", (-8, -2, 8, 6), "hair"),
+    ("ellipse", (-7, -1, -3, 4), "hair_highlight"),
+    # Sides
+    ("ellipse", (-9, 1, -5, 10), "hair"),
+    ("ellipse", (5, 1, 9, 10), "hair"),
+)
+HEAD_BACK = (
+    ("ellipse", (-7, 0, 7, 11), "hair"),
+    ("ellipse", (-9, -2, 9, 8), "hair"),
+    ("ellipse", (-8, -1, -2, 6), "hair_highlight"),
+    ("ellipse", (-8, 3, 8, 11), "hair"),  # Ponytail/Back hair
+)
+HEAD_SIDE = (
+    ("ellipse", (-6, 0, 4, 11), "skin"),
+    ("ellipse", (-7, -2, 5, 6), "hair"),
+    ("ellipse", (-6, -1, -2, 4), "hair_highlight"),
+    ("ellipse", (2, 1, 6, 10), "hair"),  # Back hair
+    # Profile Eye
+    ("ellipse", (-4, 4, -1, 8), "eye_white"),
+    ("ellipse", (-4, 5, -2, 8), "eyes"),
+)
+EYES_FRONT = {
+    "normal": (
+        ("ellipse", (-5, 4, -2, 8), "eye_white"),
+        ("ellipse", (2, 4, 5, 8), "eye_white"),
+        ("ellipse", (-4, 5, -2, 8), "eyes"),
+        ("ellipse", (2, 5, 4, 8), "eyes"),
+    ),
+    "bored": (  # Flat lids
+        ("rectangle", (-5, 5, -2, 6), "eyes"),
+        ("rectangle", (2, 5, 5, 6), "eyes"),
+    ),
+    "confused": (
+        ("ellipse", (-5, 3, -2, 7), "eyes"),  # One high
+        ("ellipse", (2, 5, 5, 8), "eyes"),    # One low
+    ),
+}
+MOUTHS = {
+    "smile": (("arc", (-2, 7, 2, 9), "mouth", 0, 180),),
+    "tongue": (("ellipse", (-1, 9, 1, 11), "tongue"),),
+    "flat": (("line", ((-2, 9), (2, 9)), "mouth"),),
+    "o": (("ellipse", (-1, 8, 1, 10), "mouth"),),
+}
+BLUSH = (
+    ("ellipse", (-6, 8, -3, 10), "blush"),
+    ("ellipse", (3, 8, 6, 10), "blush"),
+)
+
 
-def draw_player(draw, x, y, direction, action, frame):
+def legs_part(direction, bob, leg_phase):
+    """Shoes and legs, anchored at (cx, cy)."""
+    if direction == 'left':
+        # Side view: back leg, then front leg
+        return (
+            ("ellipse", (1 - leg_phase, 8 + bob, 4 - leg_phase, 12 + bob), "shoes"),
+            ("rectangle", (1, 4 + bob, 4, 9 + bob - leg_phase), "skin_shadow"),
+            ("ellipse", (-4 + leg_phase, 8 + bob, -1 + leg_phase, 12 + bob), "shoes"),
+            ("rectangle", (-4, 4 + bob, -1, 9 + bob + leg_phase), "skin"),
+        )
+    return (
+        ("ellipse", (-6 + leg_phase, 8 + bob, -2 + leg_phase, 12 + bob), "shoes"),
+        ("ellipse", (2 - leg_phase, 8 + bob, 6 - leg_phase, 12 + bob), "shoes"),
+        ("rectangle", (-5, 4 + bob, -2, 9 + bob + leg_phase), "skin"),
+        ("rectangle", (2, 4 + bob, 5, 9 + bob - leg_phase), "skin"),
+    )
+
+
+def arms_part(direction, is_holding, scratching, arm_swing):
+    """Arms, anchored at (cx, dress_y)."""
+    if is_holding:
+        # Wrapped around the centre
+        if direction == 'down':
+            return (("ellipse", (-9, -2, -3, 3), "skin"), ("ellipse", (3, -2, 9, 3), "skin"))
+        if direction == 'left':
+            return (("ellipse", (-2, -2, 2, 3), "skin"),)
+        return ()
+    if direction == 'left':
+        return (("ellipse", (-3, -1, 1, 5 + arm_swing), "skin"),)
+    left_arm = ("ellipse", (-10, -1, -6, 5 + arm_swing), "skin")
+    if scratching and direction == 'down':
+        return (("ellipse", (6, -8, 10, 0), "skin"), left_arm)  # Right arm up to the head
+    return (left_arm, ("ellipse", (6, -1, 10, 5 - arm_swing), "skin"))
+
+# Looping offsets (see pose_rig.py)
+WALK = {"bob": (-1, "bounce"), "leg_phase": (1, "swing"), "arm_swing": (2, "swing")}
+BREATHE = {"bob": (1, "bounce")}        # Breathe down twice per loop
+FOOT_TAP = {"leg_phase": (1, "forward")}  # Tap foot once per loop
+
+def draw_player(image, x, y, direction, action, frame, frames=4):
     """
-    Draw the player character.
+    Draw the player character onto image.
     x, y: Top-left coordinate of the tile
-    direction: 'down', 'up', 'left', 'right'
+    direction: 'down', 'up', 'left', 'right' (the left drawing mirrored)
     action: 'idle', 'walk', 'bored', 'confused', 'pickup', 'hold_idle', 'hold_walk'
-    frame: 0-3
+    frame: 0..frames-1 (walk, idle and bored loops work at any frame count;
+    confused and pickup are keyed to 4 frames)
     """
     
+    mirrored = direction == 'right'
+    if mirrored:
+        direction = 'left'
+
     # --- Animation State Calculation ---
     bob = 0
     leg_phase = 0
@@ -68,25 +209,16 @@ def draw_player(draw, x, y, direction, action, frame):
     pickup_progress = 0
     
     # Walk Cycle
-    if "walk" in action and frame > 0:
-        if frame == 1:
-            bob = -1
-            leg_phase = 1
-            arm_swing = 2
-        elif frame == 2:
-            bob = 0
-            leg_phase = 0
-            arm_swing = 0
-        elif frame == 3:
-            bob = -1
-            leg_phase = -1
-            arm_swing = -2
+    if "walk" in action:
+        walk = pose(WALK, frame, frames)
+        bob = walk["bob"]
+        leg_phase = walk["leg_phase"]
+        arm_swing = walk["arm_swing"]
             
     # Idle Cycle (breathing)
     if action == "idle" or action == "hold_idle":
-        if frame % 2 == 1: # Frames 1 and 3
-            bob = 1 # Breathe down
-        if action == "idle" and frame % 2 == 0: # Tongue out occasionally? 
+        bob = pose(BREATHE, frame, frames)["bob"]
+        if action == "idle" and bob == 0: # Tongue out occasionally? 
             # Request said: "4 frames showing Player stood still breathing, sticking his tongue out"
             # Let's make tongue out constant or flickering? "sticking his tongue out" implies state.
             mouth_state = "tongue"
@@ -95,8 +227,7 @@ def draw_player(draw, x, y, direction, action, frame):
     if action == "bored":
         eyes_state = "bored"
         mouth_state = "flat"
-        if frame == 1: leg_phase = 1 # Tap foot
-        if frame == 3: leg_phase = 0
+        leg_phase = pose(FOOT_TAP, frame, frames)["leg_phase"] # Tap foot
         
     # Confused
     if action == "confused":
@@ -122,206 +253,128 @@ def draw_player(draw, x, y, direction, action, frame):
     # Holding
     is_holding = "hold" in action or (action=="pickup" and frame >= 2)
     
-    cx, cy = x + 16, y + 16
-    
-    # --- DRAWING ---
-    
-    # Shadow
-    draw.ellipse([cx-7, cy+10, cx+7, cy+13], fill=SHADOW_COLOR)
-
-    # SHOES & LEGS
-    if direction in ['down', 'up']:
-        # Shoes
-        draw.ellipse([cx-6+leg_phase, cy+8+bob, cx-2+leg_phase, cy+12+bob], fill=SHOES)
-        draw.ellipse([cx+2-leg_phase, cy+8+bob, cx+6-leg_phase, cy+12+bob], fill=SHOES)
-        # Legs
-        draw.rectangle([cx-5, cy+4+bob, cx-2, cy+9+bob+leg_phase], fill=SKIN)
-        draw.rectangle([cx+2, cy+4+bob, cx+5, cy+9+bob-leg_phase], fill=SKIN)
-    elif direction == 'left':
-        # Side view legs
-        draw.ellipse([cx+1-leg_phase, cy+8+bob, cx+4-leg_phase, cy+12+bob], fill=SHOES) # Back
-        draw.rectangle([cx+1, cy+4+bob, cx+4, cy+9+bob-leg_phase], fill=SKIN_SHADOW)
-        draw.ellipse([cx-4+leg_phase, cy+8+bob, cx-1+leg_phase, cy+12+bob], fill=SHOES) # Front
-        draw.rectangle([cx-4, cy+4+bob, cx-1, cy+9+bob+leg_phase], fill=SKIN)
-    elif direction == 'right':
-        draw.ellipse([cx-4+leg_phase, cy+8+bob, cx-1+leg_phase, cy+12+bob], fill=SHOES) # Back
-        draw.rectangle([cx-4, cy+4+bob, cx-1, cy+9+bob-leg_phase], fill=SKIN_SHADOW)
-        draw.ellipse([cx+1-leg_phase, cy+8+bob, cx+4-leg_phase, cy+12+bob], fill=SHOES) # Front
-        draw.rectangle([cx+1, cy+4+bob, cx+4, cy+9+bob+leg_phase], fill=SKIN)
+    # --- LAYERS ---
+    # Frame-local, anchored at the frame centre; each layer is rasterized
+    # once per distinct shape (see layer_cache.py).
+    layers = [part_layer(legs_part(direction, bob, leg_phase), FRAME_SIZE, FRAME_CENTER, PALETTE)]
 
     # BODY / DRESS
-    dress_y = cy + bob
-    if direction == 'down':
-        draw.ellipse([cx-8, dress_y-3, cx+8, dress_y+7], fill=DRESS)
-        draw.ellipse([cx-6, dress_y-1, cx+6, dress_y+5], fill=DRESS_HIGHLIGHT)
-    elif direction == 'up':
-        draw.ellipse([cx-8, dress_y-3, cx+8, dress_y+7], fill=DRESS)
-    elif direction in ['left', 'right']:
-        draw.ellipse([cx-5, dress_y-3, cx+5, dress_y+7], fill=DRESS)
-        draw.ellipse([cx-3, dress_y-1, cx+3, dress_y+5], fill=DRESS_HIGHLIGHT)
-        
-    # ARMS (Behind if holding?)
-    # If holding, arms are different.
-    
-    if not is_holding:
-        if direction == 'down':
-            if action == "confused" and frame > 1: # Scratch head
-                 draw.ellipse([cx+6, dress_y-8, cx+10, dress_y], fill=SKIN) # Right arm up
-                 draw.ellipse([cx-10, dress_y-1, cx-6, dress_y+5+arm_swing], fill=SKIN) # Left normal
-            else:
-                draw.ellipse([cx-10, dress_y-1, cx-6, dress_y+5+arm_swing], fill=SKIN)
-                draw.ellipse([cx+6, dress_y-1, cx+10, dress_y+5-arm_swing], fill=SKIN)
-        elif direction == 'up':
-            draw.ellipse([cx-10, dress_y-1, cx-6, dress_y+5+arm_swing], fill=SKIN)
-            draw.ellipse([cx+6, dress_y-1, cx+10, dress_y+5-arm_swing], fill=SKIN)
-        elif direction == 'left':
-            draw.ellipse([cx-3, dress_y-1, cx+1, dress_y+5+arm_swing], fill=SKIN)
-        elif direction == 'right':
-             draw.ellipse([cx-1, dress_y-1, cx+3, dress_y+5-arm_swing], fill=SKIN)
-    else:
-        # Holding Arms - wrapped around center
-        if direction == 'down':
-             draw.ellipse([cx-9, dress_y-2, cx-3, dress_y+3], fill=SKIN) # L
-             draw.ellipse([cx+3, dress_y-2, cx+9, dress_y+3], fill=SKIN) # R
-        elif direction in ['left', 'right']:
-             draw.ellipse([cx-2, dress_y-2, cx+2, dress_y+3], fill=SKIN)
+    dress = {'down': DRESS_FRONT, 'up': DRESS_BACK, 'left': DRESS_SIDE}[direction]
+    layers.append(part_layer((("part", dress, 0, bob),), FRAME_SIZE, FRAME_CENTER, PALETTE))
 
-    # CHARLIE (If holding)
+    # ARMS
+    scratching = action == "confused" and frame > 1
+    arms = arms_part(direction, is_holding, scratching, arm_swing)
+    layers.append(part_layer((("part", arms, 0, bob),), FRAME_SIZE, FRAME_CENTER, PALETTE))
+
+    # CHARLIE (If holding; walking up he is held against the chest, hidden
+    # by the player's back)
     if is_holding and direction != 'up':
-        charlie_y = cy + bob + 2
+        charlie_y = bob + 2
         if action == "pickup":
             if frame == 2: charlie_y += 4
             if frame == 3: charlie_y -= 1
         
         offset_x = 0
         if direction == 'left': offset_x = -4
-        if direction == 'right': offset_x = 4
         
-        draw_charlie_held(draw, cx + offset_x, charlie_y, 0)
+        charlie = (("part", CHARLIE_HELD, offset_x, charlie_y),)
+        layers.append(part_layer(charlie, FRAME_SIZE, FRAME_CENTER, PALETTE))
         
     # HEAD
-    head_y = cy - 13 + bob
+    head_y = -13 + bob
     if action == "pickup" and frame == 1: head_y += 4 # Bend down
     
     if direction == 'down':
-        # Face
-        draw.ellipse([cx-7, head_y, cx+7, head_y+11], fill=SKIN)
-        # Hair Base
-        draw.ellipse([cx-8, head_y-2, cx+8, head_y+6], fill=HAIR)
-        draw.ellipse([cx-7, head_y-1, cx-3, head_y+4], fill=HAIR_HIGHLIGHT)
-        # Sides
-        draw.ellipse([cx-9, head_y+1, cx-5, head_y+10], fill=HAIR)
-        draw.ellipse([cx+5, head_y+1, cx+9, head_y+10], fill=HAIR)
-        
-        # Eyes
-        if eyes_state == "normal":
-            draw.ellipse([cx-5, head_y+4, cx-2, head_y+8], fill=EYE_WHITE)
-            draw.ellipse([cx+2, head_y+4, cx+5, head_y+8], fill=EYE_WHITE)
-            draw.ellipse([cx-4, head_y+5, cx-2, head_y+8], fill=EYES)
-            draw.ellipse([cx+2, head_y+5, cx+4, head_y+8], fill=EYES)
-        elif eyes_state == "bored":
-            draw.rectangle([cx-5, head_y+5, cx-2, head_y+6], fill=EYES) # Flat lid
-            draw.rectangle([cx+2, head_y+5, cx+5, head_y+6], fill=EYES)
-        elif eyes_state == "confused":
-            draw.ellipse([cx-5, head_y+3, cx-2, head_y+7], fill=EYES) # One high
-            draw.ellipse([cx+2, head_y+5, cx+5, head_y+8], fill=EYES) # One low
-            
-        # Mouth
-        if mouth_state == "smile":
-             draw.arc([cx-2, head_y+7, cx+2, head_y+9], 0, 180, fill=(200, 100, 100, 255))
-        elif mouth_state == "tongue":
-             draw.ellipse([cx-1, head_y+9, cx+1, head_y+11], fill=(255, 100, 100, 255))
-        elif mouth_state == "flat":
-             draw.line([cx-2, head_y+9, cx+2, head_y+9], fill=(200, 100, 100, 255))
-        elif mouth_state == "o":
-             draw.ellipse([cx-1, head_y+8, cx+1, head_y+10], fill=(200, 100, 100, 255))
-
-        # Blush
-        draw.ellipse([cx-6, head_y+8, cx-3, head_y+10], fill=(255, 180, 180, 100))
-        draw.ellipse([cx+3, head_y+8, cx+6, head_y+10], fill=(255, 180, 180, 100))
-        
-        # Question Mark
-        if action == "confused":
-             draw.text((cx+6, head_y-5), "?", fill=(255, 255, 255, 255))
-
+        head = (HEAD_FRONT, EYES_FRONT[eyes_state], MOUTHS[mouth_state])
     elif direction == 'up':
-        draw.ellipse([cx-7, head_y, cx+7, head_y+11], fill=HAIR)
-        draw.ellipse([cx-9, head_y-2, cx+9, head_y+8], fill=HAIR)
-        draw.ellipse([cx-8, head_y-1, cx-2, head_y+6], fill=HAIR_HIGHLIGHT)
-        # Ponytail/Back hair
-        draw.ellipse([cx-8, head_y+3, cx+8, head_y+11], fill=HAIR)
-        
-    elif direction == 'left':
-        draw.ellipse([cx-6, head_y, cx+4, head_y+11], fill=SKIN)
-        draw.ellipse([cx-7, head_y-2, cx+5, head_y+6], fill=HAIR)
-        draw.ellipse([cx-6, head_y-1, cx-2, head_y+4], fill=HAIR_HIGHLIGHT)
-        draw.ellipse([cx+2, head_y+1, cx+6, head_y+10], fill=HAIR) # Back hair
-        
-        # Profile Eye
-        draw.ellipse([cx-4, head_y+4, cx-1, head_y+8], fill=EYE_WHITE)
-        draw.ellipse([cx-4, head_y+5, cx-2, head_y+8], fill=EYES)
-        
-    elif direction == 'right':
-        draw.ellipse([cx-4, head_y, cx+6, head_y+11], fill=SKIN)
-        draw.ellipse([cx-5, head_y-2, cx+7, head_y+6], fill=HAIR)
-        draw.ellipse([cx+2, head_y-1, cx+6, head_y+4], fill=HAIR_HIGHLIGHT)
-        draw.ellipse([cx-6, head_y+1, cx-2, head_y+10], fill=HAIR) # Back hair
-        
-        # Profile Eye
-        draw.ellipse([cx+1, head_y+4, cx+4, head_y+8], fill=EYE_WHITE)
-        draw.ellipse([cx+2, head_y+5, cx+4, head_y+8], fill=EYES)
-        
-    # CHARLIE (If holding UP, draw him on top of player)
-    # Actually, if UP, Charlie is behind head usually, or obscured.
-    # User said "Holding Charlie Walking Up". Usually you see the held object's top or it's obscured.
-    # Let's assume obscured by head if held against chest, or visible if held high.
-    # Zelda holds things high. Let's make it visible above head (Zelda lift style) or chest?
-    # Requirement: "Holding Charlie".
-    # If walking UP holding something, usually it's hidden or just peek of top. 
-    # Let's draw peeking top if 'up'.
-    if is_holding and direction == 'up':
-        # Draw just ears/top behind head?
-        # Actually in Zelda, when holding normal items, you hold them over head. But a dog?
-        # Let's assume carrying in arms. So blocked by player's back/head.
-        # Maybe just draw little paws sticking out side?
-        pass
+        head = (HEAD_BACK,)
+    else:
+        head = (HEAD_SIDE,)
+    head = tuple(("part", part, 0, head_y) for part in head)
+    layers.append(part_layer(head, FRAME_SIZE, FRAME_CENTER, PALETTE))
+    # Translucent, so on its own layer to blend over the cheeks
+    if direction == 'down':
+        layers.append(part_layer((("part", BLUSH, 0, head_y),), FRAME_SIZE, FRAME_CENTER, PALETTE))
+
+    # Question Mark
+    if action == "confused" and direction == 'down':
+        question_xy = (FRAME_CENTER[0] + 6, FRAME_CENTER[1] + head_y - 5)
+        layers.append(paint_layer(("question", question_xy), FRAME_SIZE,
+                                  lambda d: d.text(question_xy, "?", fill=(255, 255, 255, 255))))
+
+    frame = Image.fromarray(composite(layers), 'RGBA')
+    if mirrored:
+        frame = mirror_frames(frame, FRAME_SIZE)
+    image.alpha_composite(frame, (x, y))
+
+
+# 13 rows, 4 frames each
+SHEET_ROWS = [
+    ("idle", "down"),           # Row 0
+    ("bored", "down"),          # Row 1
+    ("confused", "down"),       # Row 2
+    ("walk", "left"),           # Row 3
+    ("walk", "right"),          # Row 4
+    ("walk", "up"),             # Row 5
+    ("walk", "down"),           # Row 6
+    ("pickup", "down"),         # Row 7
+    ("hold_idle", "down"),      # Row 8
+    ("hold_walk", "left"),      # Row 9
+    ("hold_walk", "right"),     # Row 10
+    ("hold_walk", "up"),        # Row 11
+    ("hold_walk", "down"),      # Row 12
+]
+
+# The walk, idle and bored loops are sampled from their rigs, so this can be
+# raised for smoother loops; the Godot SpriteFrames expect 4.
+FRAMES_PER_ROW = 4
+
+
+def draw_sheet_row(image, spec):
+    """Draw the 4 frames of one (action, direction) row at y=0."""
+    action, direction = spec
+    for col in range(FRAMES_PER_ROW):
+        draw_player(image, col * FRAME_SIZE, 0, direction, action, col, FRAMES_PER_ROW)
+
+
+def mirror_row(spec):
+    """Right-facing rows are the matching left rows flipped frame by frame."""
+    action, direction = spec
+    return (action, "left") if direction == "right" else None
+
+
+def add_effects(sheet):
+    """Outline and drop-shadow every frame of the finished sheet in one pass."""
+    return apply_effects(sheet, FRAME_SIZE, outline=OUTLINE, shadow=SHADOW)
 
 
 def generate_extended_sheet():
-    # 13 rows, 4 frames each
-    rows = [
-        ("idle", "down"),           # Row 0
-        ("bored", "down"),          # Row 1
-        ("confused", "down"),       # Row 2
-        ("walk", "left"),           # Row 3
-        ("walk", "right"),          # Row 4
-        ("walk", "up"),             # Row 5
-        ("walk", "down"),           # Row 6
-        ("pickup", "down"),         # Row 7
-        ("hold_idle", "down"),      # Row 8
-        ("hold_walk", "left"),      # Row 9
-        ("hold_walk", "right"),     # Row 10
-        ("hold_walk", "up"),        # Row 11
-        ("hold_walk", "down"),      # Row 12
-    ]
-    
-    sheet_width = FRAME_SIZE * 4
-    sheet_height = FRAME_SIZE * len(rows)
-    
-    sheet = Image.new('RGBA', (sheet_width, sheet_height), (0, 0, 0, 0))
-    d = ImageDraw.Draw(sheet)
-    
-    for row_idx, (action, direction) in enumerate(rows):
-        y = row_idx * FRAME_SIZE
-        print(f"Generating Row {row_idx}: {action} {direction}")
-        
-        for col in range(4):
-            x = col * FRAME_SIZE
-            draw_player(d, x, y, direction, action, col)
-            
+    # Only rows whose spec or drawing code changed are redrawn; the rest come
+    # from the existing sheet or the .sheet_cache row cache.
     outfile = os.path.join(SPRITES_DIR, "player_spritesheet.png")
-    sheet.save(outfile)
-    print(f"Saved to {outfile}")
+    result = compile_sheet(outfile, SHEET_ROWS, draw_sheet_row, FRAME_SIZE, FRAMES_PER_ROW,
+                           mirror=mirror_row, post=add_effects)
+
+    for row_idx in result["rendered"]:
+        action, direction = SHEET_ROWS[row_idx]
+        print(f"Generated Row {row_idx}: {action} {direction}")
+    print(f"Saved to {outfile} ({len(result['rendered'])} rows rendered, "
+          f"{len(result['restored'])} restored from cache, {len(result['kept'])} unchanged)")
+    print(f"Layer cache: {LAYERS.misses} layers rasterized, {LAYERS.hits} reused")
+    print(f"Saved {write_variants(outfile, PALETTE, DRESS_VARIANTS)} ({len(DRESS_VARIANTS)} dress variants)")
+
+    # Larger variants are scaled from the finished sheet, never redrawn
+    sheet = result["sheet"]
+    variants = [
+        (f"player_spritesheet_{HIDPI_SCALE}x.png", upscale_sheet(sheet, FRAME_SIZE, HIDPI_SCALE, UPSCALE_METHOD)),
+        ("player_portrait.png", upscale(sheet.crop((0, 0, FRAME_SIZE, FRAME_SIZE)), PORTRAIT_SCALE, UPSCALE_METHOD)),
+    ]
+    for name, img in variants:
+        path = os.path.join(SPRITES_DIR, name)
+        img.save(path)
+        write_texture_import(path)
+        print(f"Generated {path} ({img.size[0]}x{img.size[1]})")
 
 if __name__ == "__main__":
     generate_extended_sheet()
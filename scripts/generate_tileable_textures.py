@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Generate seamless, tileable background textures for Charlie's Island Adventure.
+
+Unlike the fixed 426px backgrounds from generate_enhanced_assets.py, these
+wrap around in both directions, so a scene can repeat one small texture
+(texture_repeat on a TextureRect/Sprite2D region) at any width, or scroll it
+without a visible seam.
+
+  sand_tile.png        - dry sand with darker patches and grains
+  storm_cloud_tile.png - translucent storm cloud layer to scroll over the sky
+  storm_water_tile.png - dark rolling water with foam crests
+"""
+
+from PIL import Image
+import argparse
+import os
+
+import numpy as np
+
+from coherent_noise import fbm
+from godot_import import write_texture_import
+from gradient import colorize
+
+OUTPUT_DIR = "assets/sprites/environment"
+
+# Palettes (match generate_enhanced_assets.py)
+SAND_DARK = (210, 185, 140)
+SAND_MID = (230, 205, 160)
+SAND_LIGHT = (245, 225, 180)
+SAND_GRAIN_LIGHT = (255, 240, 200)
+SAND_GRAIN_DARK = (200, 175, 135)
+
+CLOUD_DARK = (20, 25, 40, 255)
+CLOUD_MID = (35, 40, 55, 255)
+CLOUD_LIGHT = (50, 60, 80, 255)
+CLOUD_HIGHLIGHT = (70, 85, 110, 255)
+
+OCEAN_DEEP = (15, 35, 60)
+OCEAN_MID = (25, 55, 90)
+OCEAN_LIGHT = (40, 80, 120)
+OCEAN_CREST = (70, 110, 150)
+OCEAN_FOAM = (180, 200, 220)
+
+# Default tile sizes (width, height); every texture tiles at any size.
+SAND_SIZE = (64, 64)
+CLOUD_SIZE = (256, 96)
+WATER_SIZE = (128, 64)
+
+
+def create_sand_tile(size=SAND_SIZE, seed=333):
+    """Dry sand: soft light/dark patches plus scattered single-pixel grains."""
+    width, height = size
+    patches = fbm(size, period=2, octaves=3, seed=seed)
+    img = colorize(patches, [(0, SAND_DARK), (0.45, SAND_MID), (1, SAND_LIGHT)], dither=True)
+
+    # Grains are independent per pixel, so they tile trivially.
+    grains = np.random.default_rng(seed).random((height, width))
+    img[grains < 0.04] = SAND_GRAIN_LIGHT
+    img[grains > 0.96] = SAND_GRAIN_DARK
+    return Image.fromarray(img, 'RGB').convert('RGBA')
+
+
+def create_storm_cloud_tile(size=CLOUD_SIZE, seed=42):
+    """Storm cloud layer: transparent gaps between dark, lit-edged clouds."""
+    width, height = size
+    density = fbm(size, period=(width // 64 or 1, height // 48 or 1), octaves=5, seed=seed)
+    stops = [(0, (*CLOUD_DARK[:3], 0)), (0.45, (*CLOUD_DARK[:3], 0)), (0.5, CLOUD_DARK),
+             (0.65, CLOUD_MID), (0.8, CLOUD_LIGHT), (0.95, CLOUD_HIGHLIGHT)]
+    return Image.fromarray(colorize(density, stops), 'RGBA')
+
+
+def create_storm_water_tile(size=WATER_SIZE, seed=789):
+    """Dark water with rolling wave bands and foam on the crests."""
+    width, height = size
+    # Stretched noise (more cells across than down) bends the wave bands.
+    warp = fbm(size, period=(4, 2), octaves=3, seed=seed)
+    wave_count = 4
+    y = np.arange(height)[:, None] / height
+    waves = 0.5 + 0.5 * np.sin(2 * np.pi * (y * wave_count + warp * 1.5))
+    detail = fbm(size, period=(8, 4), octaves=2, seed=seed + 1)
+    height_field = 0.75 * waves + 0.25 * detail
+    # Flat colour bands (repeated stop positions) for a pixel-art look
+    bands = [(0, OCEAN_DEEP), (0.45, OCEAN_MID), (0.75, OCEAN_LIGHT), (0.9, OCEAN_CREST),
+             (0.97, OCEAN_FOAM)]
+    stops = [stop for (pos, color), (next_pos, _) in zip(bands, bands[1:] + [(1, None)])
+             for stop in ((pos, color), (next_pos, color))]
+    return Image.fromarray(colorize(height_field, stops), 'RGB').convert('RGBA')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate tileable background textures.")
+    parser.add_argument("--scale", type=int, default=1,
+                        help="multiply every tile size (the textures still tile)")
+    args = parser.parse_args()
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    textures = [
+        ("sand_tile.png", create_sand_tile, SAND_SIZE),
+        ("storm_cloud_tile.png", create_storm_cloud_tile, CLOUD_SIZE),
+        ("storm_water_tile.png", create_storm_water_tile, WATER_SIZE),
+    ]
+    for name, create, (width, height) in textures:
+        img = create((width * args.scale, height * args.scale))
+        path = os.path.join(OUTPUT_DIR, name)
+        img.save(path)
+        write_texture_import(path)
+        print(f"Generated {path} ({img.size[0]}x{img.size[1]})")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,9 +5,14 @@ Creates a 256x256 pixel atlas with 16x16 tiles in a retro pixel art style.
 """
 
 from PIL import Image, ImageDraw
+import argparse
 import os
 import random
 
+import numpy as np
+
+from noise_masks import NoiseField
+
 # Output
 OUTPUT_DIR = "assets/sprites/tiles"
 os.makedirs(OUTPUT_DIR, exist_ok=True)
@@ -15,6 +20,14 @@ os.makedirs(OUTPUT_DIR, exist_ok=True)
 TILE_SIZE = 16
 ATLAS_SIZE = 256  # 16x16 tiles
 
+TILESET_PATH = "resources/tilesets/overworld_tileset.tres"
+
+# Animated water: frames per loop and seconds per frame. Each animated tile
+# lays its frames out left to right from its atlas cell, from ANIMATION_ROW.
+WATER_FRAMES = 4
+WATER_FRAME_DURATION = 0.25
+ANIMATION_ROW = 8
+
 # Color Palettes
 # Grass
 GRASS_BASE = (76, 140, 64, 255)
@@ -52,13 +65,15 @@ FLOWER_BLUE = (100, 140, 220, 255)
 FLOWER_WHITE = (240, 240, 240, 255)
 
 
+# Noise is queued while the tiles are drawn and applied to the whole atlas in
+# one pass before saving. Each region only touches pixels that are still its
+# base colour, so details drawn on top afterwards are kept.
+NOISE = NoiseField(seed=42)
+
+
 def add_noise(draw, x, y, w, h, base_color, light_color, dark_color, density=0.15):
     """Add pixel noise/dithering to an area."""
-    for py in range(y, y + h):
-        for px in range(x, x + w):
-            if random.random() < density:
-                color = light_color if random.random() < 0.5 else dark_color
-                draw.point((px, py), fill=color)
+    NOISE.add((x, y, w, h), [light_color, dark_color], density, base=base_color)
 
 
 def draw_grass_base(draw, x, y):
@@ -126,43 +141,43 @@ def draw_sand_edge(draw, x, y, edge):
         draw.rectangle([x + TILE_SIZE - 4, y, x + TILE_SIZE - 1, y + TILE_SIZE - 1], fill=GRASS_BASE)
 
 
-def draw_water_base(draw, x, y, frame=0):
-    """Draw a basic water tile with animation frame."""
-    draw.rectangle([x, y, x + TILE_SIZE - 1, y + TILE_SIZE - 1], fill=WATER_BASE)
-
-    # Animated wave pattern
-    offset = (frame * 4) % TILE_SIZE
-    for i in range(0, TILE_SIZE, 4):
-        wave_y = y + ((i + offset) % TILE_SIZE)
-        draw.line([x, wave_y, x + TILE_SIZE - 1, wave_y], fill=WATER_LIGHT)
-
-
-def draw_water_deep(draw, x, y, frame=0):
-    """Draw deep water (impassable)."""
-    draw.rectangle([x, y, x + TILE_SIZE - 1, y + TILE_SIZE - 1], fill=WATER_DEEP)
-    offset = (frame * 3) % TILE_SIZE
-    for i in range(0, TILE_SIZE, 5):
-        wave_y = y + ((i + offset) % TILE_SIZE)
-        draw.line([x, wave_y, x + TILE_SIZE - 1, wave_y], fill=WATER_BASE)
-
-
-def draw_water_edge(draw, x, y, edge, frame=0):
-    """Draw water with land edge (sand/grass showing)."""
-    draw_water_base(draw, x, y, frame)
-
-    # Add foam/edge
-    if 'top' in edge:
-        draw.rectangle([x, y, x + TILE_SIZE - 1, y + 2], fill=SAND_BASE)
-        draw.line([x, y + 3, x + TILE_SIZE - 1, y + 3], fill=WATER_FOAM)
-    if 'bottom' in edge:
-        draw.rectangle([x, y + TILE_SIZE - 3, x + TILE_SIZE - 1, y + TILE_SIZE - 1], fill=SAND_BASE)
-        draw.line([x, y + TILE_SIZE - 4, x + TILE_SIZE - 1, y + TILE_SIZE - 4], fill=WATER_FOAM)
-    if 'left' in edge:
-        draw.rectangle([x, y, x + 2, y + TILE_SIZE - 1], fill=SAND_BASE)
-        draw.line([x + 3, y, x + 3, y + TILE_SIZE - 1], fill=WATER_FOAM)
-    if 'right' in edge:
-        draw.rectangle([x + TILE_SIZE - 3, y, x + TILE_SIZE - 1, y + TILE_SIZE - 1], fill=SAND_BASE)
-        draw.line([x + TILE_SIZE - 4, y, x + TILE_SIZE - 4, y + TILE_SIZE - 1], fill=WATER_FOAM)
+def water_frames(edges, frames=WATER_FRAMES):
+    """Every water tile for a whole animation loop, as one array.
+
+    Returns (2 + len(edges), frames, TILE_SIZE, TILE_SIZE, 4) uint8 tiles:
+    shallow water, deep water, then shallow water with each sand edge. The
+    wave field only uses whole periods across the tile and across the loop
+    (phase = frame / frames), so tiles wrap seamlessly in space and the last
+    frame runs straight back into the first.
+    """
+    phase = np.arange(frames)[:, None, None] / frames
+    y, x = np.mgrid[0:TILE_SIZE, 0:TILE_SIZE] / TILE_SIZE
+    tau = 2 * np.pi
+
+    # Wave crests drifting down the tile, bent sideways by a slower ripple
+    shallow = np.sin(tau * (2 * y - phase) + 1.2 * np.sin(tau * (x + phase)))
+    deep = np.sin(tau * (y - phase) + 0.8 * np.sin(tau * (2 * x - phase)))
+
+    tiles = np.empty((2 + len(edges), frames, TILE_SIZE, TILE_SIZE, 4), dtype=np.uint8)
+    tiles[0] = WATER_BASE
+    tiles[0][shallow > 0.75] = WATER_LIGHT
+    tiles[0][shallow < -0.9] = WATER_DARK
+    tiles[1] = WATER_DEEP
+    tiles[1][deep > 0.8] = WATER_BASE
+
+    # Edges: 3px of sand on each listed side, with a foam line that laps
+    # one pixel in and back out again over the loop
+    row, col = np.mgrid[0:TILE_SIZE, 0:TILE_SIZE]
+    distance = {'top': row, 'bottom': TILE_SIZE - 1 - row, 'left': col, 'right': TILE_SIZE - 1 - col}
+    lap = np.rint(0.5 - 0.5 * np.cos(tau * phase)).astype(int)
+    for i, edge in enumerate(edges):
+        sides = np.stack([distance[side] for side in edge.split(',')])
+        nearest = sides.min(axis=0)
+        tile = tiles[2 + i]
+        tile[:] = tiles[0]
+        tile[(nearest == 3 + lap) | (nearest == 3)] = WATER_FOAM
+        tile[:, nearest < 3] = SAND_BASE
+    return tiles
 
 
 def draw_cliff_base(draw, x, y):
@@ -194,9 +209,55 @@ def draw_cliff_side(draw, x, y, side='left'):
         draw.line([x + TILE_SIZE - 1, y, x + TILE_SIZE - 1, y + TILE_SIZE - 1], fill=CLIFF_HIGHLIGHT)
 
 
-def generate_tileset():
-    """Generate the complete tileset atlas."""
+def animated_tile_index(i, frames):
+    """Atlas index of the i-th animated tile's first frame."""
+    per_row = ATLAS_SIZE // TILE_SIZE // frames
+    if per_row == 0 or ANIMATION_ROW + i // per_row >= ATLAS_SIZE // TILE_SIZE:
+        raise ValueError(f"{frames}-frame animations don't fit below row {ANIMATION_ROW}")
+    row = ANIMATION_ROW + i // per_row
+    return row * (ATLAS_SIZE // TILE_SIZE) + (i % per_row) * frames
+
+
+def write_tileset(path, animated, frames, duration):
+    """Write the TileSet with every atlas cell as a tile; animated tiles
+    (atlas indices of their first frame) loop frames cells to the right."""
+    columns = ATLAS_SIZE // TILE_SIZE
+    animated = set(animated)
+    covered = {index + f for index in animated for f in range(1, frames)}
+    lines = []
+    for index in range(columns * columns):
+        if index in covered:
+            continue
+        cell = f"{index % columns}:{index // columns}"
+        if index in animated:
+            lines.append(f"{cell}/animation_columns = {frames}")
+            lines += [f"{cell}/animation_frame_{f}/duration = {duration}" for f in range(frames)]
+        lines.append(f"{cell}/0 = 0")
+
+    with open(path, "w") as f:
+        f.write(f"""[gd_resource type="TileSet" load_steps=3 format=3 uid="uid://overworld_tileset"]
+
+[ext_resource type="Texture2D" path="res://assets/sprites/tiles/terrain_atlas.png" id="1_terrain"]
+
+[sub_resource type="TileSetAtlasSource" id="TileSetAtlasSource_terrain"]
+texture = ExtResource("1_terrain")
+texture_region_size = Vector2i({TILE_SIZE}, {TILE_SIZE})
+use_texture_padding = true
+""")
+        f.write("\n".join(lines) + "\n")
+        f.write(f"""
+[resource]
+tile_size = Vector2i({TILE_SIZE}, {TILE_SIZE})
+physics_layer_0/collision_layer = 1
+physics_layer_0/collision_mask = 0
+sources/0 = SubResource("TileSetAtlasSource_terrain")
+""")
+
+
+def generate_tileset(water_frame_count=WATER_FRAMES, frame_duration=WATER_FRAME_DURATION):
+    """Generate the complete tileset atlas and its TileSet resource."""
     random.seed(42)  # Consistent generation
+    NOISE.clear()
 
     atlas = Image.new('RGBA', (ATLAS_SIZE, ATLAS_SIZE), (0, 0, 0, 0))
     draw = ImageDraw.Draw(atlas)
@@ -207,7 +268,8 @@ def generate_tileset():
     # Row 2: Sand variants (32-47)
     # Row 3-4: Water variants + animation frames (48-79)
     # Row 5-6: Cliff/mountain variants (80-111)
-    # Row 7+: Autotile edges and corners
+    # Row 7: Bridges
+    # Row 8+: Animated water, frames left to right
 
     tile_index = 0
 
@@ -272,32 +334,33 @@ def generate_tileset():
         draw_sand_base(draw, x, y)
 
     # === Row 3-4: Water ===
+    # Static snapshots of the animated tiles below, kept at their old ids
+    water = water_frames(edges, water_frame_count)
+    snapshot = [f * water_frame_count // 4 for f in range(4)]
+
+    def paste_tile(index, tile):
+        atlas.paste(Image.fromarray(tile, 'RGBA'), get_tile_pos(index))
+
     # 48-51: Base water animation (4 frames)
     for frame in range(4):
-        x, y = get_tile_pos(48 + frame)
-        draw_water_base(draw, x, y, frame)
+        paste_tile(48 + frame, water[0, snapshot[frame]])
 
     # 52-55: Deep water animation (4 frames)
     for frame in range(4):
-        x, y = get_tile_pos(52 + frame)
-        draw_water_deep(draw, x, y, frame)
+        paste_tile(52 + frame, water[1, snapshot[frame]])
 
     # 56-63: Water edges (with frame 0)
     for i, edge in enumerate(edges):
-        x, y = get_tile_pos(56 + i)
-        draw_water_edge(draw, x, y, edge, 0)
+        paste_tile(56 + i, water[2 + i, 0])
 
     # 64-79: More water edge variants for other frames
     for frame in range(1, 4):
         for i in range(4):
-            x, y = get_tile_pos(64 + (frame - 1) * 4 + i)
-            edge = edges[i]
-            draw_water_edge(draw, x, y, edge, frame)
+            paste_tile(64 + (frame - 1) * 4 + i, water[2 + i, snapshot[frame]])
 
     # Fill remaining water row slots
     for i in range(76, 80):
-        x, y = get_tile_pos(i)
-        draw_water_base(draw, x, y, 0)
+        paste_tile(i, water[0, 0])
 
     # === Row 5-6: Cliffs/Mountains ===
     # 80: Base cliff
@@ -337,12 +400,24 @@ def generate_tileset():
     for py in range(y + 2, y + TILE_SIZE - 2, 4):
         draw.line([x + 4, py, x + TILE_SIZE - 5, py], fill=DIRT_DARK)
 
+    # === Row 8+: Animated water ===
+    # Each tile's frames run left to right from its first cell; Godot plays
+    # them from the TileSet's animation properties.
+    animated = {}
+    for i, name in enumerate(["water", "water_deep"] + [f"water_{edge.replace(',', '_')}" for edge in edges]):
+        index = animated_tile_index(i, water_frame_count)
+        animated[name] = index
+        for frame in range(water_frame_count):
+            paste_tile(index + frame, water[i, frame])
+
     # Fill remaining tiles with grass for now
     for i in range(98, 256):
         x, y = get_tile_pos(i)
         if atlas.getpixel((x, y))[3] == 0:  # Only if transparent
             draw_grass_base(draw, x, y)
 
+    NOISE.apply(atlas)
+
     # Save
     output_path = os.path.join(OUTPUT_DIR, "terrain_atlas.png")
     atlas.save(output_path)
@@ -354,11 +429,27 @@ def generate_tileset():
     print("  0-15:   Grass variants (0=base, 3-6=flowers)")
     print("  16-31:  Dirt/path (16=base, 17-24=edges)")
     print("  32-47:  Sand (32=base, 33-40=edges)")
-    print("  48-55:  Water (48-51=shallow animated, 52-55=deep animated)")
-    print("  56-79:  Water edges")
+    print("  48-55:  Water snapshots (48-51=shallow, 52-55=deep)")
+    print("  56-79:  Water edge snapshots")
     print("  80-95:  Cliff/mountain (80=base, 81=top)")
     print("  96-97:  Bridge (96=horizontal, 97=vertical)")
+    print(f"  {min(animated.values())}+:   Animated water ({water_frame_count} frames each)")
+    for name, index in animated.items():
+        print(f"    {index:3d}: {name}")
+
+    write_tileset(TILESET_PATH, animated.values(), water_frame_count, frame_duration)
+    print(f"\nWrote {TILESET_PATH}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the terrain atlas and TileSet.")
+    parser.add_argument("--water-frames", type=int, default=WATER_FRAMES,
+                        help="frames per water animation loop")
+    parser.add_argument("--frame-duration", type=float, default=WATER_FRAME_DURATION,
+                        help="seconds per water frame")
+    args = parser.parse_args()
+    generate_tileset(args.water_frames, args.frame_duration)
 
 
 if __name__ == "__main__":
-    generate_tileset()
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Write Godot .import sidecars for newly generated textures.
+
+Godot creates these itself the next time the editor scans the project, but
+writing them from the generator means new textures have a stable UID and
+the pixel-art import settings used by the rest of assets/ (lossless, no
+mipmaps) from the first commit. Existing .import files are left alone so
+their UIDs never change.
+
+Paths are relative to the repo root, like the generators' OUTPUT_DIRs.
+"""
+
+import hashlib
+import os
+import random
+
+UID_CHARS = "abcdefghijklmnopqrstuvwxyz0123456789"
+
+TEXTURE_IMPORT = """[remap]
+
+importer="texture"
+type="CompressedTexture2D"
+uid="{uid}"
+path="res://.godot/imported/{name}-{digest}.ctex"
+metadata={{
+"vram_texture": false
+}}
+
+[deps]
+
+source_file="{res_path}"
+dest_files=["res://.godot/imported/{name}-{digest}.ctex"]
+
+[params]
+
+compress/mode=0
+compress/high_quality=false
+compress/lossy_quality=0.7
+compress/uastc_level=0
+compress/rdo_quality_loss=0.0
+compress/hdr_compression=1
+compress/normal_map=0
+compress/channel_pack=0
+mipmaps/generate=false
+mipmaps/limit=-1
+roughness/mode=0
+roughness/src_normal=""
+process/channel_remap/red=0
+process/channel_remap/green=1
+process/channel_remap/blue=2
+process/channel_remap/alpha=3
+process/fix_alpha_border=true
+process/premult_alpha=false
+process/normal_map_invert_y=false
+process/hdr_as_srgb=false
+process/hdr_clamp_exposure=false
+process/size_limit=0
+detect_3d/compress_to=1
+"""
+
+
+def new_uid():
+    """Random resource UID in Godot's text form (base 36, 63-bit id)."""
+    value = random.SystemRandom().getrandbits(63)
+    chars = ""
+    while True:
+        chars = UID_CHARS[value % 36] + chars
+        value //= 36
+        if value == 0:
+            return "uid://" + chars
+
+
+def res_path(path):
+    return "res://" + os.path.relpath(path).replace(os.sep, "/")
+
+
+def write_texture_import(png_path):
+    """Write png_path.import unless it already exists. Returns True if written."""
+    import_path = png_path + ".import"
+    if os.path.exists(import_path):
+        return False
+    source = res_path(png_path)
+    with open(import_path, "w") as f:
+        f.write(TEXTURE_IMPORT.format(
+            uid=new_uid(),
+            name=os.path.basename(png_path),
+            digest=hashlib.md5(source.encode()).hexdigest(),
+            res_path=source,
+        ))
+    return True
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Multi-stop colour gradients built as whole NumPy arrays.
+
+A gradient is a list of (position, colour) stops. Pixel i along the axis sits
+at position i / length (so the last row never quite reaches 1.0, as in the
+per-scanline loops this replaces), falls in the segment of the last stop at
+or before it and is interpolated linearly, then truncated to an integer.
+Stops may lie outside 0..1 when only part of a ramp should be visible:
+
+    # Fade from dark halfway towards mid over the image height
+    linear_gradient((426, 120), [(0, DARK), (2, MID)])
+
+Radial gradients measure the position as the distance from a centre divided
+by a radius. dither=True adds an ordered (Bayer) threshold before truncating
+so long, shallow ramps break into a pattern instead of bands.
+"""
+
+from PIL import Image
+
+import numpy as np
+
+from dither import bayer_thresholds
+
+
+def _interpolate(positions, stops):
+    """Map an array of positions to float colours (..., channels)."""
+    stop_pos = np.array([p for p, _ in stops], dtype=np.float64)
+    colors = np.array([c for _, c in stops], dtype=np.float64)
+
+    if len(stops) == 1:
+        return np.broadcast_to(colors[0], positions.shape + colors.shape[1:]).copy()
+
+    # Segment = last stop at or before the position; t is clamped so values
+    # before the first or after the last stop hold that stop's colour.
+    seg = np.clip(np.searchsorted(stop_pos, positions, side="right") - 1, 0, len(stops) - 2)
+    start, end = stop_pos[seg], stop_pos[seg + 1]
+    t = np.clip((positions - start) / (end - start), 0.0, 1.0)[..., None]
+    return colors[seg] + (colors[seg + 1] - colors[seg]) * t
+
+
+def _quantize(values, thresholds=None):
+    """Truncate float colours to uint8, adding ordered-dither thresholds first."""
+    if thresholds is not None:
+        values = values + (thresholds[..., None] - 0.5)
+    return np.clip(np.floor(values), 0, 255).astype(np.uint8)
+
+
+def linear_gradient(size, stops, axis="y", dither=False, bayer_size=4):
+    """Return an (H, W, C) uint8 array ramping along axis "y" (top to bottom)
+    or "x" (left to right). C is the number of channels in the stop colours."""
+    width, height = size
+    length, across = (height, width) if axis == "y" else (width, height)
+    ramp = _interpolate(np.arange(length) / length, stops)
+
+    if dither:
+        # The threshold map repeats every bayer_size pixels across the ramp,
+        # so only one period is quantized and then tiled.
+        period = min(bayer_size, across)
+        thresholds = bayer_thresholds((period, length), bayer_size)
+        band = _quantize(ramp[:, None, :], thresholds)
+        band = np.tile(band, (1, -(-across // period), 1))[:, :across]
+    else:
+        band = np.broadcast_to(_quantize(ramp)[:, None, :], (length, across, ramp.shape[-1]))
+
+    if axis != "y":
+        band = band.transpose(1, 0, 2)
+    return np.ascontiguousarray(band)
+
+
+def colorize(values, stops, dither=False):
+    """Map an (H, W) array of positions (e.g. noise in 0..1) through colour
+    stops to an (H, W, C) uint8 array."""
+    thresholds = bayer_thresholds((values.shape[1], values.shape[0])) if dither else None
+    return _quantize(_interpolate(np.asarray(values, dtype=np.float64), stops), thresholds)
+
+
+def radial_gradient(size, stops, center=None, radius=None, dither=False):
+    """Return an (H, W, C) uint8 array ramping outwards from center (x, y),
+    reaching position 1.0 at radius pixels (default: the nearest edge)."""
+    width, height = size
+    cx, cy = center if center is not None else (width / 2, height / 2)
+    if radius is None:
+        radius = min(width, height) / 2
+    ys, xs = np.ogrid[:height, :width]
+    distance = np.hypot(xs - cx, ys - cy) / radius
+    thresholds = bayer_thresholds(size) if dither else None
+    return _quantize(_interpolate(distance, stops), thresholds)
+
+
+def gradient_image(size, stops, kind="linear", **kwargs):
+    """Return a new RGBA image filled with a linear or radial gradient."""
+    values = (radial_gradient if kind == "radial" else linear_gradient)(size, stops, **kwargs)
+    mode = {3: 'RGB', 4: 'RGBA'}[values.shape[-1]]
+    return Image.fromarray(values, mode).convert('RGBA')
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Whole-frame layers for character sheets, cached and alpha-composited.
+
+A character frame is a stack of layers (shadow, legs, dress, arms, a held
+pet, head...), each drawn on its own transparent frame-sized canvas. Most
+layers stay the same across many frames and rows: a walk row and its
+hold_walk row differ only in the arms and the held pet, and the head only
+moves when the body bobs. Each layer is rasterized once and kept in a
+bounded LRU cache (shape_program.RasterCache), so a frame costs one
+composite of mostly cached layers:
+
+    legs = (("ellipse", (-6, 8, -2, 12), "shoes"), ...)   # a shape part
+    frame = composite([part_layer(SHADOW, 32, (16, 16), PALETTE),
+                       part_layer(legs, 32, (16, 16), PALETTE),
+                       paint_layer(("question", -13), 32, draw_question)])
+
+Part layers are keyed by the part's content and colours rather than by a
+pose name, so two poses that happen to draw the same shapes share a layer
+and a changed part can never return a stale one. The key also keeps
+sheet_compiler's per-row code hash sound: the code that builds a part runs
+for every frame, only the rasterizing is skipped. Layers drawn by a
+function (text, say) are keyed by the caller.
+
+Layers are composited back to front with straight-alpha "over" as NumPy
+arrays. An opaque pixel replaces what is under it and a transparent one
+leaves it alone, so opaque layers come out exactly as if drawn in order on
+one canvas; translucent pixels (shadows, blush) blend with the layers
+below instead of punching through them.
+"""
+
+from PIL import Image, ImageDraw
+
+import numpy as np
+
+from shape_program import RasterCache, flatten, rasterize, resolve_colour
+
+LAYERS = RasterCache(maxsize=256)
+
+
+def _size(size):
+    return (size, size) if isinstance(size, int) else tuple(size)
+
+
+def _freeze(image):
+    pixels = np.array(image.convert('RGBA'))
+    pixels.setflags(write=False)
+    return pixels
+
+
+def part_layer(part, size, anchor, palette=None, cache=LAYERS):
+    """(h, w, 4) uint8 pixels of part drawn with its anchor at anchor on a
+    transparent canvas of size (int or (width, height))."""
+    size = _size(size)
+    ops = flatten(part)
+    colours = tuple(resolve_colour(op[2], palette) for op in ops)
+
+    def build():
+        canvas = Image.new('RGBA', size, (0, 0, 0, 0))
+        if ops:
+            tile, mask, left, top = rasterize(ops, colours)
+            canvas.paste(tile, (anchor[0] + left, anchor[1] + top), mask)
+        return _freeze(canvas)
+    return cache.get(("part", part, colours, size, tuple(anchor)), build)
+
+
+def paint_layer(key, size, paint, cache=LAYERS):
+    """Pixels of paint(draw) on a transparent canvas of size, built once per key."""
+    size = _size(size)
+
+    def build():
+        canvas = Image.new('RGBA', size, (0, 0, 0, 0))
+        paint(ImageDraw.Draw(canvas))
+        return _freeze(canvas)
+    return cache.get(("paint", key, size), build)
+
+
+def alpha_over(dst, src):
+    """src over dst for (..., 4) uint8 straight-alpha arrays."""
+    src_a = src[..., 3:].astype(np.float64) / 255
+    dst_a = dst[..., 3:].astype(np.float64) / 255
+    out_a = src_a + dst_a * (1 - src_a)
+    rgb = src[..., :3] * src_a + dst[..., :3] * (dst_a * (1 - src_a))
+    rgb = np.divide(rgb, out_a, out=np.zeros_like(rgb), where=out_a > 0)
+    return np.concatenate([np.rint(rgb), np.rint(out_a * 255)], axis=-1).astype(np.uint8)
+
+
+def composite(layers):
+    """Composite layer arrays back to front into one (h, w, 4) uint8 array."""
+    out = np.zeros_like(layers[0])
+    for layer in layers:
+        out = alpha_over(out, layer)
+    return out
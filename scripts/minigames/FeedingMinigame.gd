@@ -4,6 +4,8 @@ extends Node2D
 
 const MatchBoardScript = preload("res://scripts/minigames/MatchBoard.gd")
 const FOOD_TILES_TEX = preload("res://assets/sprites/ui/food_tiles.png")
+const FOOD_ICONS_HUD_TEX = preload("res://assets/sprites/ui/food_tiles_16.png")
+const FOOD_ICONS_LARGE_TEX = preload("res://assets/sprites/ui/food_tiles_56.png")
 
 # Tile names for legend display
 const TILE_NAMES: Array = ["Kibble", "Salmon", "Veggie", "Carrot", "Berry", "Chicken!", "Mushroom!"]
@@ -13,6 +15,8 @@ const TILE_SIZE: int = 28
 const TILE_GAP: int = 2
 const TILE_STEP: int = 30  # TILE_SIZE + TILE_GAP
 const BOARD_ORIGIN: Vector2 = Vector2(95, 16)
+const HUD_ICON_SIZE: int = 16
+const RESULT_ICON_SIZE: int = 56
 
 var board: RefCounted  # MatchBoard instance
 var tile_nodes: Dictionary = {}  # Vector2i -> TextureRect
@@ -106,10 +110,11 @@ func _build_ui() -> void:
 	var legend_y = 80
 	for i in TILE_NAMES.size():
 		var swatch = TextureRect.new()
-		swatch.texture = _make_tile_atlas(i)
+		swatch.texture = _make_tile_atlas(i, FOOD_ICONS_HUD_TEX, HUD_ICON_SIZE)
 		swatch.position = Vector2(right_x, legend_y)
-		swatch.size = Vector2(14, 14)
+		swatch.size = Vector2(HUD_ICON_SIZE, HUD_ICON_SIZE)
 		swatch.stretch_mode = TextureRect.STRETCH_KEEP_ASPECT_CENTERED
+		swatch.texture_filter = CanvasItem.TEXTURE_FILTER_NEAREST
 		add_child(swatch)
 		var lbl = Label.new()
 		lbl.text = TILE_NAMES[i]
@@ -227,10 +232,10 @@ func _build_tile_nodes() -> void:
 		for row in board.board_rows:
 			_create_tile_node(col, row, board.grid[col][row])
 
-func _make_tile_atlas(tile_type: int) -> AtlasTexture:
+func _make_tile_atlas(tile_type: int, strip: Texture2D = FOOD_TILES_TEX, size: int = TILE_SIZE) -> AtlasTexture:
 	var atlas = AtlasTexture.new()
-	atlas.atlas = FOOD_TILES_TEX
-	atlas.region = Rect2(tile_type * TILE_SIZE, 0, TILE_SIZE, TILE_SIZE)
+	atlas.atlas = strip
+	atlas.region = Rect2(tile_type * size, 0, size, size)
 	return atlas
 
 func _create_tile_node(col: int, row: int, tile_type: int) -> TextureRect:
@@ -522,6 +527,14 @@ func _show_results(state: String) -> void:
 	results_panel.add_child(title)
 	results_panel.add_child(body)
 
+	# Big food icon: kibble when the bowl got filled, chicken when it didn't
+	var icon = TextureRect.new()
+	icon.texture = _make_tile_atlas(0 if state == "won" else ALLERGEN_INDICES[0], FOOD_ICONS_LARGE_TEX, RESULT_ICON_SIZE)
+	icon.position = Vector2(224, 10)
+	icon.size = Vector2(RESULT_ICON_SIZE, RESULT_ICON_SIZE)
+	icon.texture_filter = CanvasItem.TEXTURE_FILTER_NEAREST
+	results_panel.add_child(icon)
+
 	var back_btn = Button.new()
 	back_btn.text = "Back to House"
 	back_btn.position = Vector2(20, 142)
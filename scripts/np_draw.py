@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Display-list drawing backend with the ImageDraw API, rasterized with NumPy.
+
+ImageDraw crosses from Python into C once per primitive and writes into the
+image straight away. Draw here takes the same calls but only records them.
+Nothing reaches the image until the list is rasterized by flush(), by
+image() (which flushes and returns it) or by leaving the with-block, so
+read the image only after one of those:
+
+    with np_draw.Draw(layer) as draw:       # instead of ImageDraw.Draw(layer)
+        for ...:
+            draw.ellipse([x0, y0, x1, y1], fill=CLOUD)
+    layer.save(...)
+
+Filled ellipses, rectangles and points become row spans. An ellipse's spans
+are taken from ImageDraw's own raster of that size, cached, so the output is
+the same pixels. Consecutive shapes with the same fill form one run, and a
+run is written in one NumPy pass however many shapes it holds (see
+fill_spans). Runs are written in order, so later shapes cover earlier ones
+and alpha is written, not blended, as with ImageDraw on an RGBA image.
+
+ellipse, rectangle and point also take an (n, 4) array of boxes (or (n, 2)
+of points) and record the whole batch in one call; that is where the speed
+comes from. Recording one shape per call gives the same pixels but is no
+faster than ImageDraw, which is already cheap per call:
+
+    draw.rectangle(np.column_stack([xs, tops, xs, bottoms]), fill=SWELL)
+
+Everything else (lines, polygons, arcs, outlined shapes, text, non-integer
+coordinates) is kept in the list in order and drawn with ImageDraw when the
+list is flushed. Calls that return a value (textbbox, ...) flush first.
+"""
+
+from PIL import Image, ImageDraw
+import functools
+import numbers
+
+import numpy as np
+
+ELLIPSE = 0
+RECTANGLE = 1
+
+# Drawn later by ImageDraw, in display-list order
+DEFERRED = ("arc", "bitmap", "chord", "line", "pieslice", "polygon", "regular_polygon",
+            "rounded_rectangle", "text", "multiline_text")
+
+
+def _is_int(values):
+    return all(type(v) is int or isinstance(v, numbers.Integral) for v in values)
+
+
+def _flat(xy):
+    """ImageDraw coordinates ([(x, y), ...] or [x, y, ...]) as a flat list."""
+    if isinstance(xy[0], (tuple, list)):
+        return [c for point in xy for c in point]
+    return list(xy)
+
+
+def _box(xy):
+    x0, y0, x1, y1 = xy if len(xy) == 4 else _flat(xy)
+    if x1 < x0:
+        raise ValueError("x1 must be greater than or equal to x0")
+    if y1 < y0:
+        raise ValueError("y1 must be greater than or equal to y0")
+    return x0, y0, x1, y1
+
+
+@functools.lru_cache(maxsize=None)
+def ellipse_spans(width, height):
+    """Row spans (rows, lefts, rights) of ImageDraw's filled ellipse [0, 0, width, height]."""
+    canvas = Image.new('L', (width + 1, height + 1), 0)
+    ImageDraw.Draw(canvas).ellipse([0, 0, width, height], fill=255)
+    mask = np.asarray(canvas) > 0
+    rows = np.nonzero(mask.any(axis=1))[0]
+    lefts = mask[rows].argmax(axis=1)
+    rights = width - mask[rows, ::-1].argmax(axis=1)
+    return rows, lefts, rights
+
+
+@functools.lru_cache(maxsize=256)
+def _ink(mode, fill):
+    """fill as the image's pixel value, resolved the way Image.new does."""
+    return Image.new(mode, (1, 1), fill).getpixel((0, 0))
+
+
+def shape_spans(shapes):
+    """Row spans (rows, lefts, rights) of (n, 5) [kind, x0, y0, x1, y1] shapes.
+
+    kind is ELLIPSE or RECTANGLE (a point is a 1x1 rectangle). Ellipses
+    are grouped by size, so each size's spans are looked up once and placed
+    for all its shapes with one broadcast.
+    """
+    parts = []
+    rects = shapes[shapes[:, 0] == RECTANGLE]
+    if len(rects):
+        heights = rects[:, 4] - rects[:, 2] + 1
+        owner = np.repeat(np.arange(len(rects)), heights)
+        rows = rects[owner, 2] + np.arange(len(owner)) - np.repeat(np.cumsum(heights) - heights, heights)
+        parts.append((rows, rects[owner, 1], rects[owner, 3]))
+    ellipses = shapes[shapes[:, 0] == ELLIPSE]
+    if len(ellipses):
+        widths, heights = (ellipses[:, 3:] - ellipses[:, 1:3]).T
+        sizes, group = np.unique(widths << 32 | heights, return_inverse=True)
+        order = np.argsort(group, kind="stable")
+        bounds = np.r_[0, np.cumsum(np.bincount(group, minlength=len(sizes)))]
+        for k, size in enumerate(sizes):
+            x0, y0 = ellipses[order[bounds[k]:bounds[k + 1]], 1:3].T
+            rows, lefts, rights = ellipse_spans(int(size >> 32), int(size & 0xFFFFFFFF))
+            parts.append(((y0[:, None] + rows).ravel(), (x0[:, None] + lefts).ravel(),
+                          (x0[:, None] + rights).ravel()))
+    if not parts:
+        return (np.zeros(0, dtype=np.int64),) * 3
+    return tuple(np.concatenate(p) for p in zip(*parts))
+
+
+def fill_spans(pixels, rows, lefts, rights, ink):
+    """Set every pixel covered by inclusive row spans to ink, in place.
+
+    All spans share the ink, so overlaps don't matter. Sparse spans write
+    their pixels directly; dense ones (big overlapping ellipses) are counted
+    into a coverage mask over their bounding box instead, with span starts
+    and ends summed along each row.
+    """
+    height, width = pixels.shape[:2]
+    keep = (rows >= 0) & (rows < height) & (rights >= 0) & (lefts < width)
+    rows, lefts, rights = rows[keep], np.maximum(lefts[keep], 0), np.minimum(rights[keep], width - 1)
+    if not len(rows):
+        return
+    lengths = rights - lefts + 1
+    top, bottom = rows.min(), rows.max() + 1
+    left, right = lefts.min(), rights.max() + 1
+    if lengths.sum() <= (bottom - top) * (right - left):
+        starts = np.cumsum(lengths) - lengths
+        xs = np.repeat(lefts - starts, lengths) + np.arange(lengths.sum())
+        pixels[np.repeat(rows, lengths), xs] = ink
+        return
+    stride = right - left + 1
+    size = (bottom - top) * stride
+    flat = (rows - top) * stride
+    edges = (np.bincount(flat + lefts - left, minlength=size)
+             - np.bincount(flat + rights + 1 - left, minlength=size))
+    mask = edges.reshape(bottom - top, stride)[:, :-1].cumsum(axis=1) > 0
+    pixels[top:bottom, left:right][mask] = ink
+
+
+class Draw:
+    """ImageDraw.Draw look-alike that records calls and rasterizes them on flush()."""
+
+    def __init__(self, im):
+        self.im = im
+        # Items in order: ("shapes", fill, [(kind, x0, y0, x1, y1) or (n, 5) array, ...]) runs
+        # and ("draw", method, args, kwargs) calls for ImageDraw
+        self._items = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.flush()
+
+    def __getattr__(self, name):
+        method = getattr(ImageDraw.ImageDraw, name)
+        if name in DEFERRED:
+            return lambda *args, **kwargs: self._defer(name, args, kwargs)
+
+        def call(*args, **kwargs):
+            self.flush()
+            return method(ImageDraw.Draw(self.im), *args, **kwargs)
+        return call
+
+    def _defer(self, method, args, kwargs):
+        self._items.append(("draw", method, args, kwargs))
+
+    def _run(self, fill):
+        """Shape list of the run for fill, starting a new run unless it is the last item."""
+        fill = tuple(fill) if isinstance(fill, list) else fill
+        items = self._items
+        if not items or items[-1][0] != "shapes" or items[-1][1] != fill:
+            items.append(("shapes", fill, []))
+        return items[-1][2]
+
+    def _batch(self, kind, boxes, fill):
+        """Record an (n, 4) integer array of boxes in one call."""
+        boxes = np.asarray(boxes, dtype=np.int64)
+        if ((boxes[:, 2] < boxes[:, 0]) | (boxes[:, 3] < boxes[:, 1])).any():
+            raise ValueError("x1 must be greater than or equal to x0, y1 than y0")
+        self._run(fill).append(np.column_stack([np.full(len(boxes), kind), boxes]))
+
+    def ellipse(self, xy, fill=None, outline=None, width=1):
+        if isinstance(xy, np.ndarray) and xy.ndim == 2 and fill is not None and outline is None:
+            return self._batch(ELLIPSE, xy, fill)
+        box = _box(xy)
+        # An outline is drawn by ImageDraw with its fill, which it doesn't
+        # always cover exactly
+        if fill is None or outline is not None or not _is_int(box):
+            return self._defer("ellipse", (xy,), dict(fill=fill, outline=outline, width=width))
+        self._run(fill).append((ELLIPSE, *box))
+
+    def rectangle(self, xy, fill=None, outline=None, width=1):
+        if isinstance(xy, np.ndarray) and xy.ndim == 2 and fill is not None and outline is None:
+            return self._batch(RECTANGLE, xy, fill)
+        box = _box(xy)
+        # An outline is drawn by ImageDraw with its fill, which it doesn't
+        # always cover exactly
+        if fill is None or outline is not None or not _is_int(box):
+            return self._defer("rectangle", (xy,), dict(fill=fill, outline=outline, width=width))
+        self._run(fill).append((RECTANGLE, *box))
+
+    def point(self, xy, fill=None):
+        if isinstance(xy, np.ndarray) and xy.ndim == 2 and fill is not None:
+            return self._batch(RECTANGLE, np.concatenate([xy, xy], axis=1), fill)
+        coords = _flat(xy)
+        if fill is None or not _is_int(coords):
+            return self._defer("point", (xy,), dict(fill=fill))
+        run = self._run(fill)
+        for x, y in zip(coords[0::2], coords[1::2]):
+            run.append((RECTANGLE, x, y, x, y))
+
+    def image(self):
+        """The image with everything recorded so far drawn into it."""
+        self.flush()
+        return self.im
+
+    def flush(self):
+        """Rasterize everything recorded so far into the image."""
+        items, self._items = self._items, []
+        pixels = None
+        for item in items:
+            if item[0] == "draw":
+                if pixels is not None:
+                    self.im.paste(Image.fromarray(pixels, self.im.mode), (0, 0))
+                    pixels = None
+                _, method, args, kwargs = item
+                getattr(ImageDraw.Draw(self.im), method)(*args, **kwargs)
+                continue
+            _, fill, shapes = item
+            if pixels is None:
+                pixels = np.array(self.im)
+            # Single calls are tuples, batched calls (n, 5) arrays; keep their order
+            chunks, single = [], []
+            for shape in shapes:
+                if isinstance(shape, tuple):
+                    single.append(shape)
+                    continue
+                if single:
+                    chunks.append(np.array(single, dtype=np.int64))
+                    single = []
+                chunks.append(shape)
+            if single:
+                chunks.append(np.array(single, dtype=np.int64))
+            fill_spans(pixels, *shape_spans(np.concatenate(chunks)), _ink(self.im.mode, fill))
+        if pixels is not None:
+            self.im.paste(Image.fromarray(pixels, self.im.mode), (0, 0))
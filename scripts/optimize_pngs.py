@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Lossless PNG optimizer for generated pixel art.
+
+Run after the generators to shrink every PNG under assets/ (or the given
+paths). Most of our sprites only use a handful of palette colours, so images
+with at most 256 distinct RGBA colours are re-encoded as indexed PNGs
+(PLTE + tRNS, at the smallest bit depth that fits). Every candidate is
+encoded with each PNG filter strategy and several zlib strategies, and the
+smallest one that decodes back to exactly the same RGBA pixels replaces the
+original. Files are processed in parallel and never written unless smaller.
+
+Usage:
+    python scripts/optimize_pngs.py                 # optimize assets/
+    python scripts/optimize_pngs.py --dry-run path/to/file.png
+"""
+
+from PIL import Image
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import io
+import os
+import struct
+import zlib
+
+import numpy as np
+
+DEFAULT_ROOTS = ["assets"]
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# PNG colour types
+COLOR_INDEXED = 3
+COLOR_RGB = 2
+COLOR_RGBA = 6
+
+# Whole-image filter choices; "adaptive" picks the best filter per scanline
+# using the minimum-sum-of-absolute-differences heuristic.
+FILTERS = ["none", "sub", "up", "average", "paeth", "adaptive"]
+FILTER_TYPES = {"none": 0, "sub": 1, "up": 2, "average": 3, "paeth": 4}
+
+ZLIB_STRATEGIES = {
+    "default": zlib.Z_DEFAULT_STRATEGY,
+    "filtered": zlib.Z_FILTERED,
+    "rle": zlib.Z_RLE,
+    "huffman": zlib.Z_HUFFMAN_ONLY,
+}
+
+
+def iter_pngs(paths):
+    """Yield PNG files from a mix of file and directory paths."""
+    for path in paths:
+        if os.path.isfile(path):
+            if path.lower().endswith(".png"):
+                yield path
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+            for name in sorted(files):
+                if name.lower().endswith(".png"):
+                    yield os.path.join(root, name)
+
+
+def load_rgba(source):
+    """Decode a PNG (path or bytes) to an (H, W, 4) uint8 array."""
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    with Image.open(source) as img:
+        return np.asarray(img.convert("RGBA"))
+
+
+def _chunk(kind, data):
+    body = kind + data
+    return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body) & 0xFFFFFFFF)
+
+
+def pack_indices(indices, bit_depth):
+    """Pack an (H, W) array of palette indices into PNG scanline bytes."""
+    if bit_depth == 8:
+        return indices.astype(np.uint8)
+    per_byte = 8 // bit_depth
+    height, width = indices.shape
+    padded = np.zeros((height, -(-width // per_byte) * per_byte), dtype=np.uint8)
+    padded[:, :width] = indices
+    groups = padded.reshape(height, -1, per_byte)
+    shifts = np.arange(per_byte - 1, -1, -1, dtype=np.uint8) * bit_depth
+    return np.bitwise_or.reduce(groups << shifts, axis=2).astype(np.uint8)
+
+
+def filter_scanlines(raw, bpp):
+    """Apply every PNG filter to (H, rowbytes) raw scanlines at once.
+
+    Returns {filter name: (H, rowbytes) uint8 filtered bytes}. Filtering only
+    reads unfiltered neighbours, so each filter is a single array expression.
+    """
+    x = raw.astype(np.int16)
+    left = np.zeros_like(x)
+    left[:, bpp:] = x[:, :-bpp]
+    up = np.zeros_like(x)
+    up[1:] = x[:-1]
+    up_left = np.zeros_like(x)
+    up_left[1:, bpp:] = x[:-1, :-bpp]
+
+    p = left + up - up_left
+    pa, pb, pc = np.abs(p - left), np.abs(p - up), np.abs(p - up_left)
+    paeth = np.where((pa <= pb) & (pa <= pc), left, np.where(pb <= pc, up, up_left))
+
+    return {
+        "none": raw,
+        "sub": ((x - left) & 0xFF).astype(np.uint8),
+        "up": ((x - up) & 0xFF).astype(np.uint8),
+        "average": ((x - (left + up) // 2) & 0xFF).astype(np.uint8),
+        "paeth": ((x - paeth) & 0xFF).astype(np.uint8),
+    }
+
+
+def scanline_streams(raw, bpp):
+    """Yield (filter name, filtered stream bytes) for every filter strategy."""
+    filtered = filter_scanlines(raw, bpp)
+    height = raw.shape[0]
+    for name in FILTERS:
+        if name == "adaptive":
+            names = list(FILTER_TYPES)
+            # Score each scanline as signed bytes, the usual libpng heuristic.
+            scores = np.stack([np.abs(filtered[n].view(np.int8).astype(np.int32)).sum(axis=1)
+                               for n in names])
+            best = scores.argmin(axis=0)
+            rows = np.stack([filtered[n] for n in names])[best, np.arange(height)]
+            types = np.array([FILTER_TYPES[n] for n in names], dtype=np.uint8)[best]
+        else:
+            rows = filtered[name]
+            types = np.full(height, FILTER_TYPES[name], dtype=np.uint8)
+        yield name, np.hstack([types[:, None], rows]).tobytes()
+
+
+def encode_png(header, raw, bpp, palette=None, alphas=None):
+    """Encode with every filter/zlib strategy; yield (size, label, png bytes)."""
+    prefix = PNG_SIGNATURE + _chunk(b"IHDR", header)
+    if palette is not None:
+        prefix += _chunk(b"PLTE", palette)
+        if alphas:
+            prefix += _chunk(b"tRNS", alphas)
+    suffix = _chunk(b"IEND", b"")
+
+    for filter_name, stream in scanline_streams(raw, bpp):
+        for strategy_name, strategy in ZLIB_STRATEGIES.items():
+            compressor = zlib.compressobj(9, zlib.DEFLATED, 15, 9, strategy)
+            data = compressor.compress(stream) + compressor.flush()
+            png = prefix + _chunk(b"IDAT", data) + suffix
+            yield len(png), f"{filter_name}/{strategy_name}", png
+
+
+def candidates(rgba):
+    """Yield (size, description, png bytes) for every lossless encoding."""
+    height, width = rgba.shape[:2]
+    packed = rgba.reshape(-1, 4).copy().view(np.uint32).ravel()
+    colors, inverse, counts = np.unique(packed, return_inverse=True, return_counts=True)
+
+    if len(colors) <= 256:
+        rgba_colors = colors.view(np.uint8).reshape(-1, 4)
+        # Translucent entries first so tRNS can stop at the last one, then
+        # the most common colours for slightly better compression.
+        order = np.lexsort((-counts, rgba_colors[:, 3] == 255))
+        remap = np.empty(len(colors), dtype=np.uint8)
+        remap[order] = np.arange(len(colors), dtype=np.uint8)
+        indices = remap[inverse].reshape(height, width)
+        palette = rgba_colors[order]
+
+        bit_depth = next(d for d in (1, 2, 4, 8) if len(colors) <= 1 << d)
+        translucent = int((palette[:, 3] < 255).sum())
+        header = struct.pack(">IIBBBBB", width, height, bit_depth, COLOR_INDEXED, 0, 0, 0)
+        for size, label, png in encode_png(header, pack_indices(indices, bit_depth), 1,
+                                           palette[:, :3].tobytes(),
+                                           palette[:translucent, 3].tobytes()):
+            yield size, f"indexed {len(colors)} colours, {bit_depth}-bit, {label}", png
+        return
+
+    if (rgba[..., 3] == 255).all():
+        header = struct.pack(">IIBBBBB", width, height, 8, COLOR_RGB, 0, 0, 0)
+        raw = rgba[..., :3].reshape(height, width * 3)
+        for size, label, png in encode_png(header, raw, 3):
+            yield size, f"RGB, {label}", png
+    else:
+        header = struct.pack(">IIBBBBB", width, height, 8, COLOR_RGBA, 0, 0, 0)
+        raw = rgba.reshape(height, width * 4)
+        for size, label, png in encode_png(header, raw, 4):
+            yield size, f"RGBA, {label}", png
+
+
+def optimize_png(path, dry_run=False):
+    """Optimize one file. Returns (path, old size, new size, description)."""
+    with open(path, "rb") as f:
+        original = f.read()
+    rgba = load_rgba(original)
+
+    for size, description, png in sorted(candidates(rgba), key=lambda c: c[0]):
+        if size >= len(original):
+            break
+        # Only ever keep an encoding that round-trips to identical pixels.
+        if np.array_equal(load_rgba(png), rgba):
+            if not dry_run:
+                tmp_path = path + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(png)
+                os.replace(tmp_path, path)
+            return path, len(original), size, description
+
+    return path, len(original), len(original), "kept original"
+
+
+def _optimize_task(args):
+    return optimize_png(*args)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Losslessly shrink generated PNGs.")
+    parser.add_argument("paths", nargs="*", default=DEFAULT_ROOTS,
+                        help="PNG files or directories (default: assets)")
+    parser.add_argument("--dry-run", action="store_true", help="report savings without writing")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    files = list(iter_pngs(args.paths))
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        results = list(pool.map(_optimize_task, [(path, args.dry_run) for path in files]))
+
+    total_before = total_after = 0
+    for path, before, after, description in results:
+        total_before += before
+        total_after += after
+        saved = 100 * (before - after) / before if before else 0
+        print(f"  {path}: {before} -> {after} bytes ({saved:.0f}% smaller, {description})")
+
+    verb = "Would save" if args.dry_run else "Saved"
+    print(f"\n{verb} {total_before - total_after} bytes across {len(results)} files "
+          f"({total_before} -> {total_after})")
+
+
+if __name__ == "__main__":
+    main()
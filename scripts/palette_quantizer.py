@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Snap generated art to one master palette.
+
+Every generator keeps its own colour constants, and they drift: the
+COLORS dicts of generate_assets.py and generate_enhanced_assets.py, or
+CREAM_* in generate_pixel_charlie.py against FUR_* in
+generate_player_extended.py. Gradients and blended glows add hundreds of
+in-between shades on top. The master palette is every colour constant the
+generators define, read from their source, with drifted near-duplicates
+merged into the first one seen. It is saved as
+assets/palettes/master_palette.png so quantized art only changes when the
+palette is rebuilt on purpose:
+
+    python scripts/palette_quantizer.py --build-palette
+
+Quantizing looks every pixel up in a nearest-colour table built once per
+palette: 32x32x32 bins (5 bits per channel) by default, or every one of the
+256^3 colours with --full-lut, kept as a 16 MB memory-mapped file in
+.palette_cache/. Either way a whole image maps in one indexing operation;
+pixels that are exactly a palette colour are matched first and kept.
+--dither adds an ordered (Bayer) offset to colours that are off the
+palette, so gradients break into a pattern of palette colours instead of
+bands. Alpha is kept, snapped to a
+few levels. Images that end up with 256 colours or fewer are written as
+indexed PNGs. Palette lookup textures (assets/palettes/ and the
+*_palette.png swap tables) are skipped, since shaders match their colours
+exactly:
+
+    python scripts/palette_quantizer.py assets/sprites/environment --dither
+"""
+
+from PIL import Image
+import argparse
+import ast
+import glob
+import hashlib
+import os
+
+import numpy as np
+
+from dither import bayer_thresholds
+from godot_import import write_texture_import
+from palette_swap import save_indexed
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PALETTE_PATH = os.path.join("assets", "palettes", "master_palette.png")
+CACHE_DIR = ".palette_cache"
+
+# Generators whose module-level colour constants make up the palette
+PALETTE_SOURCES = ["generate_*.py", os.path.join("scripts", "generate_*.py")]
+
+# Constants closer than this (weighted RGB distance) are one colour
+MERGE_DISTANCE = 12
+# Channel weights for colour distance (green matters most to the eye)
+WEIGHTS = np.array([3, 4, 2])
+
+LUT_BITS = 5
+ALPHA_LEVELS = 8
+# Size of the dither offset in channel values, about one palette step
+DITHER_SPREAD = 24
+
+
+def _colour(value):
+    """value as an RGB tuple if it is a colour literal, else None."""
+    if (isinstance(value, tuple) and len(value) in (3, 4)
+            and all(isinstance(c, int) and 0 <= c <= 255 for c in value)):
+        if len(value) == 4 and value[3] == 0:
+            return None
+        return value[:3]
+    return None
+
+
+def source_colours(path):
+    """Every colour literal assigned at module level in a Python file, in order.
+
+    Read with ast, so the generator never runs. Dicts of colours (COLORS)
+    count too; constants built from other names are skipped.
+    """
+    with open(path) as f:
+        tree = ast.parse(f.read(), path)
+    colours = []
+    for node in tree.body:
+        if not isinstance(node, ast.Assign):
+            continue
+        try:
+            value = ast.literal_eval(node.value)
+        except ValueError:
+            continue
+        values = value.values() if isinstance(value, dict) else [value]
+        colours += [c for c in map(_colour, values) if c is not None]
+    return colours
+
+
+def build_palette(sources=PALETTE_SOURCES, merge_distance=MERGE_DISTANCE):
+    """(n, 3) uint8 master palette from the generators' colour constants."""
+    palette = []
+    for pattern in sources:
+        for path in sorted(glob.glob(os.path.join(REPO_ROOT, pattern))):
+            for colour in source_colours(path):
+                if palette:
+                    distance = np.sqrt((((np.array(palette) - colour) ** 2) * WEIGHTS).sum(axis=1))
+                    if distance.min() < merge_distance:
+                        continue
+                palette.append(colour)
+    if len(palette) > 256:
+        raise ValueError(f"Master palette has {len(palette)} colours, raise MERGE_DISTANCE")
+    return np.array(palette, dtype=np.uint8)
+
+
+def load_palette(path=PALETTE_PATH):
+    """The saved master palette, (n, 3) uint8."""
+    return np.asarray(Image.open(path).convert('RGB'))[0]
+
+
+def save_palette(palette, path=PALETTE_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    Image.fromarray(palette[None], 'RGB').save(path)
+    write_texture_import(path)
+
+
+def build_lut(palette, bits=LUT_BITS, cache_dir=None):
+    """Nearest palette index for every colour bin, a (2**bits,) * 3 uint8 array.
+
+    Bins are looked up by their centre. With cache_dir the table is a
+    memory-mapped file there, keyed by the palette, built on first use.
+    """
+    n = 1 << bits
+    path = None
+    if cache_dir:
+        key = hashlib.sha1(palette.tobytes()).hexdigest()[:16]
+        path = os.path.join(cache_dir, f"lut{bits}_{key}.u8")
+        if os.path.exists(path):
+            return np.memmap(path, dtype=np.uint8, mode='r', shape=(n, n, n))
+        os.makedirs(cache_dir, exist_ok=True)
+        lut = np.memmap(path + ".tmp", dtype=np.uint8, mode='w+', shape=(n, n, n))
+    else:
+        lut = np.empty((n, n, n), dtype=np.uint8)
+
+    centres = (np.arange(n) << (8 - bits)) + ((1 << (8 - bits)) >> 1)
+    pal = palette.astype(np.int32)
+    g, b = np.meshgrid(centres, centres, indexing='ij')
+    gb = (WEIGHTS[1] * (g[..., None] - pal[:, 1]) ** 2 + WEIGHTS[2] * (b[..., None] - pal[:, 2]) ** 2)
+    # One red slice at a time keeps the full table's working set small
+    for i, r in enumerate(centres):
+        lut[i] = (gb + WEIGHTS[0] * (r - pal[:, 0]) ** 2).argmin(axis=-1)
+
+    if path:
+        lut.flush()
+        del lut
+        os.replace(path + ".tmp", path)
+        return np.memmap(path, dtype=np.uint8, mode='r', shape=(n, n, n))
+    return lut
+
+
+def palette_matches(rgb, palette):
+    """Palette index of every pixel that is exactly a palette colour, else -1."""
+    shifts = np.array([16, 8, 0])
+    keys = (palette.astype(np.int32) << shifts).sum(axis=1)
+    order = np.argsort(keys)
+    pixel_keys = (rgb << shifts).sum(axis=-1)
+    index = order[np.searchsorted(keys[order], pixel_keys).clip(max=len(keys) - 1)]
+    return np.where(keys[index] == pixel_keys, index, -1)
+
+
+def _lookup(lut, rgb):
+    shift = 8 - (lut.shape[0].bit_length() - 1)
+    return lut[rgb[..., 0] >> shift, rgb[..., 1] >> shift, rgb[..., 2] >> shift]
+
+
+def quantize(image, palette, lut, dither=False, alpha_levels=ALPHA_LEVELS):
+    """RGBA copy of image with every colour snapped to palette via lut.
+
+    Exact palette colours are matched before the binned lookup, which can
+    put a bin's centre nearer a neighbour. Dithering leaves alone any pixel
+    within MERGE_DISTANCE of its palette colour, so art that is already on
+    the palette is not repatterned.
+    """
+    pixels = np.asarray(image.convert('RGBA'))
+    rgb = pixels[..., :3].astype(np.int32)
+    exact = palette_matches(rgb, palette)
+    nearest = np.where(exact >= 0, exact, _lookup(lut, rgb))
+    if dither:
+        distance = np.sqrt((((rgb - palette[nearest]) ** 2) * WEIGHTS).sum(axis=-1))
+        offset = np.rint((bayer_thresholds(image.size) - 0.5) * DITHER_SPREAD).astype(np.int32)
+        dithered = _lookup(lut, np.clip(rgb + offset[..., None], 0, 255))
+        nearest = np.where(distance < MERGE_DISTANCE, nearest, dithered)
+
+    out = np.empty_like(pixels)
+    out[..., :3] = palette[nearest]
+    step = 255 / (alpha_levels - 1)
+    out[..., 3] = np.rint(np.rint(pixels[..., 3] / step) * step).astype(np.uint8)
+    out[out[..., 3] == 0] = 0
+    return Image.fromarray(out, 'RGBA')
+
+
+def save_quantized(path, image):
+    """Save as an indexed PNG when it fits in 256 colours. Returns the colour count."""
+    pixels = np.asarray(image)
+    colours, indices = np.unique(pixels.reshape(-1, 4), axis=0, return_inverse=True)
+    if len(colours) <= 256:
+        save_indexed(path, indices.reshape(pixels.shape[:2]).astype(np.uint8), colours)
+    else:
+        image.save(path, optimize=True)
+    return len(colours)
+
+
+def is_palette_texture(path):
+    """True for palette lookup textures: the master palette and the
+    *_palette.png swap tables (palette_swap.py), whose colours shaders match
+    exactly and which must never be quantized."""
+    palette_dir = os.path.abspath(os.path.dirname(PALETTE_PATH))
+    path = os.path.abspath(path)
+    return path.startswith(palette_dir + os.sep) or path.lower().endswith("_palette.png")
+
+
+def iter_pngs(paths):
+    """PNGs in paths (files or directories), without palette textures."""
+    for path in paths:
+        if os.path.isfile(path):
+            if is_palette_texture(path):
+                print(f"{path}: skipped, palette lookup texture")
+            else:
+                yield path
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+            yield from (os.path.join(root, name) for name in sorted(files)
+                        if name.lower().endswith(".png") and not is_palette_texture(os.path.join(root, name)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Quantize generated PNGs to the master palette.")
+    parser.add_argument("paths", nargs="*", help="PNG files or directories to quantize in place")
+    parser.add_argument("--build-palette", action="store_true",
+                        help=f"rebuild {PALETTE_PATH} from the generators' colour constants")
+    parser.add_argument("--dither", action="store_true", help="ordered dithering before snapping")
+    parser.add_argument("--full-lut", action="store_true",
+                        help=f"exact 256^3 table (memory-mapped in {CACHE_DIR}/) instead of 32^3 bins")
+    parser.add_argument("--dry-run", action="store_true", help="report colour counts without writing")
+    args = parser.parse_args()
+
+    if args.build_palette:
+        palette = build_palette()
+        save_palette(palette)
+        print(f"Wrote {PALETTE_PATH} ({len(palette)} colours)")
+    if not args.paths:
+        return
+
+    palette = load_palette()
+    lut = build_lut(palette, 8, CACHE_DIR) if args.full_lut else build_lut(palette)
+    for path in iter_pngs(args.paths):
+        image = Image.open(path)
+        before = len(np.unique(np.asarray(image.convert('RGBA')).reshape(-1, 4), axis=0))
+        quantized = quantize(image, palette, lut, args.dither)
+        if args.dry_run:
+            after = len(np.unique(np.asarray(quantized).reshape(-1, 4), axis=0))
+        else:
+            after = save_quantized(path, quantized)
+        print(f"{path}: {before} -> {after} colours")
+
+
+if __name__ == "__main__":
+    main()
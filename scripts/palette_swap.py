@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Colour variants of a sprite sheet by palette remapping.
+
+A sheet is indexed once against a named palette (index 0 is transparent,
+then the generator's PALETTE names in order, then any other colours the
+sheet uses). A variant only swaps some of those colours, so it is a lookup
+table away from the original: no drawing code is re-run.
+
+    palette = sheet_palette(sheet, PALETTE)
+    indices = index_image(sheet, palette)
+    blue = apply_lut(indices, build_lut(palette, {"dress": (90, 140, 230, 255)}))
+
+For the game, write_variants() emits one small palette texture per sheet:
+row 0 holds the sheet's own colours and row N the Nth variant, with the
+variant names in a JSON sidecar. resources/shaders/palette_swap.gdshader
+swaps colours from one row at runtime, so a variant costs no extra atlas
+memory. Where a shader won't do, run this script on the sheet to bake the
+variants as indexed PNGs:
+
+    python scripts/palette_swap.py assets/sprites/characters/player_spritesheet.png
+"""
+
+from PIL import Image
+import argparse
+import json
+import os
+
+import numpy as np
+
+from godot_import import write_texture_import
+
+TRANSPARENT = (0, 0, 0, 0)
+
+
+def _pack(pixels):
+    """uint32 per RGBA pixel; every fully transparent pixel packs to 0."""
+    pixels = np.ascontiguousarray(pixels, dtype=np.uint8)
+    packed = pixels.view('<u4')[..., 0].copy()
+    packed[pixels[..., 3] == 0] = 0
+    return packed
+
+
+def sheet_palette(image, names=None):
+    """Ordered [(name, rgba)] covering every colour in image.
+
+    names maps name -> rgba (a generator's PALETTE); those colours come
+    first in names order, whether or not the sheet uses them, so the
+    indices stay stable as rows change. Other colours are named colour_N.
+    """
+    palette = [("transparent", TRANSPARENT)]
+    seen = {0}
+    for name, colour in (names or {}).items():
+        colour = tuple(colour) + (255,) * (4 - len(colour))
+        key = int(_pack(np.array([colour]))[0])
+        if key not in seen:
+            seen.add(key)
+            palette.append((name, colour))
+    for key in np.unique(_pack(np.asarray(image.convert('RGBA')))):
+        if int(key) not in seen:
+            colour = tuple(np.array([key], '<u4').view(np.uint8).tolist())
+            palette.append((f"colour_{len(palette)}", colour))
+    if len(palette) > 256:
+        raise ValueError(f"Sheet uses {len(palette)} colours, an indexed sheet holds 256")
+    return palette
+
+
+def index_image(image, palette):
+    """Palette index of every pixel, as a uint8 array."""
+    keys = _pack(np.array([colour for _, colour in palette]))
+    order = np.argsort(keys)
+    sorted_keys = keys[order]
+    packed = _pack(np.asarray(image.convert('RGBA')))
+    found = np.minimum(np.searchsorted(sorted_keys, packed), len(keys) - 1)
+    missing = sorted_keys[found] != packed
+    if missing.any():
+        y, x = np.argwhere(missing)[0]
+        raise ValueError(f"Colour {image.getpixel((int(x), int(y)))} at ({x}, {y}) is not in the palette")
+    return order[found].astype(np.uint8)
+
+
+def build_lut(palette, swaps=None):
+    """(len(palette), 4) uint8 colour table with the named colours in swaps replaced."""
+    lut = np.array([colour for _, colour in palette], dtype=np.uint8)
+    index = {name: i for i, (name, _) in enumerate(palette)}
+    for name, colour in (swaps or {}).items():
+        if name not in index:
+            raise ValueError(f"Unknown palette colour {name!r}")
+        lut[index[name]] = tuple(colour) + (255,) * (4 - len(colour))
+    return lut
+
+
+def apply_lut(indices, lut):
+    """RGBA image of indices looked up in lut."""
+    return Image.fromarray(lut[indices], 'RGBA')
+
+
+def save_indexed(path, indices, lut):
+    """Save indices as a paletted PNG (alpha in the tRNS chunk)."""
+    img = Image.fromarray(indices, 'P')
+    img.putpalette(lut.tobytes(), 'RGBA')
+    img.save(path, optimize=True)
+
+
+def palette_paths(sheet_path):
+    stem = os.path.splitext(sheet_path)[0]
+    return stem + "_palette.png", stem + "_palette.json"
+
+
+def write_variants(sheet_path, names, variants):
+    """Write the palette texture and JSON for sheet_path. Returns the texture path.
+
+    variants maps variant name -> {palette name: rgba}; texture row 0 is
+    the sheet as drawn ("base") and row N the Nth variant.
+    """
+    palette = sheet_palette(Image.open(sheet_path), names)
+    rows = [build_lut(palette)] + [build_lut(palette, swaps) for swaps in variants.values()]
+    texture_path, json_path = palette_paths(sheet_path)
+    Image.fromarray(np.stack(rows), 'RGBA').save(texture_path)
+    write_texture_import(texture_path)
+    with open(json_path, "w") as f:
+        json.dump({"colours": [name for name, _ in palette],
+                   "variants": ["base", *variants]}, f, indent=2)
+        f.write("\n")
+    return texture_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bake palette variants of a sheet as indexed PNGs.")
+    parser.add_argument("sheet", help="sheet written alongside a _palette.png/.json")
+    parser.add_argument("--variant", action="append",
+                        help="variant to bake (repeatable, default all)")
+    args = parser.parse_args()
+
+    texture_path, json_path = palette_paths(args.sheet)
+    with open(json_path) as f:
+        meta = json.load(f)
+    rows = np.asarray(Image.open(texture_path).convert('RGBA'))
+    palette = list(zip(meta["colours"], map(tuple, rows[0].tolist())))
+    indices = index_image(Image.open(args.sheet), palette)
+
+    stem = os.path.splitext(args.sheet)[0]
+    for name in args.variant or meta["variants"][1:]:
+        if name not in meta["variants"]:
+            parser.error(f"unknown variant {name!r}, expected one of {meta['variants'][1:]}")
+        path = f"{stem}_{name}.png"
+        save_indexed(path, indices, rows[meta["variants"].index(name)])
+        write_texture_import(path)
+        print(f"Generated {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Horizontally tileable background layers for a ParallaxBackground.
+
+A background drawn as one flat image has to be redrawn (or swapped) to
+move. Drawn as a stack of layers instead, back to front, each one can
+scroll at its own speed: Godot's ParallaxLayer repeats a layer every
+motion_mirroring pixels, so every layer must wrap around horizontally.
+Generators draw each shape at its x and one layer width to either side
+(wrap_offsets) and round wave frequencies to whole cycles across the
+layer (periodic), so nothing is cut at the seam.
+
+    layers = [("sky", sky), ("far_clouds", far), ("near_clouds", near)]
+    flatten(layers)                               # the old single image
+    write_layers("storm_sky", layers, {"sky": (0, 0), "far_clouds": (0.1, 4),
+                                       "near_clouds": (0.5, 16)})
+
+write_layers() saves <name>_<layer>.png for every layer plus
+<name>_parallax.json: the layer size and, per layer back to front, its
+texture, motion_scale (how fast it follows the camera) and autoscroll
+(pixels per second it drifts on its own, e.g. clouds in the wind).
+"""
+
+from PIL import Image
+import json
+import math
+import os
+
+from godot_import import write_texture_import
+
+OUTPUT_DIR = "assets/sprites/environment/parallax"
+
+
+def wrap_offsets(width, wrap=True):
+    """x offsets to draw every shape at, so a layer of width tiles."""
+    return (-width, 0, width) if wrap else (0,)
+
+
+def periodic(frequency, width):
+    """frequency (radians per pixel) rounded to a whole number of cycles over width."""
+    cycles = max(1, round(frequency * width / (2 * math.pi)))
+    return 2 * math.pi * cycles / width
+
+
+def flatten(layers):
+    """Composite [(name, image)] back to front into one RGBA image."""
+    flat = layers[0][1].convert('RGBA')
+    for _, layer in layers[1:]:
+        flat = Image.alpha_composite(flat, layer.convert('RGBA'))
+    return flat
+
+
+def write_layers(name, layers, parallax, output_dir=OUTPUT_DIR):
+    """Save every layer and the parallax config. Returns the config path.
+
+    parallax maps layer name -> (motion_scale, autoscroll).
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    width, height = layers[0][1].size
+    config = {"size": [width, height], "layers": []}
+    for layer_name, layer in layers:
+        path = os.path.join(output_dir, f"{name}_{layer_name}.png")
+        layer.save(path)
+        write_texture_import(path)
+        motion_scale, autoscroll = parallax[layer_name]
+        config["layers"].append({"name": layer_name,
+                                 "texture": "res://" + path.replace(os.sep, "/"),
+                                 "motion_scale": motion_scale,
+                                 "autoscroll": autoscroll,
+                                 "mirroring": width})
+    config_path = os.path.join(output_dir, f"{name}_parallax.json")
+    with open(config_path, "w") as f:
+        json.dump(config, f, indent=2)
+        f.write("\n")
+    return config_path
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Pixel-art upscaling for large, HiDPI and portrait variants of sprite sheets.
+
+Large variants used to be drawn again at the bigger size. Scaling the
+canonical sheet keeps every variant in step with it instead, and all
+frames of a sheet are scaled at once as one (frames, height, width, 4)
+array (see sprite_effects.to_frames), with each frame's border repeated
+outwards so neighbouring frames never bleed into each other.
+
+    nearest  - every pixel becomes a factor x factor block (any factor)
+    scale2x  - EPX/Scale2x: corners next to a matching pair of neighbours
+               take their colour, so diagonals come out as steps of one
+               pixel instead of two
+    scale3x  - the 3x version of the same rules
+    xbr      - xBR-style 2x: each corner weighs the colour differences
+               along both diagonals over a 5x5 neighbourhood and follows
+               the weaker edge. Handles shaded and anti-aliased edges that
+               never match exactly, and never invents colours.
+
+A factor that is a power of the method's own factor repeats the method
+(4x with scale2x is Scale2x twice); anything left over is nearest:
+
+    big = upscale_sheet(sheet, 32, 4, "xbr")
+    portrait = upscale(frame, 4, "scale2x")
+
+    python scripts/pixel_upscale.py assets/sprites/characters/charlie_spritesheet.png \\
+        --frame-size 32 --factor 2 --method xbr
+"""
+
+from PIL import Image
+import argparse
+import os
+
+import numpy as np
+
+from godot_import import write_texture_import
+from sprite_effects import from_frames, to_frames
+
+METHODS = ("nearest", "scale2x", "scale3x", "xbr")
+METHOD_FACTOR = {"scale2x": 2, "scale3x": 3, "xbr": 2}
+
+# Luma/chroma weights for the xBR colour distance, plus alpha
+XBR_WEIGHTS = np.array([48, 7, 6, 48])
+
+
+def _neighbours(frames, radius):
+    """Per-frame edge-padded copy, and a getter for the (dy, dx) neighbour."""
+    padded = np.pad(frames, ((0, 0), (radius, radius), (radius, radius), (0, 0)), mode='edge')
+    height, width = frames.shape[1:3]
+
+    def at(dy, dx):
+        return padded[:, radius + dy:radius + dy + height, radius + dx:radius + dx + width]
+    return at
+
+
+def _same(a, b):
+    return (a == b).all(axis=-1)
+
+
+def _interleave(blocks, factor):
+    """(frames, h, w, 4) sub-pixel planes in row-major order -> (frames, h*f, w*f, 4)."""
+    count, height, width = blocks[0].shape[:3]
+    out = np.stack(blocks, axis=3).reshape(count, height, width, factor, factor, 4)
+    return out.transpose(0, 1, 3, 2, 4, 5).reshape(count, height * factor, width * factor, 4)
+
+
+def nearest(frames, factor):
+    return frames.repeat(factor, axis=1).repeat(factor, axis=2)
+
+
+def scale2x(frames):
+    at = _neighbours(frames, 1)
+    e, b, d, f, h = at(0, 0), at(-1, 0), at(0, -1), at(0, 1), at(1, 0)
+    # Only where the cross isn't uniform along either axis
+    active = ~_same(b, h) & ~_same(d, f)
+    corners = [
+        np.where((active & _same(d, b))[..., None], d, e),
+        np.where((active & _same(b, f))[..., None], f, e),
+        np.where((active & _same(d, h))[..., None], d, e),
+        np.where((active & _same(h, f))[..., None], f, e),
+    ]
+    return _interleave(corners, 2)
+
+
+def scale3x(frames):
+    at = _neighbours(frames, 1)
+    a, b, c = at(-1, -1), at(-1, 0), at(-1, 1)
+    d, e, f = at(0, -1), at(0, 0), at(0, 1)
+    g, h, i = at(1, -1), at(1, 0), at(1, 1)
+    active = ~_same(b, h) & ~_same(d, f)
+    db, bf, dh, hf = _same(d, b), _same(b, f), _same(d, h), _same(h, f)
+    ea, ec, eg, ei = _same(e, a), _same(e, c), _same(e, g), _same(e, i)
+
+    def pick(condition, colour):
+        return np.where((active & condition)[..., None], colour, e)
+
+    blocks = [
+        pick(db, d), pick((db & ~ec) | (bf & ~ea), b), pick(bf, f),
+        pick((db & ~eg) | (dh & ~ea), d), e, pick((bf & ~ei) | (hf & ~ec), f),
+        pick(dh, d), pick((dh & ~ei) | (hf & ~eg), h), pick(hf, f),
+    ]
+    return _interleave(blocks, 3)
+
+
+def _xbr_distance(a, b):
+    """Weighted YUV + alpha distance between two (..., 4) uint8 arrays."""
+    a, b = a.astype(np.int32), b.astype(np.int32)
+    diff = a - b
+    y = (299 * diff[..., 0] + 587 * diff[..., 1] + 114 * diff[..., 2]) // 1000
+    u = (-169 * diff[..., 0] - 331 * diff[..., 1] + 500 * diff[..., 2]) // 1000
+    v = (500 * diff[..., 0] - 419 * diff[..., 1] - 81 * diff[..., 2]) // 1000
+    return (XBR_WEIGHTS[0] * np.abs(y) + XBR_WEIGHTS[1] * np.abs(u)
+            + XBR_WEIGHTS[2] * np.abs(v) + XBR_WEIGHTS[3] * np.abs(diff[..., 3]))
+
+
+def _xbr_corner(at):
+    """The bottom-right sub-pixel of every pixel, from xBR's edge test.
+
+    Neighbourhood (E is the pixel):
+
+             B1
+          A  B  C
+       D0 D  E  F  F4
+          G  H  I
+             H5  I5
+    """
+    e, i = at(0, 0), at(1, 1)
+    c, f, g, h = at(-1, 1), at(0, 1), at(1, -1), at(1, 0)
+    b, d = at(-1, 0), at(0, -1)
+    f4, h5, i4, i5 = at(0, 2), at(2, 0), at(1, 2), at(2, 1)
+    dist = _xbr_distance
+    # Cost of an edge along the anti-diagonal (H-F) vs across it (E-I)
+    along = dist(e, c) + dist(e, g) + dist(i, f4) + dist(i, h5) + 4 * dist(h, f)
+    across = dist(h, d) + dist(h, i5) + dist(f, i4) + dist(f, b) + 4 * dist(e, i)
+    # As in Scale2x, a pixel whose cross is uniform along an axis is a line
+    # or a lone detail (an eye), not a corner, and is kept whole
+    edge = (along < across) & ~_same(e, f) & ~_same(e, h) & ~_same(b, h) & ~_same(d, f)
+    closer = np.where((dist(e, f) <= dist(e, h))[..., None], f, h)
+    return np.where(edge[..., None], closer, e)
+
+
+def xbr(frames):
+    corners = []
+    # Each corner is the bottom-right corner of the frames turned so that
+    # corner faces bottom-right, turned back.
+    for turns in (2, 3, 1, 0):  # top-left, top-right, bottom-left, bottom-right
+        turned = np.rot90(frames, turns, axes=(1, 2))
+        corner = _xbr_corner(_neighbours(np.ascontiguousarray(turned), 2))
+        corners.append(np.rot90(corner, -turns, axes=(1, 2)))
+    return _interleave(corners, 2)
+
+
+SCALERS = {"scale2x": scale2x, "scale3x": scale3x, "xbr": xbr}
+
+
+def upscale_frames(frames, factor, method="nearest"):
+    """Scale a (frames, height, width, 4) uint8 array by an integer factor."""
+    if method not in METHODS:
+        raise ValueError(f"Unknown method {method!r}, expected one of {METHODS}")
+    if method != "nearest":
+        step = METHOD_FACTOR[method]
+        while factor % step == 0 and factor > 1:
+            frames = SCALERS[method](frames)
+            factor //= step
+    return nearest(frames, factor) if factor > 1 else frames
+
+
+def upscale(image, factor, method="nearest"):
+    """One image scaled by factor."""
+    frames = np.asarray(image.convert('RGBA'))[None]
+    return Image.fromarray(upscale_frames(frames, factor, method)[0], 'RGBA')
+
+
+def upscale_sheet(sheet, frame_size, factor, method="nearest"):
+    """Every frame of sheet scaled by factor in one pass."""
+    frames = upscale_frames(to_frames(sheet, frame_size), factor, method)
+    return from_frames(frames, (sheet.size[0] * factor, sheet.size[1] * factor))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Upscale a pixel-art sheet frame by frame.")
+    parser.add_argument("sheet")
+    parser.add_argument("--frame-size", type=int, default=None,
+                        help="frame size in pixels (default: the whole image is one frame)")
+    parser.add_argument("--factor", type=int, default=2)
+    parser.add_argument("--method", choices=METHODS, default="xbr")
+    parser.add_argument("-o", "--output", help="default: <sheet>_<factor>x.png")
+    args = parser.parse_args()
+
+    sheet = Image.open(args.sheet)
+    frame_size = args.frame_size or sheet.size
+    output = args.output or f"{os.path.splitext(args.sheet)[0]}_{args.factor}x.png"
+    img = upscale_sheet(sheet, frame_size, args.factor, args.method)
+    img.save(output)
+    write_texture_import(output)
+    print(f"Generated {output} ({img.size[0]}x{img.size[1]}, {args.method})")
+
+
+if __name__ == "__main__":
+    main()
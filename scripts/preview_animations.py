@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Export animated previews of every sprite sheet animation.
+
+Reads the row specs the generators build their sheets from (SHEET_ROWS in
+generate_pixel_charlie.py and generate_player_extended.py, plus the ball
+bounce from generate_animated_sprites.py) and writes a GIF and an APNG per
+animation, plus one HTML contact sheet, to build/previews/.
+
+Each sheet is decoded once and cut into frames once; the animations share
+those frames and are encoded in parallel.
+
+Usage (from the repo root, after running the generators):
+    python scripts/preview_animations.py
+"""
+
+from PIL import Image
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+import html
+import os
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import generate_animated_sprites
+import generate_pixel_charlie
+import generate_player_extended
+
+OUTPUT_DIR = "build/previews"
+
+PREVIEW_SCALE = 4  # Nearest-neighbour upscale so 32px frames are readable
+FPS = 8            # Matches the walk speed in the SpriteFrames resources
+GIF_BACKGROUND = (96, 160, 96, 255)  # GIF has no partial alpha; use a grass green
+
+
+def animation_specs():
+    """Return [(sheet path, frame (w, h), [(animation name, row, frame count)])]."""
+    charlie_rows = []
+    for row, (direction, emotion, item) in enumerate(generate_pixel_charlie.SHEET_ROWS):
+        name = f"charlie_{direction}_{emotion}" + (f"_{item}" if item else "")
+        charlie_rows.append((name, row, generate_pixel_charlie.FRAMES_PER_ROW))
+
+    player_rows = []
+    for row, (action, direction) in enumerate(generate_player_extended.SHEET_ROWS):
+        player_rows.append((f"player_{action}_{direction}", row, generate_player_extended.FRAMES_PER_ROW))
+
+    charlie_size = generate_pixel_charlie.BASE_SIZE
+    player_size = generate_player_extended.FRAME_SIZE
+    ball_size = generate_animated_sprites.BALL_SIZE
+    return [
+        (os.path.join(generate_pixel_charlie.OUTPUT_DIR, "charlie_spritesheet.png"),
+         (charlie_size, charlie_size), charlie_rows),
+        (os.path.join(generate_player_extended.SPRITES_DIR, "player_spritesheet.png"),
+         (player_size, player_size), player_rows),
+        (os.path.join(generate_animated_sprites.SPRITES_DIR, "ball_spritesheet.png"),
+         (ball_size, ball_size), [("ball_bounce", 0, generate_animated_sprites.BALL_FRAMES)]),
+    ]
+
+
+def cut_frames(sheet_path, frame_size, rows, scale=PREVIEW_SCALE):
+    """Decode a sheet once and return {animation name: [scaled RGBA frames]}."""
+    frame_w, frame_h = frame_size
+    with Image.open(sheet_path) as sheet:
+        sheet = sheet.convert('RGBA')
+    frames = {}
+    for name, row, count in rows:
+        frames[name] = [
+            sheet.crop((col * frame_w, row * frame_h, (col + 1) * frame_w, (row + 1) * frame_h))
+                 .resize((frame_w * scale, frame_h * scale), Image.NEAREST)
+            for col in range(count)
+        ]
+    return frames
+
+
+def write_animation(name, frames, output_dir=OUTPUT_DIR, fps=FPS):
+    """Write name.gif and name.png (APNG); returns the file names."""
+    duration = int(1000 / fps)
+
+    apng = f"{name}.png"
+    frames[0].save(os.path.join(output_dir, apng), save_all=True, append_images=frames[1:],
+                   duration=duration, loop=0, disposal=1, default_image=False)
+
+    flat = []
+    for frame in frames:
+        background = Image.new('RGBA', frame.size, GIF_BACKGROUND)
+        background.alpha_composite(frame)
+        flat.append(background.convert('RGB'))
+    gif = f"{name}.gif"
+    flat[0].save(os.path.join(output_dir, gif), save_all=True, append_images=flat[1:],
+                 duration=duration, loop=0)
+    return gif, apng
+
+
+def write_contact_sheet(groups, output_dir=OUTPUT_DIR):
+    """Write index.html listing every animation, grouped by sheet."""
+    parts = [
+        "<!DOCTYPE html>",
+        "<html><head><meta charset=\"utf-8\"><title>Animation previews</title>",
+        "<style>",
+        "body { font-family: sans-serif; background: #333; color: #eee; }",
+        "figure { display: inline-block; margin: 8px; text-align: center; }",
+        "img { image-rendering: pixelated; background: #5a9a5a; }",
+        "figcaption { font-size: 12px; }",
+        "</style></head><body>",
+        "<h1>Animation previews</h1>",
+    ]
+    for sheet_path, names in groups:
+        parts.append(f"<h2>{html.escape(sheet_path)}</h2>")
+        for name, gif, apng in names:
+            parts.append(f"<figure><img src=\"{html.escape(apng)}\" alt=\"{html.escape(name)}\">"
+                         f"<figcaption>{html.escape(name)} (<a href=\"{html.escape(gif)}\">gif</a>)"
+                         f"</figcaption></figure>")
+    parts.append("</body></html>")
+
+    path = os.path.join(output_dir, "index.html")
+    with open(path, "w") as f:
+        f.write("\n".join(parts) + "\n")
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export GIF/APNG previews of sprite sheet animations.")
+    parser.add_argument("--output", default=OUTPUT_DIR, help=f"output directory (default {OUTPUT_DIR})")
+    parser.add_argument("--jobs", type=int, default=None, help="worker threads")
+    args = parser.parse_args()
+
+    os.makedirs(args.output, exist_ok=True)
+    # Keep Godot from importing the previews
+    open(os.path.join(args.output, ".gdignore"), "w").close()
+    specs = animation_specs()
+
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        decoded = list(pool.map(lambda spec: cut_frames(*spec), specs))
+        jobs = [(sheet_path, name, pool.submit(write_animation, name, frames[name], args.output))
+                for (sheet_path, _, _), frames in zip(specs, decoded)
+                for name in frames]
+
+        groups = {}
+        for sheet_path, name, future in jobs:
+            gif, apng = future.result()
+            groups.setdefault(sheet_path, []).append((name, gif, apng))
+
+    index = write_contact_sheet(list(groups.items()), args.output)
+    print(f"Wrote {len(jobs)} animations (GIF + APNG) and {index}")
+
+
+if __name__ == "__main__":
+    main()
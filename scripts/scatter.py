@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Batched scatter rendering for grains, pebbles, shells and other debris.
+
+Instead of one draw.point()/draw.ellipse() call per item, give scatter()
+arrays of positions and colours plus a small stamp library, and every item is
+written into the image with NumPy indexing:
+
+    rng = np.random.default_rng(333)
+    xs = rng.integers(0, width, 2500)
+    ys = rng.integers(0, height, 2500)
+    kinds = rng.choice([0, 0, 0, 1], 2500)          # mostly 1px grains
+    colors = np.array(GRAIN_COLORS)[rng.integers(0, 4, 2500)]
+    scatter(img, xs, ys, colors, [stamp(point), stamp(ellipse, 2, 2)], kinds)
+
+A stamp is a shape rasterized once (and cached) with PIL from a painter
+function, so it matches what ImageDraw would have drawn. Its pixels are
+either the item's colour or its accent colour (ridges, highlights). Items
+overwrite each other in order, like consecutive ImageDraw calls on an RGBA
+image: the last item covering a pixel wins, and alpha is written, not blended.
+"""
+
+from PIL import Image, ImageDraw
+import functools
+
+import numpy as np
+
+# Slot values painters draw with
+COLOR = 1
+ACCENT = 2
+
+# Painters draw around (STAMP_MARGIN, STAMP_MARGIN) so shapes that reach to
+# negative offsets are kept. The canvas is at least STAMP_CANVAS and grows
+# with the painter's largest argument (its size).
+STAMP_MARGIN = 8
+STAMP_CANVAS = 48
+
+
+def point(draw, x, y):
+    """1px grain."""
+    draw.point((x, y), fill=COLOR)
+
+
+def ellipse(draw, x, y, w, h):
+    """Filled ellipse in the bbox [x, y, x + w, y + h] (PIL's inclusive bbox)."""
+    draw.ellipse([x, y, x + w, y + h], fill=COLOR)
+
+
+def pebble(draw, x, y, size):
+    """Slightly flattened pebble with a highlight pixel on top."""
+    draw.ellipse([x, y, x + size, y + size - 1], fill=COLOR)
+    draw.point((x + 1, y), fill=ACCENT)
+
+
+def shell(draw, x, y, w, h, start=0, end=180, inset=0):
+    """Shell body with a ridge arc in the accent colour."""
+    draw.ellipse([x, y, x + w, y + h], fill=COLOR)
+    draw.arc([x + inset, y, x + w - inset, y + h - inset], start, end, fill=ACCENT)
+
+
+@functools.lru_cache(maxsize=None)
+def stamp(painter, *args):
+    """Rasterize painter(draw, x, y, *args) once.
+
+    Returns (dy, dx, slot) int arrays: the offset of every covered pixel from
+    the item position and whether it takes the COLOR or ACCENT colour.
+    Raises ValueError rather than clip a shape that reaches the canvas edge.
+    """
+    size = max([STAMP_CANVAS] + [2 * STAMP_MARGIN + int(a) + 1 for a in args])
+    canvas = Image.new('L', (size, size), 0)
+    painter(ImageDraw.Draw(canvas), STAMP_MARGIN, STAMP_MARGIN, *args)
+    mask = np.asarray(canvas)
+    if mask[0].any() or mask[-1].any() or mask[:, 0].any() or mask[:, -1].any():
+        raise ValueError(f"{painter.__name__}{args} reaches the edge of its {size}px stamp canvas")
+    dy, dx = np.nonzero(mask)
+    return dy - STAMP_MARGIN, dx - STAMP_MARGIN, mask[dy, dx].astype(np.int64)
+
+
+def _rgba(colors, count):
+    colors = np.asarray(colors, dtype=np.uint8)
+    if colors.ndim == 1:
+        colors = np.broadcast_to(colors, (count, colors.shape[0]))
+    if colors.shape[1] == 3:
+        colors = np.concatenate([colors, np.full((count, 1), 255, dtype=np.uint8)], axis=1)
+    return colors
+
+
+def scatter(img, xs, ys, colors, library, kinds=None, accents=None):
+    """Composite items into an RGBA image in place and return it.
+
+    xs, ys: item positions (the painter's x, y).
+    colors: one RGB(A) colour, or one per item.
+    library: list of stamps (see stamp()); kinds picks one per item
+    (default: every item uses library[0]).
+    accents: accent colour(s) for ACCENT pixels (default: the item colour).
+    """
+    xs = np.asarray(xs, dtype=np.int64)
+    ys = np.asarray(ys, dtype=np.int64)
+    count = len(xs)
+    if count == 0:
+        return img
+    kinds = np.zeros(count, dtype=np.int64) if kinds is None else np.asarray(kinds)
+    colors = _rgba(colors, count)
+    accents = colors if accents is None else _rgba(accents, count)
+
+    width, height = img.size
+    flat_parts, order_parts, color_parts = [], [], []
+    for kind, (dy, dx, slot) in enumerate(library):
+        items = np.nonzero(kinds == kind)[0]
+        if len(items) == 0 or len(dy) == 0:
+            continue
+        px = xs[items, None] + dx[None, :]
+        py = ys[items, None] + dy[None, :]
+        inside = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+        item_idx = np.broadcast_to(items[:, None], px.shape)[inside]
+        slots = np.broadcast_to(slot[None, :], px.shape)[inside]
+        flat_parts.append(py[inside] * width + px[inside])
+        order_parts.append(item_idx)
+        color_parts.append(np.where((slots == ACCENT)[:, None], accents[item_idx], colors[item_idx]))
+
+    if not flat_parts:
+        return img
+    flat = np.concatenate(flat_parts)
+    order = np.concatenate(order_parts)
+    values = np.concatenate(color_parts)
+
+    # Last writer wins: sort by item order (stable, so a stamp's own pixels
+    # keep their order), then keep the final write to each pixel.
+    by_order = np.argsort(order, kind="stable")
+    flat, values = flat[by_order], values[by_order]
+    last = len(flat) - 1 - np.unique(flat[::-1], return_index=True)[1]
+
+    pixels = np.array(img.convert('RGBA'))
+    pixels.reshape(-1, 4)[flat[last]] = values[last]
+    img.paste(Image.fromarray(pixels, 'RGBA'), (0, 0))
+    return img
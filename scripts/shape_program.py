@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Declarative shape programs with cached sub-part rasterization.
+
+A part is a tuple of drawing ops in design units around the part's own
+anchor, with colours given as palette names:
+
+    EYE = (
+        ("ellipse", (0, 0, 6, 6), "eye"),
+        ("ellipse", (1, 1, 5, 5), "iris"),
+        ("ellipse", (2, 1, 4, 3), "shine"),
+        ("point", (4, 4), "glint"),
+    )
+
+    place(image, draw, EYE, 8, 8, PALETTE)     # anchor at (8, 8)
+    place(image, draw, EAR, 16, 8, PALETTE, flip=True)
+
+Ops are ("ellipse" | "rectangle", bbox, colour), ("arc", bbox, colour,
+start, end[, width]), ("line", points, colour[, width]), ("polygon",
+points, colour) and ("point", xy, colour). A colour is a palette key or a
+literal RGB(A) tuple. ("part", other, dx, dy[, flip]) reuses another part
+inside this one. flip mirrors a part about its anchor column (x -> -x), so
+a left ear described once also draws the right one.
+
+The part is pasted onto image; draw is the ImageDraw or ScaledDraw the
+caller uses on that image, and only its scale and origin are read, so with
+a ScaledDraw the part is drawn at its scale. Each part is rasterized once
+per (colours, scale, sub-pixel phase, flip) into a small tile plus coverage
+mask and kept in a bounded LRU cache, so the hundreds of sheet frames that
+share a head or an ear just paste the cached tile. The paste overwrites
+covered pixels, alpha included, like the ImageDraw calls it replaces, so
+the output matches drawing the ops directly (wide lines scaled up can
+differ by an edge pixel, since PIL rounds their outline polygon at
+absolute coordinates).
+"""
+
+from PIL import Image, ImageDraw
+from collections import OrderedDict
+import functools
+import math
+
+from scaled_draw import ScaledDraw
+
+BOX_OPS = ("ellipse", "rectangle", "arc")
+POINT_OPS = ("line", "polygon")
+
+
+class RasterCache:
+    """Bounded LRU cache of rasterized parts."""
+
+    def __init__(self, maxsize=512):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._tiles = OrderedDict()
+
+    def __len__(self):
+        return len(self._tiles)
+
+    def get(self, key, build):
+        """Return the tile for key, calling build() to rasterize it on a miss."""
+        tile = self._tiles.get(key)
+        if tile is not None:
+            self._tiles.move_to_end(key)
+            self.hits += 1
+            return tile
+        self.misses += 1
+        tile = self._tiles[key] = build()
+        if len(self._tiles) > self.maxsize:
+            self._tiles.popitem(last=False)
+        return tile
+
+    def clear(self):
+        self._tiles.clear()
+        self.hits = self.misses = 0
+
+
+CACHE = RasterCache()
+
+
+@functools.lru_cache(maxsize=None)
+def flatten(part, dx=0, dy=0, flip=False):
+    """Expand nested parts into primitive ops, mirrored (if flip) then moved by (dx, dy)."""
+    ops = []
+    for kind, geometry, *rest in part:
+        if kind == "part":
+            sub_dx, sub_dy, *sub_flip = rest
+            sub_flip = bool(sub_flip and sub_flip[0])
+            ops.extend(flatten(geometry, dx - sub_dx if flip else dx + sub_dx,
+                               dy + sub_dy, flip != sub_flip))
+            continue
+        if kind in BOX_OPS:
+            x0, y0, x1, y1 = geometry
+            if flip:
+                x0, x1 = -x1, -x0
+                if kind == "arc":
+                    colour, start, end, *width = rest
+                    rest = [colour, 180 - end, 180 - start, *width]
+            geometry = (x0 + dx, y0 + dy, x1 + dx, y1 + dy)
+        elif kind == "point":
+            x, y = geometry
+            geometry = ((-x if flip else x) + dx, y + dy)
+        elif kind in POINT_OPS:
+            geometry = tuple(((-x if flip else x) + dx, y + dy) for x, y in geometry)
+        else:
+            raise ValueError(f"Unknown shape op {kind!r}")
+        ops.append((kind, geometry, *rest))
+    return tuple(ops)
+
+
+def _width(kind, args):
+    if kind == "arc" and len(args) > 2:
+        return args[2]
+    if kind == "line" and args:
+        return args[0]
+    return 1
+
+
+def _bounds(ops):
+    """Design-unit box [x0, x1) x [y0, y1) covering every op, with room for widths."""
+    xs, ys = [], []
+    pad = 1
+    for kind, geometry, _, *args in ops:
+        if kind in BOX_OPS:
+            xs += geometry[0::2]
+            ys += geometry[1::2]
+        elif kind == "point":
+            xs.append(geometry[0])
+            ys.append(geometry[1])
+        else:
+            xs += [x for x, _ in geometry]
+            ys += [y for _, y in geometry]
+        pad = max(pad, _width(kind, args))
+    return min(xs) - pad, min(ys) - pad, max(xs) + 1 + pad, max(ys) + 1 + pad
+
+
+def _draw_op(draw, kind, geometry, fill, args):
+    if kind in ("ellipse", "rectangle"):
+        getattr(draw, kind)(geometry, fill=fill)
+    elif kind == "arc":
+        draw.arc(geometry, args[0], args[1], fill=fill, width=_width(kind, args))
+    elif kind == "line":
+        draw.line(list(geometry), fill=fill, width=_width(kind, args))
+    elif kind == "polygon":
+        draw.polygon(list(geometry), fill=fill)
+    else:
+        draw.point(geometry, fill=fill)
+
+
+def rasterize(ops, colours, scale=1, phase=(0, 0)):
+    """Draw flattened ops into a tile. Returns (tile, mask, left, top).
+
+    The tile's top-left pixel sits at (left, top) target pixels from the
+    anchor, which itself is phase (0 <= phase < 1) past a pixel boundary.
+    """
+    x0, y0, x1, y1 = _bounds(ops)
+    left = math.floor(x0 * scale + phase[0])
+    top = math.floor(y0 * scale + phase[1])
+    size = (math.ceil(x1 * scale + phase[0]) - left + 1,
+            math.ceil(y1 * scale + phase[1]) - top + 1)
+    tile = Image.new('RGBA', size, (0, 0, 0, 0))
+    mask = Image.new('L', size, 0)
+    origin = (phase[0] - left, phase[1] - top)
+    tile_draw = ScaledDraw(ImageDraw.Draw(tile), scale, origin)
+    mask_draw = ScaledDraw(ImageDraw.Draw(mask), scale, origin)
+    for (kind, geometry, _, *args), colour in zip(ops, colours):
+        _draw_op(tile_draw, kind, geometry, colour, args)
+        _draw_op(mask_draw, kind, geometry, 255, args)
+    return tile, mask, left, top
+
+
+def resolve_colour(colour, palette):
+    """RGB(A) tuple for a palette key or literal colour."""
+    return palette[colour] if isinstance(colour, str) else tuple(colour)
+
+
+def place(image, draw, part, x, y, palette=None, flip=False, cache=CACHE):
+    """Paste part onto image with its anchor at design coords (x, y) of draw."""
+    scale = getattr(draw, "scale", 1)
+    origin_x, origin_y = getattr(draw, "origin", (0, 0))
+    # Shapes a display-list draw (np_draw) still holds must land first
+    if hasattr(draw, "flush"):
+        draw.flush()
+
+    anchor_x = x * scale + origin_x
+    anchor_y = y * scale + origin_y
+    col, row = math.floor(anchor_x), math.floor(anchor_y)
+    phase = (round(anchor_x - col, 6), round(anchor_y - row, 6))
+
+    ops = flatten(part, 0, 0, flip)
+    colours = tuple(resolve_colour(op[2], palette) for op in ops)
+    tile, mask, left, top = cache.get(
+        (part, flip, colours, scale, phase),
+        lambda: rasterize(ops, colours, scale, phase))
+    image.paste(tile, (col + left, row + top), mask)
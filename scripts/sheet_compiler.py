@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+Incremental sprite sheet compiler.
+
+Sheets are compiled one animation row at a time. Every rendered row is cached
+on disk under a key built from the row spec and a hash of the drawing code
+that row actually ran, so a rebuild only re-renders the rows whose spec or
+drawing code changed and patches them into the existing sheet buffer before
+re-encoding it.
+
+The code hash is per row: while a row renders, the statement blocks it
+executes in the generator's own file are recorded. Editing the drumstick
+branch of draw_charlie therefore invalidates only the drumstick rows, while
+editing a line every row runs (or a palette constant every row reads)
+invalidates them all. Other files of the repo the row calls into (pose_rig,
+shape_program, scaled_draw...) are recorded whole, so any edit to one of
+them invalidates every row that used it.
+
+Usage from a generator:
+
+    from sheet_compiler import compile_sheet
+
+    def draw_row(image, spec):
+        for col in range(4):
+            draw_charlie(image, col * 32, 0, *spec, col)
+
+    compile_sheet("charlie_spritesheet.png", ROWS, draw_row, 32, 4)
+
+draw_row must be a named function. Code outside the repo (PIL, NumPy) is
+not tracked.
+
+A row can be declared the mirror of another (e.g. right = flipped left). It
+is built by flipping every frame of the source row in one array operation,
+optionally with an overlay for details that must not flip, and rebuilt
+only when the source row (or the overlay) changes:
+
+    def mirror(spec):
+        action, direction = spec
+        return (action, "left") if direction == "right" else None
+
+    def hair_parting(image, spec):
+        ...  # drawn over the flipped row, e.g. a parting that stays on one side
+
+    compile_sheet(path, ROWS, draw_row, 32, 4, mirror=mirror, overlay=hair_parting)
+
+post(sheet) post-processes the whole compiled sheet before it is written,
+e.g. outlines from sprite_effects.py. The unprocessed sheet is kept in the
+cache directory, so rows are still patched into plain pixels and post runs
+on every frame of the sheet at once:
+
+    compile_sheet(path, ROWS, draw_row, 32, 4,
+                  post=lambda sheet: apply_effects(sheet, 32, outline=OUTLINE))
+"""
+
+from PIL import Image
+import ast
+import copy
+import hashlib
+import inspect
+import json
+import os
+import sys
+import textwrap
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Rendered rows, per-row traces and per-sheet manifests live here (relative to
+# the repo root, like the generators' OUTPUT_DIRs).
+CACHE_DIR = ".sheet_cache"
+
+# Bump when the cache layout changes so stale rows are never reused.
+CACHE_VERSION = 2
+
+# Global values folded into the code hash when an executed statement reads
+# them (palette constants, sizes, lookup tables).
+_PLAIN_TYPES = (int, float, str, bytes, bool, tuple, list, dict, frozenset, type(None))
+
+_BLOCK_FIELDS = ("body", "orelse", "finalbody")
+_SCOPE_NODES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda)
+
+
+class _CodeIndex:
+    """Statement blocks of one function, keyed by their path in the AST."""
+
+    def __init__(self, code):
+        lines, first_line = inspect.getsourcelines(code)
+        func = ast.parse(textwrap.dedent("".join(lines))).body[0]
+        self.offset = first_line - 1
+        self.blocks = {}
+        self.line_block = {}
+        self._walk(func.body, ("body",))
+
+    def _walk(self, stmts, path):
+        self.blocks[path] = stmts
+        for i, stmt in enumerate(stmts):
+            for line in range(stmt.lineno, stmt.end_lineno + 1):
+                self.line_block[line + self.offset] = path
+            if isinstance(stmt, _SCOPE_NODES):
+                continue  # nested functions are separate code objects
+            for field in _BLOCK_FIELDS:
+                children = getattr(stmt, field, None)
+                if children:
+                    self._walk(children, path + (i, field))
+            for j, handler in enumerate(getattr(stmt, "handlers", ())):
+                self._walk(handler.body, path + (i, "handlers", j))
+
+    def block_digest(self, path, func_globals):
+        """Hash one block: its statements without their nested bodies, plus
+        the current values of the globals those statements read."""
+        stmts = self.blocks.get(path)
+        if stmts is None:
+            return None
+        parts = [repr(path)]
+        for stmt in stmts:
+            shallow = copy.copy(stmt)
+            for field in _BLOCK_FIELDS + ("handlers",):
+                if hasattr(shallow, field):
+                    setattr(shallow, field, [])
+            parts.append(ast.dump(shallow))
+            for node in ast.walk(shallow):
+                if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
+                    value = func_globals.get(node.id)
+                    if isinstance(value, _PLAIN_TYPES):
+                        parts.append(f"{node.id}={value!r}")
+        return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+_indexes = {}
+
+
+def _code_index(code):
+    if code not in _indexes:
+        try:
+            _indexes[code] = _CodeIndex(code)
+        except (OSError, TypeError, SyntaxError, IndexError):
+            _indexes[code] = None
+    return _indexes[code]
+
+
+def _resolve_code(qualname, func_globals):
+    """Find the current code object for a (possibly nested) function name."""
+    parts = [p for p in qualname.split(".") if p != "<locals>"]
+    obj = func_globals.get(parts[0])
+    code = getattr(obj, "__code__", None)
+    for name in parts[1:]:
+        if code is None:
+            return None
+        code = next((c for c in code.co_consts
+                     if inspect.iscode(c) and c.co_name == name), None)
+    return code
+
+
+def _project_file(filename):
+    path = os.path.abspath(filename)
+    return path.startswith(REPO_ROOT + os.sep) and "site-packages" not in path
+
+
+def _file_digest(path):
+    try:
+        with open(os.path.join(REPO_ROOT, path), "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def trace_digest(trace, func_globals):
+    """Hash the recorded blocks and files against the current source, or None
+    if any of them no longer exists (the row must then be re-rendered)."""
+    digest = hashlib.sha256()
+    for qualname, path in trace["blocks"]:
+        code = _resolve_code(qualname, func_globals)
+        index = _code_index(code) if code is not None else None
+        block = index.block_digest(tuple(path), func_globals) if index else None
+        if block is None:
+            return None
+        digest.update(f"{qualname}:{block};".encode())
+    for path in trace["files"]:
+        source = _file_digest(path)
+        if source is None:
+            return None
+        digest.update(f"{path}:{source};".encode())
+    return digest.hexdigest()
+
+
+def render_row(draw_row, spec, row_size, base=None):
+    """Render a single row into its own buffer (transparent, or a copy of base)."""
+    row = base.copy() if base is not None else Image.new('RGBA', row_size, (0, 0, 0, 0))
+    draw_row(row, spec)
+    return row
+
+
+def mirror_frames(row, frame_width):
+    """Flip every frame of a row horizontally in place of the row, in one pass.
+
+    Frames are drawn around their centre column (x = 16 in a 32px frame),
+    so that is the mirror axis: column x goes to frame_width - x, and the
+    first column of an even-width frame, which has no partner, stays put.
+    """
+    pixels = np.asarray(row.convert('RGBA'))
+    height, width = pixels.shape[:2]
+    frames = pixels.reshape(height, width // frame_width, frame_width, 4)
+    flipped = np.roll(frames[:, :, ::-1], 1 - frame_width % 2, axis=2)
+    return Image.fromarray(np.ascontiguousarray(flipped).reshape(height, width, 4), 'RGBA')
+
+
+def render_row_traced(draw_row, spec, row_size, base=None):
+    """Render a row while recording which statement blocks of draw_row's
+    file and which other repo files it executed. Returns (row image,
+    {"blocks": sorted (qualname, path) list, "files": sorted relative paths})."""
+    filename = draw_row.__code__.co_filename
+    executed = set()
+    files = set()
+
+    def trace_lines(frame, event, arg):
+        if event == "line":
+            executed.add((frame.f_code, frame.f_lineno))
+        return trace_lines
+
+    def trace_calls(frame, event, arg):
+        code = frame.f_code
+        if code.co_filename != filename:
+            if _project_file(code.co_filename):
+                files.add(code.co_filename)
+            return None
+        # Comprehensions and lambdas are covered by the statement that holds them.
+        if code.co_name.startswith("<"):
+            return None
+        return trace_lines
+
+    previous = sys.gettrace()
+    sys.settrace(trace_calls)
+    try:
+        row = render_row(draw_row, spec, row_size, base)
+    finally:
+        sys.settrace(previous)
+
+    trace = set()
+    for code, line in executed:
+        index = _code_index(code)
+        path = index.line_block.get(line) if index else None
+        if path is not None:
+            trace.add((getattr(code, "co_qualname", code.co_name), path))
+    files = sorted(os.path.relpath(os.path.abspath(f), REPO_ROOT) for f in files)
+    return row, {"blocks": sorted(trace), "files": files}
+
+
+def _digest(*parts):
+    return hashlib.sha256("|".join(map(str, parts)).encode()).hexdigest()[:32]
+
+
+def _load_json(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_json(path, data):
+    with open(path, "w") as f:
+        json.dump(data, f)
+
+
+def compile_sheet(output_path, rows, draw_row, frame_size, columns, cache_dir=CACHE_DIR,
+                  mirror=None, overlay=None, post=None):
+    """Compile a sheet of len(rows) x columns frames, re-rendering only what changed.
+
+    rows: list of row specs; each spec must have a stable repr().
+    draw_row(image, spec): draws one row into image, its top edge at y=0.
+    frame_size: int or (width, height) of a single frame.
+    mirror(spec): the spec of the (drawn) row this row mirrors, or None.
+    overlay(image, spec): optional, draws asymmetric details over a
+    mirrored row after the flip.
+    post(sheet): optional, returns the sheet image to write in its place.
+
+    Returns a dict with the sheet image and the row indices that were
+    "rendered", "restored" from the row cache or "kept" from the existing
+    sheet.
+    """
+    frame_w, frame_h = (frame_size, frame_size) if isinstance(frame_size, int) else frame_size
+    row_size = (frame_w * columns, frame_h)
+    sheet_size = (row_size[0], frame_h * len(rows))
+
+    sources = [None] * len(rows)
+    if mirror:
+        for index, spec in enumerate(rows):
+            source = mirror(spec)
+            if source is not None:
+                sources[index] = rows.index(source)
+        if any(sources[source] is not None for source in sources if source is not None):
+            raise ValueError("Mirrored rows must mirror a drawn row, not another mirror")
+
+    os.makedirs(cache_dir, exist_ok=True)
+    sheet_id = f"sheet_{_digest(os.path.abspath(output_path))[:16]}"
+    manifest_path = os.path.join(cache_dir, f"{sheet_id}.json")
+    manifest = _load_json(manifest_path)
+    # With post the written sheet is not the row buffer; keep that separately.
+    buffer_path = os.path.join(cache_dir, f"{sheet_id}.png") if post else output_path
+
+    # Start from the existing sheet when it is the one the manifest describes,
+    # so unchanged rows need no work at all.
+    sheet = None
+    previous = manifest.get("rows", [])
+    if os.path.exists(buffer_path) and manifest.get("size") == list(sheet_size):
+        with Image.open(buffer_path) as existing:
+            if existing.size == sheet_size:
+                sheet = existing.convert('RGBA')
+    if sheet is None:
+        sheet = Image.new('RGBA', sheet_size, (0, 0, 0, 0))
+        previous = []
+
+    stats = {"rendered": [], "restored": [], "kept": []}
+    keys = {}
+    # Drawn rows first, so mirrored rows can copy them out of the sheet.
+    for index in sorted(range(len(rows)), key=lambda i: sources[i] is not None):
+        spec, source = rows[index], sources[index]
+        if source is None:
+            painter, salt = draw_row, ()
+        else:
+            # A mirrored row changes when its source row or its overlay does.
+            painter, salt = overlay, ("mirror", keys[source])
+        func_globals = painter.__globals__ if painter else {}
+        painter_name = f"{painter.__module__}.{painter.__qualname__}" if painter else None
+
+        spec_key = _digest(CACHE_VERSION, painter_name, row_size, repr(spec), *salt)
+        trace_path = os.path.join(cache_dir, f"trace_{spec_key}.json")
+        if painter:
+            trace = _load_json(trace_path)
+            code_hash = trace_digest(trace, func_globals) if "files" in trace else None
+            key = _digest(spec_key, code_hash) if code_hash else None
+        else:
+            key = spec_key
+
+        if key and index < len(previous) and previous[index] == key:
+            stats["kept"].append(index)
+            keys[index] = key
+            continue
+
+        cached = os.path.join(cache_dir, f"row_{key}.png") if key else None
+        if cached and os.path.exists(cached):
+            with Image.open(cached) as row:
+                row = row.convert('RGBA')
+            stats["restored"].append(index)
+        else:
+            base = None
+            if source is not None:
+                top = source * frame_h
+                base = mirror_frames(sheet.crop((0, top, row_size[0], top + frame_h)), frame_w)
+            if painter:
+                row, trace = render_row_traced(painter, spec, row_size, base)
+                key = _digest(spec_key, trace_digest(trace, func_globals))
+                _save_json(trace_path, {"spec": repr(spec), **trace})
+            else:
+                row = base
+            row.save(os.path.join(cache_dir, f"row_{key}.png"))
+            stats["rendered"].append(index)
+
+        sheet.paste(row, (0, index * frame_h))
+        keys[index] = key
+
+    changed = stats["rendered"] or stats["restored"] or not os.path.exists(buffer_path)
+    if post:
+        if changed:
+            sheet.save(buffer_path)
+        # Cheap next to drawing, and the effect's own settings aren't tracked.
+        sheet = post(sheet)
+    if changed or post:
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        sheet.save(output_path)
+    _save_json(manifest_path, {"size": list(sheet_size), "rows": [keys[i] for i in range(len(rows))]})
+
+    stats["sheet"] = sheet
+    return stats
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Texture memory budget report for Charlie's Island Adventure.
+
+Walks every scene's dependencies (ext_resource entries of .tscn/.tres files,
+res:// paths loaded by attached or preloaded scripts, and autoloads from
+project.godot), resolves them to PNGs and reads the image sizes straight from
+the PNG headers without decoding any pixels. Reports per-scene and total
+uncompressed VRAM, the largest textures and assets nothing references.
+
+Exits with status 1 when a scene exceeds its budget, so CI can run:
+
+    python scripts/texture_budget.py --budget-kb 2048
+"""
+
+import argparse
+import os
+import re
+import struct
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENE_GLOB_DIRS = ["scenes"]
+ASSET_DIRS = ["assets"]
+
+# Budgets in KiB of uncompressed texture memory. Scenes not listed here use
+# DEFAULT_SCENE_BUDGET_KB (or --budget-kb).
+DEFAULT_SCENE_BUDGET_KB = 2048
+SCENE_BUDGETS_KB = {
+    "scenes/MainMenu.tscn": 512,
+}
+
+EXT_RESOURCE_RE = re.compile(r'^\[ext_resource ([^\]]*)\]', re.MULTILINE)
+ATTRIBUTE_RE = re.compile(r'(\w+)="([^"]*)"')
+SCRIPT_PATH_RE = re.compile(r'"(res://[^"]+\.(?:png|tres|res|gd))"')
+AUTOLOAD_RE = re.compile(r'^\w+="\*?(res://[^"]+)"', re.MULTILINE)
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Bytes per pixel once uploaded, by PNG colour type.
+# Indexed images expand to RGB8, or RGBA8 when they carry a tRNS chunk.
+PNG_CHANNELS = {0: 1, 2: 3, 3: 3, 4: 2, 6: 4}
+
+
+def res_to_path(res_path, root=PROJECT_ROOT):
+    return os.path.join(root, res_path[len("res://"):])
+
+
+def rel(path, root=PROJECT_ROOT):
+    return os.path.relpath(path, root)
+
+
+def read_dependencies(path, root=PROJECT_ROOT):
+    """Return the resource files a scene, resource or script pulls in."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            text = f.read()
+    except OSError:
+        return []
+
+    if path.endswith(".gd"):
+        # Scene changes (change_scene_to_file) are not resident together with
+        # the current scene, so scripts only contribute textures, resources
+        # and other scripts.
+        return [res_to_path(p, root) for p in SCRIPT_PATH_RE.findall(text)]
+
+    deps = []
+    for attributes in EXT_RESOURCE_RE.findall(text):
+        attrs = dict(ATTRIBUTE_RE.findall(attributes))
+        if attrs.get("path", "").startswith("res://"):
+            deps.append(res_to_path(attrs["path"], root))
+    return deps
+
+
+def png_info(path):
+    """Read (width, height, bytes per pixel) from the PNG header chunks."""
+    with open(path, "rb") as f:
+        if f.read(8) != PNG_SIGNATURE:
+            return None
+        length, kind = struct.unpack(">I4s", f.read(8))
+        if kind != b"IHDR":
+            return None
+        width, height, bit_depth, color_type = struct.unpack(">IIBB", f.read(10))
+        channels = PNG_CHANNELS.get(color_type, 4)
+        if color_type == 3:
+            # Skip to the chunks before IDAT to see whether there is a tRNS.
+            f.seek(8 + 8 + length + 4)
+            while True:
+                header = f.read(8)
+                if len(header) < 8:
+                    break
+                length, kind = struct.unpack(">I4s", header)
+                if kind == b"tRNS":
+                    channels = 4
+                    break
+                if kind == b"IDAT":
+                    break
+                f.seek(length + 4, os.SEEK_CUR)
+    return width, height, channels
+
+
+def has_mipmaps(path):
+    """Whether the texture's .import settings generate mipmaps."""
+    try:
+        with open(path + ".import", encoding="utf-8") as f:
+            return "mipmaps/generate=true" in f.read()
+    except OSError:
+        return False
+
+
+def texture_bytes(path):
+    info = png_info(path)
+    if info is None:
+        return 0
+    width, height, channels = info
+    size = width * height * channels
+    if has_mipmaps(path):
+        size = size * 4 // 3
+    return size
+
+
+class DependencyGraph:
+    """Memoized walk from scenes to the PNG files they keep resident."""
+
+    def __init__(self, root=PROJECT_ROOT):
+        self.root = root
+        self._deps = {}
+
+    def deps(self, path):
+        if path not in self._deps:
+            self._deps[path] = read_dependencies(path, self.root)
+        return self._deps[path]
+
+    def textures(self, start_paths):
+        seen = set()
+        textures = set()
+        stack = list(start_paths)
+        while stack:
+            path = stack.pop()
+            if path in seen:
+                continue
+            seen.add(path)
+            if path.endswith(".png"):
+                if os.path.exists(path):
+                    textures.add(path)
+                continue
+            stack.extend(self.deps(path))
+        return textures
+
+
+def find_files(root, dirs, extension):
+    found = []
+    for d in dirs:
+        for dirpath, dirnames, filenames in os.walk(os.path.join(root, d)):
+            dirnames[:] = sorted(n for n in dirnames if not n.startswith("."))
+            found += [os.path.join(dirpath, n) for n in sorted(filenames) if n.endswith(extension)]
+    return found
+
+
+def autoload_scripts(root):
+    try:
+        with open(os.path.join(root, "project.godot"), encoding="utf-8") as f:
+            text = f.read()
+    except OSError:
+        return []
+    section = text.split("[autoload]", 1)[1].split("\n[", 1)[0] if "[autoload]" in text else ""
+    return [res_to_path(p, root) for p in AUTOLOAD_RE.findall(section)]
+
+
+def build_report(root=PROJECT_ROOT, default_budget_kb=DEFAULT_SCENE_BUDGET_KB):
+    graph = DependencyGraph(root)
+    scenes = find_files(root, SCENE_GLOB_DIRS, ".tscn")
+    autoloads = autoload_scripts(root)
+    resident = graph.textures(autoloads)
+
+    sizes = {}
+    scene_rows = []
+    for scene in scenes:
+        textures = graph.textures([scene]) | resident
+        for tex in textures:
+            if tex not in sizes:
+                sizes[tex] = texture_bytes(tex)
+        total = sum(sizes[t] for t in textures)
+        budget = SCENE_BUDGETS_KB.get(rel(scene, root), default_budget_kb) * 1024
+        scene_rows.append((rel(scene, root), len(textures), total, budget))
+
+    # Scripts that are not attached to a scene may still load assets at runtime.
+    all_scripts = find_files(root, ["scripts"], ".gd")
+    referenced = set(sizes) | graph.textures(all_scripts)
+    assets = find_files(root, ASSET_DIRS, ".png")
+    unused = [a for a in assets if a not in referenced]
+
+    return {
+        "scenes": scene_rows,
+        "textures": sizes,
+        "unused": unused,
+    }
+
+
+def kib(n):
+    return f"{n / 1024:8.1f} KiB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report per-scene texture memory.")
+    parser.add_argument("--budget-kb", type=int, default=DEFAULT_SCENE_BUDGET_KB,
+                        help=f"default per-scene budget in KiB (default {DEFAULT_SCENE_BUDGET_KB})")
+    parser.add_argument("--top", type=int, default=5, help="number of largest textures to list")
+    parser.add_argument("--root", default=PROJECT_ROOT, help="Godot project root")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    report = build_report(os.path.abspath(args.root), args.budget_kb)
+    elapsed = time.perf_counter() - start
+
+    failures = []
+    print(f"{'Scene':<40} {'Textures':>8} {'VRAM':>12} {'Budget':>12}")
+    for scene, count, total, budget in report["scenes"]:
+        status = "OK" if total <= budget else "OVER"
+        if total > budget:
+            failures.append(scene)
+        print(f"{scene:<40} {count:>8} {kib(total):>12} {kib(budget):>12}  {status}")
+
+    textures = report["textures"]
+    print(f"\nTotal unique texture memory: {kib(sum(textures.values())).strip()} "
+          f"across {len(textures)} textures")
+
+    print("\nLargest textures:")
+    for path, size in sorted(textures.items(), key=lambda t: -t[1])[:args.top]:
+        print(f"  {kib(size)}  {rel(path, args.root)}")
+
+    print(f"\nUnused assets ({len(report['unused'])}):")
+    for path in report["unused"]:
+        print(f"  {rel(path, args.root)}")
+
+    print(f"\nScanned in {elapsed * 1000:.1f} ms")
+
+    if failures:
+        print(f"\nFAIL: over budget: {', '.join(failures)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
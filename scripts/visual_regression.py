@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Golden-image regression check for generated assets.
+
+Snapshot the current assets before refactoring a generator, regenerate, then
+compare:
+
+    python scripts/visual_regression.py --update    # store goldens
+    python generate_pixel_charlie.py                # regenerate
+    python scripts/visual_regression.py             # compare
+
+Every PNG is compared against its golden copy with an exact diff, a
+per-channel tolerance and SSIM, all on NumPy arrays. An image passes when it
+is identical, when no channel differs by more than --tolerance, or when its
+SSIM is at least --min-ssim. Failures get a heatmap (golden | new | diff)
+under DIFF_DIR and make the script exit with status 1. A golden whose asset
+no longer exists fails too; --update removes it.
+
+The goldens are committed, so a fresh clone compares against the assets as
+they were last accepted.
+"""
+
+from PIL import Image
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import os
+import shutil
+import sys
+
+import numpy as np
+
+from optimize_pngs import iter_pngs, load_rgba
+
+DEFAULT_ROOTS = ["assets"]
+
+# Hidden directories so Godot does not import them. GOLDEN_DIR is committed.
+GOLDEN_DIR = ".golden"
+DIFF_DIR = ".golden_diffs"
+
+# SSIM window size and the usual stabilising constants for 8-bit data.
+SSIM_WINDOW = 7
+SSIM_C1 = (0.01 * 255) ** 2
+SSIM_C2 = (0.03 * 255) ** 2
+
+
+def golden_path(path):
+    return os.path.join(GOLDEN_DIR, os.path.relpath(path))
+
+
+def box_mean(values, size):
+    """Mean over every size x size window via an integral image.
+
+    values: (H, W, C) float64. Returns (H - size + 1, W - size + 1, C).
+    """
+    integral = np.zeros((values.shape[0] + 1, values.shape[1] + 1, values.shape[2]))
+    integral[1:, 1:] = values.cumsum(0).cumsum(1)
+    total = (integral[size:, size:] - integral[:-size, size:]
+             - integral[size:, :-size] + integral[:-size, :-size])
+    return total / (size * size)
+
+
+def ssim(a, b, window=SSIM_WINDOW):
+    """Mean SSIM over all channels of two (H, W, C) uint8 arrays."""
+    window = min(window, a.shape[0], a.shape[1])
+    x = a.astype(np.float64)
+    y = b.astype(np.float64)
+    mu_x = box_mean(x, window)
+    mu_y = box_mean(y, window)
+    var_x = box_mean(x * x, window) - mu_x * mu_x
+    var_y = box_mean(y * y, window) - mu_y * mu_y
+    cov = box_mean(x * y, window) - mu_x * mu_y
+    score = (((2 * mu_x * mu_y + SSIM_C1) * (2 * cov + SSIM_C2))
+             / ((mu_x * mu_x + mu_y * mu_y + SSIM_C1) * (var_x + var_y + SSIM_C2)))
+    return float(score.mean())
+
+
+def heatmap(golden, new):
+    """Side-by-side golden | new | diff image; diff pixels are red on grey."""
+    diff = np.abs(golden.astype(np.int16) - new.astype(np.int16)).max(axis=2)
+    grey = golden[..., :3].mean(axis=2) * (golden[..., 3] / 255.0) * 0.4
+    heat = np.empty(golden.shape[:2] + (4,), dtype=np.uint8)
+    heat[..., 0] = np.where(diff > 0, 128 + diff // 2, grey)
+    heat[..., 1] = np.where(diff > 0, 0, grey)
+    heat[..., 2] = np.where(diff > 0, 0, grey)
+    heat[..., 3] = 255
+    return np.hstack([golden, new, heat])
+
+
+def compare(path, tolerance=0, min_ssim=1.0, diff_dir=DIFF_DIR):
+    """Compare one asset with its golden. Returns (path, status, details)."""
+    reference = golden_path(path)
+    if not os.path.exists(reference):
+        return path, "new", "no golden"
+
+    golden = load_rgba(reference)
+    new = load_rgba(path)
+    if golden.shape != new.shape:
+        return path, "fail", f"size {golden.shape[1]}x{golden.shape[0]} -> {new.shape[1]}x{new.shape[0]}"
+
+    diff = np.abs(golden.astype(np.int16) - new.astype(np.int16))
+    changed = int(diff.any(axis=2).sum())
+    if changed == 0:
+        return path, "same", ""
+
+    max_diff = int(diff.max())
+    score = ssim(golden, new)
+    details = f"{changed} px changed, max channel diff {max_diff}, SSIM {score:.4f}"
+    if max_diff <= tolerance or score >= min_ssim:
+        return path, "ok", details
+
+    out = os.path.join(diff_dir, os.path.relpath(path))
+    os.makedirs(os.path.dirname(out), exist_ok=True)
+    Image.fromarray(heatmap(golden, new)).save(out)
+    return path, "fail", f"{details} (heatmap: {out})"
+
+
+def _compare_task(args):
+    return compare(*args)
+
+
+def orphaned_goldens(paths):
+    """Assets under paths that have a golden but no longer exist."""
+    assets = (os.path.relpath(reference, GOLDEN_DIR) for reference in iter_pngs(map(golden_path, paths)))
+    return [path for path in assets if not os.path.exists(path)]
+
+
+def update_goldens(files, orphans=()):
+    for path in files:
+        reference = golden_path(path)
+        os.makedirs(os.path.dirname(reference), exist_ok=True)
+        shutil.copyfile(path, reference)
+    for path in orphans:
+        os.remove(golden_path(path))
+    print(f"Stored {len(files)} goldens in {GOLDEN_DIR}/" + (f", removed {len(orphans)}" if orphans else ""))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare generated assets against golden images.")
+    parser.add_argument("paths", nargs="*", default=DEFAULT_ROOTS,
+                        help="PNG files or directories (default: assets)")
+    parser.add_argument("--update", action="store_true", help="store the current assets as goldens")
+    parser.add_argument("--tolerance", type=int, default=0,
+                        help="largest per-channel difference that still passes (default 0)")
+    parser.add_argument("--min-ssim", type=float, default=1.0,
+                        help="SSIM at or above which a changed image still passes (default 1.0)")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    files = list(iter_pngs(args.paths))
+    orphans = orphaned_goldens(args.paths)
+    if args.update:
+        update_goldens(files, orphans)
+        return
+
+    if os.path.isdir(DIFF_DIR):
+        shutil.rmtree(DIFF_DIR)
+    tasks = [(path, args.tolerance, args.min_ssim) for path in files]
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        results = list(pool.map(_compare_task, tasks))
+    results += [(path, "fail", "asset deleted, golden still stored") for path in orphans]
+
+    counts = {}
+    for path, status, details in results:
+        counts[status] = counts.get(status, 0) + 1
+        if status != "same":
+            print(f"  {status.upper():4} {path}" + (f": {details}" if details else ""))
+
+    print(f"\n{len(results)} assets: " + ", ".join(f"{n} {s}" for s, n in sorted(counts.items())))
+    if counts.get("fail"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()